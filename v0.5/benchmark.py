@@ -0,0 +1,307 @@
+"""
+Per-level frame-time benchmark
+Run from the project folder:
+
+    python benchmark.py                          # all levels -> benchmark.json
+    python benchmark.py --levels 5 --frames 3000 --out after.json
+    python benchmark.py --replay-dir replays     # use level_<n>.replay files
+    python benchmark.py --compare before.json after.json
+
+Each level is played headless by a scripted bot (or a recorded replay) and
+update and draw are timed separately every frame. Compare mode exits with
+status 1 when any level got slower than the threshold allows.
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.game import Game
+from core.input import ScriptedInput
+from core.replay import Replay
+from utils.enums import GameState
+
+PERCENTILES = (50, 95, 99)
+DEFAULT_THRESHOLD = 0.10  # 10% slower counts as a regression
+NOISE_FLOOR_MS = 0.05  # Ignore differences smaller than this
+REPLAY_FILE_PATTERN = re.compile(r"level_(\d+)\.replay")
+
+
+def bot_script(frame):
+    """
+    Default scripted path: run right shooting, jump every 40 frames and
+    swing the melee attack every 90 frames
+    """
+    keys = {pygame.K_RIGHT, pygame.K_z}
+    if frame % 40 < 3:
+        keys.add(pygame.K_SPACE)
+    if frame % 90 < 2:
+        keys.add(pygame.K_x)
+    return keys
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples_ms):
+    """Get percentile and mean stats for a list of frame times"""
+    ordered = sorted(samples_ms)
+    stats = {f"p{pct}": round(percentile(ordered, pct), 4) for pct in PERCENTILES}
+    stats["mean"] = round(sum(ordered) / len(ordered), 4) if ordered else 0.0
+    stats["max"] = round(ordered[-1], 4) if ordered else 0.0
+    return stats
+
+
+def count_entities(game):
+    """Snapshot of how much the current level holds"""
+    level = game.level
+    return {
+        "tiles": len(level.tiles),
+        "enemies": len(level.enemies),
+        "coins": sum(1 for coin in level.coins if not coin.collected),
+        "powerups": sum(1 for powerup in level.powerups if not powerup.collected),
+        "hazards": len(level.hazards),
+        "projectiles": len(game.projectiles),
+        "particles": len(game.particles),
+    }
+
+
+def benchmark_level(game, level_index, frames, warmup, seed, replay=None):
+    """
+    Play one level and time every frame
+    Args:
+        game: Headless Game instance
+        level_index: Level to play
+        frames: Frames to time (after warmup)
+        warmup: Untimed frames played first
+        seed: RNG seed for the run
+        replay: Optional Replay to drive the player instead of the bot
+    Returns:
+        Result dict for the level
+    """
+    if replay:
+        game.play_replay(replay)
+    else:
+        game.input = ScriptedInput(bot_script)
+        game.start_run(level_index, seed=seed)
+
+    # The bot should keep playing, not end on a game over screen
+    game.player.lives = 99
+
+    level_name, _ = game._get_level_and_area_names()
+    start_counts = count_entities(game)
+    peak_counts = dict(start_counts)
+    update_ms = []
+    draw_ms = []
+    played = 0
+
+    for frame in range(warmup + frames):
+        t0 = time.perf_counter()
+        game.step()
+        t1 = time.perf_counter()
+        game._draw()
+        t2 = time.perf_counter()
+
+        # Stop once the level is left (portal) or play stops
+        if game.current_level_index != level_index or game.state != GameState.PLAYING:
+            break
+
+        if frame >= warmup:
+            update_ms.append((t1 - t0) * 1000)
+            draw_ms.append((t2 - t1) * 1000)
+            played += 1
+            for name, count in count_entities(game).items():
+                peak_counts[name] = max(peak_counts[name], count)
+
+    return {
+        "name": level_name,
+        "frames": played,
+        "source": "replay" if replay else "bot",
+        "update_ms": summarize(update_ms),
+        "draw_ms": summarize(draw_ms),
+        "entities_start": start_counts,
+        "entities_peak": peak_counts,
+        "player_end": [round(game.player.x, 2), round(game.player.y, 2)],
+    }
+
+
+def load_replays(replay_dir):
+    """
+    Load every level_<n>.replay file in a folder
+    Args:
+        replay_dir: Folder to scan
+    Returns:
+        Dict of level index -> Replay
+    Raises:
+        ValueError: If a file can't be read or records a different level
+            than its name says
+    """
+    replays = {}
+    for name in sorted(os.listdir(replay_dir)):
+        match = REPLAY_FILE_PATTERN.fullmatch(name)
+        if not match:
+            continue
+
+        path = os.path.join(replay_dir, name)
+        try:
+            replay = Replay.load(path)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from e
+
+        level_index = int(match.group(1))
+        if replay.level != level_index:
+            raise ValueError(
+                f"{path} records a run of level {replay.level}, not level {level_index}; "
+                f"rename it to level_{replay.level}.replay"
+            )
+        replays[level_index] = replay
+    return replays
+
+
+def run_benchmarks(levels, frames, warmup, seed, replays=None):
+    """
+    Benchmark each level and return the full result document
+    Args:
+        levels: Level indexes, or None for every level
+        frames, warmup, seed: See benchmark_level
+        replays: Optional dict of level index -> Replay (see load_replays);
+            other levels are played by the bot
+    """
+    replays = replays or {}
+    results = {}
+    with Game(headless=True, seed=seed) as game:
+        if levels is None:
+            levels = list(range(len(game.level_manager)))
+
+        for level_index in levels:
+            replay = replays.get(level_index)
+            result = benchmark_level(game, level_index, frames, warmup, seed, replay)
+            results[str(level_index)] = result
+            print(
+                f"Level {level_index} ({result['name']}): {result['frames']} frames  "
+                f"update p50 {result['update_ms']['p50']:.2f} / p99 {result['update_ms']['p99']:.2f} ms  "
+                f"draw p50 {result['draw_ms']['p50']:.2f} / p99 {result['draw_ms']['p99']:.2f} ms"
+            )
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "frames": frames,
+            "warmup": warmup,
+            "seed": seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+        },
+        "levels": results,
+    }
+
+
+def compare_results(old, new, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare two result documents
+    Args:
+        old, new: Result dicts from run_benchmarks
+        threshold: Allowed relative slowdown (0.10 = 10%). A stat that was
+            zero before regresses as soon as it takes any time
+    Returns:
+        List of regression description strings (empty if none)
+    """
+    regressions = []
+
+    for level_key, new_level in new["levels"].items():
+        old_level = old["levels"].get(level_key)
+        if not old_level:
+            print(f"Level {level_key}: no baseline, skipped")
+            continue
+
+        for phase in ("update_ms", "draw_ms"):
+            for stat in [f"p{pct}" for pct in PERCENTILES]:
+                before = old_level[phase][stat]
+                after = new_level[phase][stat]
+                if before:
+                    change = (after - before) / before
+                    regressed = after - before > NOISE_FLOOR_MS and change > threshold
+                    change_text = f"{change:+.1%}"
+                else:
+                    # No baseline time to scale against, so any time at all
+                    # is a regression
+                    regressed = after > 0
+                    change_text = "new" if regressed else f"{0:+.1%}"
+
+                flag = ""
+                if regressed:
+                    flag = "  REGRESSION"
+                    regressions.append(
+                        f"Level {level_key} {phase} {stat}: {before:.3f} -> {after:.3f} ms ({change_text})"
+                    )
+                print(
+                    f"Level {level_key:>2} {phase:<9} {stat:<3} "
+                    f"{before:8.3f} -> {after:8.3f} ms  {change_text:>7}{flag}"
+                )
+
+    return regressions
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Per-level frame-time benchmark")
+    parser.add_argument("--levels", type=int, nargs="*", help="Level indexes (default: all)")
+    parser.add_argument("--frames", type=int, default=1800, help="Timed frames per level")
+    parser.add_argument("--warmup", type=int, default=60, help="Untimed frames first")
+    parser.add_argument("--seed", type=int, default=1, help="RNG seed")
+    parser.add_argument("--replay-dir", help="Folder with level_<n>.replay files")
+    parser.add_argument("--out", default="benchmark.json", help="Result JSON path")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Relative slowdown flagged as a regression (default 0.10)",
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            old = json.load(f)
+        with open(args.compare[1]) as f:
+            new = json.load(f)
+
+        regressions = compare_results(old, new, args.threshold)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\n✓ No regressions")
+        return
+
+    replays = None
+    if args.replay_dir:
+        try:
+            replays = load_replays(args.replay_dir)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+    results = run_benchmarks(args.levels, args.frames, args.warmup, args.seed, replays)
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✓ Results written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
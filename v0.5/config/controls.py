@@ -32,6 +32,7 @@ TOGGLE_CONTROLS = [pygame.K_F1]
 
 # Debug Controls
 DEBUG_TOGGLE = [pygame.K_F3]
+PROFILER_DUMP = [pygame.K_F4]
 
 
 def check_key_pressed(keys, key_list):
@@ -8,6 +8,12 @@ import json
 import os
 import pygame
 
+from config.settings import (DEFAULT_RENDER_SCALE, DEFAULT_SCALE_MODE,
+                             RENDER_SCALES, SCALE_MODE_INTEGER,
+                             SCALE_MODE_NEAREST, SCALE_MODE_SMOOTH,
+                             SCALE_MODES, SCREEN_HEIGHT, SCREEN_WIDTH)
+from utils.textures import TextureManager
+
 
 class GameSettings:
     """Manages all game settings"""
@@ -20,12 +26,21 @@ class GameSettings:
         (2560, 1440, 2.0, "2560x1440 (2K)"),
     ]
 
+    # Settings screen names of the scaling modes
+    SCALE_MODE_NAMES = {
+        SCALE_MODE_INTEGER: "Integer (sharpest)",
+        SCALE_MODE_NEAREST: "Fit",
+        SCALE_MODE_SMOOTH: "Fit (smooth)",
+    }
+
     # Default settings
     DEFAULTS = {
         "video": {
             "resolution_index": 0,  # 1280x720
             "fullscreen": False,
             "vsync": True,
+            "scale_mode": DEFAULT_SCALE_MODE,  # How the game is scaled to the window
+            "render_scale": DEFAULT_RENDER_SCALE,  # World resolution (1.0 = full 1280x720)
         },
         "audio": {
             "music_enabled": True,
@@ -62,8 +77,6 @@ class GameSettings:
         # Create display info
         self._update_display_info()
         self._resolution_changed = False
-        self.fullscreen_offset_x = 0
-        self.fullscreen_offset_y = 0
 
     def _detect_native_resolution(self):
         """Detect native screen resolution"""
@@ -223,6 +236,35 @@ class GameSettings:
         """Check if vsync is enabled"""
         return self.settings['video']['vsync']
 
+    def get_scale_mode(self):
+        """Get how the game is scaled to the window (one of SCALE_MODES)"""
+        mode = self.settings['video'].get('scale_mode', DEFAULT_SCALE_MODE)
+        return mode if mode in SCALE_MODES else DEFAULT_SCALE_MODE
+
+    def set_scale_mode(self, mode):
+        """Set how the game is scaled to the window"""
+        if mode in SCALE_MODES:
+            self.settings['video']['scale_mode'] = mode
+            return True
+        return False
+
+    def get_render_scale(self):
+        """Get the world render resolution as a fraction of the screen"""
+        scale = self.settings['video'].get('render_scale', DEFAULT_RENDER_SCALE)
+        return scale if scale in RENDER_SCALES else DEFAULT_RENDER_SCALE
+
+    def set_render_scale(self, scale):
+        """Set the world render resolution (one of RENDER_SCALES)"""
+        if scale in RENDER_SCALES:
+            self.settings['video']['render_scale'] = scale
+            return True
+        return False
+
+    def get_render_size(self):
+        """Get the (width, height) the world is drawn at before upscaling"""
+        scale = self.get_render_scale()
+        return (round(SCREEN_WIDTH * scale), round(SCREEN_HEIGHT * scale))
+
     # ========================================================================
     # AUDIO SETTINGS
     # ========================================================================
@@ -292,46 +334,16 @@ class GameSettings:
                 (native_width, native_height),
                 flags
             )
-
-            # Store centering offset for rendering (game always renders at 1280x720)
-            self.fullscreen_offset_x = (native_width - 1280) // 2
-            self.fullscreen_offset_y = (native_height - 720) // 2
-            self.render_to_temp = True  # Flag to use temp surface
         else:
-            # Windowed mode - use selected resolution
+            # Windowed mode - use selected resolution (the game's Presenter
+            # scales its 1280x720 frames to whatever size this ends up)
             new_screen = pygame.display.set_mode(
                 (self.width, self.height),
                 flags
             )
 
-            # Calculate scaling for windowed mode
-            if self.width != 1280 or self.height != 720:
-                # Need to scale game (1280x720 base) to window size
-                self.render_to_temp = True
-                self.fullscreen_offset_x = 0
-                self.fullscreen_offset_y = 0
-            else:
-                # Native resolution, no scaling needed
-                self.render_to_temp = False
-                self.fullscreen_offset_x = 0
-                self.fullscreen_offset_y = 0
-
         return new_screen
 
-    def should_use_temp_surface(self):
-        """Check if we should render to temp surface and scale"""
-        return self.render_to_temp
-
-    def get_scale_transform(self):
-        """Get scaling needed for current resolution"""
-        if self.width == 1280 and self.height == 720:
-            return None  # No scaling
-        return (self.width, self.height)  # Scale to this size
-
-    def get_render_offset(self):
-        """Get offset for centering game in fullscreen"""
-        return (self.fullscreen_offset_x, self.fullscreen_offset_y)
-
     def get_display_flags(self):
         """Get pygame display flags based on settings"""
         flags = pygame.DOUBLEBUF
@@ -355,6 +367,17 @@ class GameSettings:
         """Get list of available resolutions for display"""
         return [name for _, _, _, name in self.RESOLUTIONS]
 
+    def get_scale_mode_list(self):
+        """Get list of scaling mode names for display, in SCALE_MODES order"""
+        return [self.SCALE_MODE_NAMES[mode] for mode in SCALE_MODES]
+
+    def get_render_scale_list(self):
+        """Get list of render scales for display, in RENDER_SCALES order"""
+        return [
+            f"{round(scale * 100)}% ({round(SCREEN_WIDTH * scale)}x{round(SCREEN_HEIGHT * scale)})"
+            for scale in RENDER_SCALES
+        ]
+
     def __repr__(self):
         """String representation for debugging"""
         return f"GameSettings(res={self.resolution_name}, fullscreen={self.get_fullscreen()}, music={self.get_music_volume()}%, sfx={self.get_sfx_volume()}%)"
@@ -372,10 +395,12 @@ class GameSettings:
     def set_colorblind_mode(self, enabled):
         """Enable/disable colorblind mode"""
         self.settings["accessibility"]["colorblind_mode"] = enabled
+        TextureManager.clear_cache()
 
 
     def toggle_colorblind_mode(self):
         """Toggle colorblind mode on/off"""
         current = self.settings["accessibility"]["colorblind_mode"]
         self.settings["accessibility"]["colorblind_mode"] = not current
+        TextureManager.clear_cache()
         return self.settings["accessibility"]["colorblind_mode"]
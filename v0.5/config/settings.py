@@ -5,8 +5,16 @@ Game Settings and Constants
 # Screen Settings
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
-FPS = 60
+FPS = 60  # Fixed simulation rate; all physics constants assume this
+MAX_RENDER_FPS = 240  # Render frame cap (0 = uncapped)
+MAX_CATCHUP_STEPS = 5  # Max simulation steps per rendered frame
 TILE_SIZE = 32
+TILE_INDEX_CELL_SIZE = 64  # Spatial hash cell size for tile lookups
+MERGE_LEVEL_TILES = True  # Merge adjacent solid tiles into larger rects at load
+LEVEL_PREFETCH = True  # Build the levels a level's portals lead to on a worker thread
+BROADPHASE_CELL_SIZE = 128  # Grid cell size for entity-vs-entity broad-phase
+STATIC_CHUNK_SIZE = 512  # Tiles are pre-rendered into chunks this many pixels square
+STATIC_CHUNK_CACHE_SIZE = 24  # Rendered chunks kept per level (least recently drawn go first)
 
 
 def update_screen_size(width, height):
@@ -160,3 +168,47 @@ SCORE_KEY = 100
 SAVE_DIR = "data/saves"
 PROFILES_FILE = "data/profiles.json"
 LEVELS_DIR = "levels/data"
+COMPILED_LEVELS_PATH = "data/cache/act1_levels.bin"  # Rebuilt when the level sources change
+
+# Active Region Simulation
+# Entities further than this beyond the screen edges sleep until the camera nears
+ACTIVE_REGION_MARGIN = 640
+
+# Level streaming
+# Levels at least this wide keep only the chunks near the camera loaded
+LEVEL_STREAMING_MIN_WIDTH = 16384
+LEVEL_STREAM_CHUNK_WIDTH = 2048  # Width of one streamed strip of the level
+LEVEL_STREAM_MARGIN = 1024  # Chunks load this far beyond the active region and unload at twice it
+
+# Draw culling
+VISIBILITY_MARGIN = 64  # Pixels beyond the view still drawn (outlines, bobbing, interpolation)
+
+# Frame Profiler (F3 overlay, F4 dumps recent frames)
+PROFILER_ENABLED = True
+PROFILER_HISTORY_FRAMES = 3000  # Frames of timings kept
+PROFILER_DUMP_SECONDS = 10  # How far back an F4 dump reaches
+PROFILER_DUMP_DIR = "data/profiles"
+
+# Particles
+PARTICLE_CAPACITY = 4096  # Max live particles; extra emits are dropped
+PARTICLE_GRAVITY = 0.3
+
+# Projectiles
+PROJECTILE_CAPACITY = 256  # Max live player + turret shots; extra shots are dropped
+PROJECTILE_SIZE = (12, 6)
+PROJECTILE_LIFETIME = 180  # 3 seconds at 60 FPS
+BOSS_PROJECTILE_CAPACITY = 128
+BOSS_PROJECTILE_SIZE = (16, 16)
+BOSS_PROJECTILE_LIFETIME = 300  # 5 seconds
+
+# Text Rendering
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept (least recently used go first)
+
+# Presentation (scaling the 1280x720 render target to the window)
+SCALE_MODE_INTEGER = "integer"  # Largest whole-number nearest-neighbour scale, letterboxed
+SCALE_MODE_NEAREST = "scale"  # Nearest-neighbour fit to the window, letterboxed
+SCALE_MODE_SMOOTH = "smooth"  # Filtered (smoothscale) fit to the window, letterboxed
+SCALE_MODES = (SCALE_MODE_INTEGER, SCALE_MODE_NEAREST, SCALE_MODE_SMOOTH)
+DEFAULT_SCALE_MODE = SCALE_MODE_NEAREST
+RENDER_SCALES = (1.0, 2 / 3, 0.5)  # World render resolution as a fraction of the screen
+DEFAULT_RENDER_SCALE = 1.0
@@ -0,0 +1,12 @@
+"""
+Shared pytest setup - each test runs from its own empty temporary folder,
+so settings, saves and the compiled level cache never land in the project
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def temp_workdir(tmp_path, monkeypatch):
+    """Run the test from a temporary working directory"""
+    monkeypatch.chdir(tmp_path)
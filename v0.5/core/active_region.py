@@ -0,0 +1,141 @@
+"""
+Active region simulation - only entities near the camera are updated
+"""
+
+from config.settings import ACTIVE_REGION_MARGIN, BROADPHASE_CELL_SIZE
+from utils.collision import BroadPhase
+
+
+class ActiveRegion:
+    """
+    Tracks which level entities are inside an activation window around the
+    camera. Entities outside it sleep: they are not updated, and get a
+    wake(frames_asleep) call when they come back so each type can catch up
+    on whatever must keep running (turret timers, block respawns, ...)
+
+    A sleeping entity carries the last frame it was updated in its
+    sleep_frame attribute (None while awake or never tracked), so the
+    state goes away with the entity.
+    """
+
+    # Level lists that take part in sleeping
+    GROUPS = ("enemies", "hazards", "coins", "powerups")
+
+    def __init__(self, margin=ACTIVE_REGION_MARGIN):
+        """
+        Args:
+            margin: Pixels beyond each screen edge that stay awake
+        """
+        self.margin = margin
+        self.index = BroadPhase(BROADPHASE_CELL_SIZE)
+        self.awake = {group: [] for group in self.GROUPS}
+        self.bind_frame = 0
+
+    def bind(self, level, frame=0):
+        """
+        Index a freshly loaded level. Every entity starts asleep and is woken
+        by the first update that finds it inside the window
+        Args:
+            level: Level to track
+            frame: Current game frame
+        """
+        self.bind_frame = frame
+        for group in self.GROUPS:
+            entities = getattr(level, group)
+            self.index.set_group(
+                group, entities, lambda e: e.get_activity_rect(level.height)
+            )
+            self.awake[group] = []
+            for entity in entities:
+                entity.sleep_frame = frame
+
+    def reindex(self, level):
+        """
+        Index the level's lists again after entities joined or left them
+        (streamed levels). Sleep frames of entities still present are kept
+        Args:
+            level: Level being tracked
+        """
+        for group in self.GROUPS:
+            entities = getattr(level, group)
+            self.index.set_group(
+                group, entities, lambda e: e.get_activity_rect(level.height)
+            )
+            present = {id(entity) for entity in entities}
+            self.awake[group] = [e for e in self.awake[group] if id(e) in present]
+
+    def adopt(self, entities, last_frames=None):
+        """
+        Track entities that joined the level asleep
+        Args:
+            entities: Entities of one group
+            last_frames: Frame each was last updated (None: asleep since bind)
+        """
+        if last_frames is None:
+            for entity in entities:
+                entity.sleep_frame = self.bind_frame
+        else:
+            for entity, last_frame in zip(entities, last_frames):
+                entity.sleep_frame = last_frame
+
+    def release(self, entities, frame):
+        """
+        Stop tracking entities that leave the level
+        Args:
+            entities: Entities of one group
+            frame: Current game frame
+        Returns:
+            List of the frame each was last updated, for adopt()
+        """
+        last_frames = []
+        for entity in entities:
+            # Awake entities were updated last frame
+            last_frame = getattr(entity, "sleep_frame", None)
+            last_frames.append(frame - 1 if last_frame is None else last_frame)
+            entity.sleep_frame = None
+        return last_frames
+
+    def get_window(self, camera, focus=None):
+        """
+        Get the activation window: the camera view plus the margin,
+        stretched to cover the focus rect (see update())
+        """
+        window = camera.get_view_rect(self.margin)
+        if focus is not None:
+            window.union_ip(focus.inflate(self.margin * 2, self.margin * 2))
+        return window
+
+    def update(self, camera, frame, focus=None):
+        """
+        Recompute awake sets for this frame
+        Args:
+            camera: Camera the window follows
+            frame: Current game frame (for wake catch-up)
+            focus: Optional rect (usually the player) that is always kept
+                awake too, e.g. while the camera is still catching up
+        """
+        window = self.get_window(camera, focus)
+
+        for group in self.GROUPS:
+            previous = self.awake[group]
+            current = self.index.query(group, window)
+
+            # Entities leaving the window remember their last updated frame
+            current_ids = {id(entity) for entity in current}
+            for entity in previous:
+                if id(entity) not in current_ids:
+                    entity.sleep_frame = frame - 1
+
+            # Entities entering it catch up on the frames they missed
+            for entity in current:
+                last_frame = getattr(entity, "sleep_frame", None)
+                if last_frame is not None:
+                    entity.sleep_frame = None
+                    if frame - last_frame > 1:
+                        entity.wake(frame - last_frame - 1)
+
+            self.awake[group] = current
+
+    def get_awake(self, group):
+        """Get awake entities of a group, in level order"""
+        return self.awake[group]
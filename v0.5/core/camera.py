@@ -3,6 +3,7 @@ Camera system for smooth scrolling
 """
 
 from config.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from core.timestep import interpolate
 
 
 class Camera:
@@ -11,7 +12,14 @@ class Camera:
     def __init__(self):
         self.x = 0
         self.y = 0
+        self.prev_x = 0  # Position before the last step, for interpolation
+        self.prev_y = 0
+        self.target_x = 0  # Point followed in the last update (for render viewports)
+        self.target_y = 0
+        self.prev_target_x = 0
+        self.prev_target_y = 0
         self.smoothing = 0.1  # Lower = smoother but slower
+        self._sim_position = None
 
     def update(self, target_x, target_y, level_width, level_height):
         """
@@ -20,6 +28,9 @@ class Camera:
             target_x, target_y: Target position (usually player center)
             level_width, level_height: Level boundaries
         """
+        self.target_x = target_x
+        self.target_y = target_y
+
         # Calculate target camera position (center on target)
         target_camera_x = target_x - SCREEN_WIDTH // 2
         target_camera_y = target_y - SCREEN_HEIGHT // 2
@@ -32,6 +43,57 @@ class Camera:
         self.x = max(0, min(self.x, level_width - SCREEN_WIDTH))
         self.y = max(0, min(self.y, level_height - SCREEN_HEIGHT))
 
+    def save_position(self):
+        """Remember position before a simulation step (for render interpolation)"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.prev_target_x = self.target_x
+        self.prev_target_y = self.target_y
+
+    def begin_render(self, alpha, view_size=None):
+        """
+        Move to the interpolated position between the last two steps so
+        everything drawn against the camera is smoothed. Pair with end_render
+        Args:
+            alpha: Fraction of a step elapsed since the last update (0..1)
+            view_size: (width, height) actually drawn, when smaller than the
+                screen (lower render scale). The viewport slides inside the
+                full view so the followed target keeps its relative place on
+                screen, leaving the simulated view (and active region) alone
+        """
+        self._sim_position = (self.x, self.y)
+        self.x = interpolate(self.prev_x, self.x, alpha)
+        self.y = interpolate(self.prev_y, self.y, alpha)
+
+        if view_size and view_size != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            target_x = interpolate(self.prev_target_x, self.target_x, alpha)
+            target_y = interpolate(self.prev_target_y, self.target_y, alpha)
+            fraction_x = min(1, max(0, (target_x - self.x) / SCREEN_WIDTH))
+            fraction_y = min(1, max(0, (target_y - self.y) / SCREEN_HEIGHT))
+            self.x += (SCREEN_WIDTH - view_size[0]) * fraction_x
+            self.y += (SCREEN_HEIGHT - view_size[1]) * fraction_y
+
+    def end_render(self):
+        """Restore the simulated position after drawing"""
+        if self._sim_position:
+            self.x, self.y = self._sim_position
+            self._sim_position = None
+
+    def get_render_offset(self, entity, alpha):
+        """
+        Get camera coordinates that draw an entity at its interpolated
+        position, so entity draw methods need no changes
+        Args:
+            entity: Object with x, y, prev_x, prev_y
+            alpha: Fraction of a step elapsed since the last update (0..1)
+        Returns:
+            (camera_x, camera_y) to pass to entity.draw
+        """
+        return (
+            self.x + (entity.x - entity.prev_x) * (1 - alpha),
+            self.y + (entity.y - entity.prev_y) * (1 - alpha),
+        )
+
     def apply(self, x, y):
         """
         Apply camera offset to world coordinates
@@ -53,3 +115,20 @@ class Camera:
         import pygame
 
         return pygame.Rect(rect.x - self.x, rect.y - self.y, rect.width, rect.height)
+
+    def get_view_rect(self, margin=0):
+        """
+        Get the visible area in world coordinates
+        Args:
+            margin: Extra pixels to include beyond each screen edge
+        Returns:
+            pygame.Rect in world coordinates
+        """
+        import pygame
+
+        return pygame.Rect(
+            int(self.x) - margin,
+            int(self.y) - margin,
+            SCREEN_WIDTH + margin * 2,
+            SCREEN_HEIGHT + margin * 2,
+        )
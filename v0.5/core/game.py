@@ -5,80 +5,131 @@ Main game class - handles game loop and state management
 import math
 import os
 import random
+import time
 
 import pygame
 
 from config import controls
 from config.game_settings import GameSettings
 from config.settings import (
+    BOSS_PROJECTILE_CAPACITY,
+    BOSS_PROJECTILE_LIFETIME,
+    BOSS_PROJECTILE_SIZE,
+    BROADPHASE_CELL_SIZE,
     CYAN,
     FPS,
+    MAX_RENDER_FPS,
+    PROFILER_DUMP_DIR,
+    PROFILER_DUMP_SECONDS,
+    RENDER_SCALES,
     SCORE_COIN,
     SCORE_ENEMY_HIT,
     SCORE_ENEMY_KILL,
     SCORE_KEY,
     SCORE_MELEE_HIT,
     SCORE_POWERUP,
+    SCALE_MODES,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     WHITE,
     YELLOW,
     ORANGE
 )
+from core.active_region import ActiveRegion
 from core.camera import Camera
+from core.input import KeyboardInput
+from core.presenter import Presenter
+from core.replay import Replay, ReplayInput, ReplayRecorder
+from core.timestep import FixedTimestep, GameClock
+from core.visibility import Visibility
 from entities.boss import Boss
 from entities.boss_attacks import BossAttackEffect, BossAttackManager
-from entities.particle import Particle
+from entities.particle import ParticleSystem
 from entities.player import Player
-from entities.projectile import Projectile
-from levels.level import Level
-from levels.level_loader import LevelLoader
+from entities.projectile import ProjectilePool
+from levels.level_manager import LevelManager
 from save_system.difficulty_completion_tracker import DifficultyCompletionTracker
 from save_system.profile_manager import PlayerProfile, ProfileManager
 from save_system.save_manager import SaveManager
 from ui.hud import HUD
 from ui.menu import Menu
 from ui.components import Popup
+from ui.fonts import clear_fonts, get_font, text_cache
+from utils.collision import BroadPhase
+from utils.profiler import FrameProfiler, profiled
 from utils.enums import GameState, EnemyType
 
 
 class Game:
     """Main game class"""
 
-    def __init__(self):
-        """Initialize game"""
+    def __init__(self, headless=False, input_source=None, seed=None):
+        """
+        Initialize game
+        Args:
+            headless: Run without a real display or audio device and skip
+                drawing (bots, CI, benchmarks). Drive it with step()
+            input_source: Object with get_pressed() for gameplay keys,
+                e.g. core.input.ScriptedInput. Defaults to the keyboard
+            seed: Seed for the game's RNG (random if None)
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         pygame.init()
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.input = input_source or KeyboardInput()
+        self.window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Retro Pixel Platformer")
         self.clock = pygame.time.Clock()
+
+        # Simulation runs at a fixed FPS; rendering interpolates between steps
+        self.timestep = FixedTimestep()
+        self.render_alpha = 1.0
         self.running = True
+        self.closed = False  # Set once close() has released resources
 
         # Game settings
         self.settings = GameSettings()
 
+        # Everything draws into self.screen, the presenter's render target;
+        # the game world into self.world_screen (smaller at lower render scales)
+        self.presenter = Presenter(
+            scale_mode=self.settings.get_scale_mode(),
+            world_size=self.settings.get_render_size(),
+        )
+        self.screen = self.presenter.configure(self.window)
+        self.world_screen = self.presenter.world_target
+
         # Audio manager
         from utils.audio_manager import AudioManager
-        self.audio = AudioManager(self.settings)
+        self.audio = AudioManager(self.settings, enabled=not headless)
 
         # On first run, suggest native resolution
-        if not os.path.exists("data/settings.json"):
+        if not headless and not os.path.exists("data/settings.json"):
             native_idx = self.settings.get_native_resolution_index()
             self.settings.set_resolution(native_idx)
             self.settings.save_settings()
 
         # Apply video settings at startup
-        from config.settings import update_screen_size
-        update_screen_size(self.settings.width, self.settings.height)
-        self.screen = self.settings.apply_video_settings(self.screen)
+        if not headless:
+            from config.settings import update_screen_size
+            update_screen_size(self.settings.width, self.settings.height)
+            self._apply_video_settings()
+        else:
+            # Headless draws straight to the 1280x720 base surface
+            # (in memory only - saved settings are left alone)
+            self.settings.set_fullscreen(False)
 
         # Track if settings changed (needs restart)
         self.settings_changed = False
 
         # Fonts
-        self.font_large = pygame.font.Font(None, 72)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
+        self.font_large = get_font(72)
+        self.font_medium = get_font(48)
+        self.font_small = get_font(32)
 
         # UI
         self.menu = Menu(self.font_large, self.font_medium, self.font_small)
@@ -119,12 +170,25 @@ class Game:
         # Achievement notifications
         self.achievement_notifications = []
 
-        # Load levels
-        self.levels = LevelLoader.create_default_levels()
+        # Levels are built on demand (and prefetched) by the level manager
+        self.level_manager = LevelManager()
 
         # Game objects
-        self.projectiles = []
-        self.particles = []
+        self.projectiles = ProjectilePool()
+        self.particles = ParticleSystem()
+
+        # Per-frame broad-phase for entity-vs-entity collision checks
+        self.broadphase = BroadPhase(BROADPHASE_CELL_SIZE)
+
+        # Entities far from the camera sleep until it comes near
+        self.active_region = ActiveRegion()
+
+        # Level entities inside the camera view, recomputed each drawn frame
+        self.visibility = Visibility()
+
+        # Gameplay time and randomness come only from these, so runs replay
+        self.game_clock = GameClock()
+        self.rng = random.Random(seed)
 
         # Input state tracking
         self.jump_pressed = False
@@ -134,12 +198,21 @@ class Game:
         self.debug_mode = False
         self.debug_toggle_pressed = False
 
+        # Per-section frame timings (F3 overlay, F4 to dump)
+        self.profiler = FrameProfiler()
+        self.profiler_dump_pressed = False
+
         # Mouse position
-        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_pos = self.presenter.window_to_target(pygame.mouse.get_pos())
 
         # Boss system
         self.boss = None
-        self.boss_projectiles = []
+        self.boss_projectiles = ProjectilePool(
+            BOSS_PROJECTILE_CAPACITY,
+            BOSS_PROJECTILE_SIZE,
+            BOSS_PROJECTILE_LIFETIME,
+            shape=ProjectilePool.ORB,
+        )
         self.boss_effects = []
         self.boss_defeated = False
 
@@ -175,14 +248,41 @@ class Game:
         """Main game loop"""
         try:
             while self.running:
+                if self.headless:
+                    # Nothing to show, so simulate as fast as possible
+                    self._handle_events()
+                    self.step()
+                    continue
+
+                frame_time = self.clock.tick(MAX_RENDER_FPS) / 1000.0
+                self.profiler.begin_frame()
                 self._handle_events()
-                self._update()
+                self.step(self.timestep.advance(frame_time))
+                self.render_alpha = self.timestep.alpha
                 self._draw()
-                self.clock.tick(FPS)
+                self.profiler.end_frame()
         finally:
-            # Cleanup audio
-            self.audio.cleanup()
-            pygame.quit()
+            self.close()
+
+    def close(self):
+        """
+        Release audio, the level prefetch worker and pygame. Safe to call
+        more than once; headless users that drive step() themselves call it
+        when done, or use the game as a context manager
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.audio.cleanup()
+        self.level_manager.shutdown()
+        clear_fonts()
+        pygame.quit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _show_popup(self, message, duration=120):
         """Show popup using Popup component"""
@@ -341,7 +441,7 @@ class Game:
 
     def _handle_events(self):
         """Handle pygame events"""
-        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_pos = self.presenter.window_to_target(pygame.mouse.get_pos())
 
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -403,7 +503,7 @@ class Game:
         self.difficulty = difficulties[self.difficulty_selection]
 
         # Initialize difficulty manager
-        self.difficulty_manager = DifficultyManager(self.difficulty, len(self.levels))
+        self.difficulty_manager = DifficultyManager(self.difficulty, len(self.level_manager))
 
         # DELETE any existing save file (this is a NEW game, not continue)
         SaveManager.delete_save(self.current_profile.name)
@@ -452,13 +552,70 @@ class Game:
         self.player = Player(100, 100, self.current_profile.character)
 
         # Set difficulty-based lives
-        self.difficulty_manager = DifficultyManager(self.difficulty, len(self.levels))
+        self.difficulty_manager = DifficultyManager(self.difficulty, len(self.level_manager))
         self.player.lives = self.difficulty_manager.get_lives(0)
 
         # Start from level 0
         self._load_level(0)
         self.state = GameState.PLAYING
 
+    def start_run(self, level_index=0, difficulty="NORMAL", character=0, seed=None, record=False):
+        """
+        Start a reproducible run without touching profiles or saves
+        (bots, replays, benchmarks). Same seed + same input = same run
+        Args:
+            level_index: Level to start on
+            difficulty: "EASY", "NORMAL" or "HARD"
+            character: Character skin index
+            seed: RNG seed (random if None)
+            record: Record this run's input
+        Returns:
+            The Replay being recorded if record is set, else None
+        """
+        from utils.difficulty_manager import DifficultyManager
+
+        if seed is None:
+            seed = random.getrandbits(63)
+
+        replay = None
+        if record:
+            replay = Replay(seed, level_index, difficulty, character)
+            self.input = ReplayRecorder(self.input, replay)
+
+        self.rng.seed(seed)
+        self.game_clock.reset()
+
+        self.difficulty = difficulty
+        self.difficulty_manager = DifficultyManager(self.difficulty, len(self.level_manager))
+        self.player = Player(100, 100, character, self.audio)
+        self.player.lives = self.difficulty_manager.get_lives(level_index)
+
+        self.camera = Camera()
+        self.jump_pressed = False
+        self.coins_collected = 0
+        self.total_coins_in_act = 0
+        self.boss_fight_start_time = None
+        self.boss_damage_taken = 0
+        self.enemies_defeated = 0
+        self.total_damage_taken = 0
+        self.powerups_collected = 0
+        self.secrets_found = 0
+
+        self._load_level(level_index)
+        self.state = GameState.PLAYING
+        return replay
+
+    def play_replay(self, replay):
+        """
+        Play a recorded run back through the normal update path
+        Args:
+            replay: Replay to play (check self.input.finished for the end)
+        """
+        self.input = ReplayInput(replay)
+        self.start_run(
+            replay.level, replay.difficulty, replay.character, replay.seed
+        )
+
     def _handle_controls_events(self, event):
         """Handle controls screen input"""
         if event.type == pygame.KEYDOWN:
@@ -472,15 +629,49 @@ class Game:
         Track completions per difficulty
         """
         if event.type == pygame.KEYDOWN:
+            unlocked_count = self._get_unlocked_level_count()
             if controls.check_key_event(event, controls.MENU_UP):
                 # Navigate unlocked levels
-                pass
+                if unlocked_count:
+                    self.level_selection = (self.level_selection - 1) % unlocked_count
+                    self.audio.menu_navigate()
+            elif controls.check_key_event(event, controls.MENU_DOWN):
+                if unlocked_count:
+                    self.level_selection = (self.level_selection + 1) % unlocked_count
+                    self.audio.menu_navigate()
             elif controls.check_key_event(event, controls.MENU_SELECT):
                 # Start selected level
                 self._start_from_level_select()
             elif event.key == pygame.K_ESCAPE:
                 self.state = GameState.MENU
 
+    def _get_unlocked_level_count(self):
+        """Get how many levels the current profile can pick on the level map"""
+        if not self.current_profile:
+            return 0
+        return min(self.current_profile.levels_completed, len(self.level_manager))
+
+    def _start_from_level_select(self):
+        """Replay the unlocked level selected on the level map"""
+        from utils.difficulty_manager import DifficultyManager
+
+        if self.level_selection >= self._get_unlocked_level_count():
+            return
+
+        level_index = self.level_selection
+        self.audio.menu_select()
+        self.difficulty_manager = DifficultyManager(self.difficulty, len(self.level_manager))
+        self.player = Player(100, 100, self.current_profile.character, self.audio)
+        self.player.lives = self.difficulty_manager.get_lives(level_index)
+
+        # Start level music
+        self.audio.stop_music()
+        self.audio.play_music('level')
+
+        # Replaying the level played last rewinds it instead of rebuilding it
+        self._load_level(level_index)
+        self.state = GameState.PLAYING
+
     def _handle_menu_events(self, event):
         """Handle main menu input
             Main menu options:
@@ -529,7 +720,7 @@ class Game:
                     from utils.difficulty_manager import DifficultyManager
 
                     self.difficulty_manager = DifficultyManager(
-                        self.difficulty, len(self.levels)
+                        self.difficulty, len(self.level_manager)
                     )
 
                     # Start level music
@@ -819,6 +1010,28 @@ class Game:
                 # event.y is positive for scroll up, negative for scroll down
                 self.menu.achievement_screen.scroll(-event.y)
 
+    def step(self, n=1):
+        """
+        Advance the simulation by n fixed steps without drawing
+        Args:
+            n: Number of steps to run
+        """
+        for _ in range(n):
+            self._save_positions()
+            self._update()
+
+    def _save_positions(self):
+        """Snapshot positions of interpolated objects before a simulation step"""
+        self.camera.save_position()
+        if self.player:
+            self.player.save_position()
+        if self.level:
+            for enemy in self.active_region.get_awake("enemies"):
+                enemy.save_position()
+        self.projectiles.save_positions()
+        self.boss_projectiles.save_positions()
+
+    @profiled("update")
     def _update(self):
         """Update game state"""
         # Update popup timer
@@ -861,13 +1074,14 @@ class Game:
 
             self.achievement_manager.clear_recent_unlocks()
 
+    @profiled("boss")
     def _update_boss(self):
         """Update boss fight logic"""
         from entities.boss_attacks import BossAttackEffect, BossAttackManager
 
         # Update boss
-        current_time = pygame.time.get_ticks()
-        self.boss.update(self.player, self.level.tiles, current_time)
+        current_time = self.game_clock.ticks
+        self.boss.update(self.player, self.level, current_time)
 
         # Execute boss attacks
         if self.boss.current_attack and self.boss.attack_state == 0:
@@ -877,38 +1091,40 @@ class Game:
 
             # Process new attacks
             for attack in new_attacks:
-                if isinstance(attack, dict):
-                    # It's an effect
-                    effect = BossAttackEffect(attack)
-                    self.boss_effects.append(effect)
+                if attack["type"] == "projectile":
+                    self.boss_projectiles.spawn_angled(
+                        attack["x"],
+                        attack["y"],
+                        attack["angle"],
+                        attack["speed"],
+                        attack["damage"],
+                        attack["color"],
+                        ProjectilePool.ENEMY,
+                    )
                 else:
-                    # It's a projectile
-                    self.boss_projectiles.append(attack)
+                    self.boss_effects.append(BossAttackEffect(attack))
 
             self.boss.attack_state = 1
             self.boss.current_attack = None
 
         # Update boss projectiles
-        for proj in self.boss_projectiles[:]:
-            proj.update(self.level.tiles)
-            if not proj.active:
-                self.boss_projectiles.remove(proj)
-                continue
+        boss_shots = self.boss_projectiles
+        boss_shots.update(self.level)
 
-            # Check player collision
-            if self.player.get_rect().colliderect(proj.get_rect()):
-                if not self.player.invincible:
-                    self.player.take_damage(proj.damage)
-                    self.total_damage_taken += proj.damage
-                proj.active = False
+        # Check player collision
+        for slot in boss_shots.hits_rect(self.player.get_rect()):
+            damage = int(boss_shots.damage[slot])
+            if not self.player.invincible:
+                self.player.take_damage(damage)
+                self.total_damage_taken += damage
+            boss_shots.kill(slot)
 
         # Update boss effects
-        for effect in self.boss_effects[:]:
+        for effect in self.boss_effects:
             effect.update(self.boss)
-            if not effect.active:
-                self.boss_effects.remove(effect)
-                continue
+        self.boss_effects = [effect for effect in self.boss_effects if effect.active]
 
+        for effect in self.boss_effects:
             # Check player collision with effects
             if effect.type != "minion_spawn":
                 damage_rect = effect.get_damage_rect()
@@ -923,12 +1139,12 @@ class Game:
                 if self.boss.take_damage(self.player.weapon_level + 2):
                     self.player.score += 50
 
-        # Check player projectiles on boss
-        for proj in self.projectiles[:]:
-            if proj.get_rect().colliderect(self.boss.get_rect()):
-                if self.boss.take_damage(proj.damage):
-                    self.player.score += 25
-                proj.active = False
+        # Check projectiles on boss
+        shots = self.projectiles
+        for slot in shots.hits_rect(self.boss.get_rect()):
+            if self.boss.take_damage(int(shots.damage[slot])):
+                self.player.score += 25
+            shots.kill(slot)
 
         # Check if boss defeated
         if self.boss.defeated and not self.boss_defeated:
@@ -958,29 +1174,36 @@ class Game:
             (255, 215, 0),  # Gold portal
         )
         self.level.portals.append(portal)
+        self.visibility.add("portals", portal)
 
         # Victory particles
-        for _ in range(50):
-            self.particles.append(
-                Particle(
-                    self.boss.x + self.boss.width // 2,
-                    self.boss.y + self.boss.height // 2,
-                    YELLOW,
-                    random.uniform(-8, 8),
-                    random.uniform(-8, 8),
-                    60,
-                )
-            )
+        self.particles.emit(
+            self.boss.x + self.boss.width // 2,
+            self.boss.y + self.boss.height // 2,
+            YELLOW,
+            count=50,
+            spread_x=8,
+            spread_y=8,
+            lifetime=60,
+            rng=self.rng,
+        )
 
+    @profiled("game")
     def _update_game(self):
         """Update game logic"""
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
+        self.broadphase.clear()
+        self.game_clock.tick()
+
+        # Streamed levels need the ground under the player (which may have
+        # respawned far away) before it moves
+        self._stream_level()
 
         # Handle player input
         self._handle_player_input(keys)
 
         # Update player
-        self.player.update(keys, self.level.tiles, self.level.hazards)
+        self.player.update(keys, self.level, self.level.hazards)
 
         # Update camera
         self.camera.update(
@@ -989,6 +1212,10 @@ class Game:
             self.level.width,
             self.level.height,
         )
+        self._stream_level()
+        self.active_region.update(
+            self.camera, self.game_clock.frame, self.player.get_rect()
+        )
 
         # Update boss (if exists)
         if self.boss and not self.boss.defeated:
@@ -1056,6 +1283,14 @@ class Game:
         else:
             self.debug_toggle_pressed = False
 
+        # Dump recent profiler frames (F4)
+        if controls.check_key_pressed(keys, controls.PROFILER_DUMP):
+            if not self.profiler_dump_pressed:
+                self._dump_profile()
+                self.profiler_dump_pressed = True
+        else:
+            self.profiler_dump_pressed = False
+
         # Toggle controls (F1)
         if controls.check_key_pressed(keys, controls.TOGGLE_CONTROLS):
             if not self.controls_toggle_pressed:
@@ -1066,38 +1301,47 @@ class Game:
 
     def _create_jump_particles(self):
         """Create particles for jump effect"""
-        for _ in range(5):
-            self.particles.append(
-                Particle(
-                    self.player.x + self.player.width // 2,
-                    self.player.y + self.player.height,
-                    WHITE,
-                    random.uniform(-2, 2),
-                    random.uniform(-1, 1),
-                    20,
-                )
-            )
+        self.particles.emit(
+            self.player.x + self.player.width // 2,
+            self.player.y + self.player.height,
+            WHITE,
+            count=5,
+            spread_x=2,
+            spread_y=1,
+            lifetime=20,
+            rng=self.rng,
+        )
 
     def _create_projectile(self):
         """Create projectile from player"""
         damage = self.player.weapon_level
         speed = 8 + self.player.weapon_level
-        proj = Projectile(
+        self.projectiles.spawn(
             self.player.x + (self.player.width if self.player.direction > 0 else 0),
             self.player.y + self.player.height // 2,
-            self.player.direction,
-            speed,
+            self.player.direction * speed,
+            0,
             damage,
             CYAN,
         )
-        self.projectiles.append(proj)
 
+    @profiled("collectibles")
     def _update_collectibles(self):
         """Update coins, power-ups, keys"""
-        # Coins
-        for coin in self.level.coins:
+        for coin in self.active_region.get_awake("coins"):
             if not coin.collected:
                 coin.update()
+        for powerup in self.active_region.get_awake("powerups"):
+            if not powerup.collected:
+                powerup.update(self.game_clock.ticks)
+
+        # Pickups are indexed at their spawn rect; power-ups bob a few pixels
+        reach = self.player.get_rect().inflate(0, 16)
+        pickups = self.level.pickup_index
+
+        # Coins
+        for coin in pickups.query("coins", reach):
+            if not coin.collected:
                 if self.player.get_rect().colliderect(coin.get_rect()):
                     coin.collected = True
                     self.coins_collected += 1
@@ -1106,9 +1350,8 @@ class Game:
                     self._create_coin_particles(coin)
 
         # Power-ups
-        for powerup in self.level.powerups:
+        for powerup in pickups.query("powerups", reach):
             if not powerup.collected:
-                powerup.update()
                 if self.player.get_rect().colliderect(powerup.get_rect()):
                     powerup.collected = True
                     self.powerups_collected += 1
@@ -1118,7 +1361,7 @@ class Game:
                         self.achievement_manager.add_powerup_collected()
 
         # Keys
-        for key in self.level.keys:
+        for key in pickups.query("keys", reach):
             if not key.collected:
                 if self.player.get_rect().colliderect(key.get_rect()):
                     key.collected = True
@@ -1127,18 +1370,18 @@ class Game:
 
     def _create_coin_particles(self, coin):
         """Create particles when coin is collected"""
-        for _ in range(8):
-            self.particles.append(
-                Particle(
-                    coin.x + coin.width // 2,
-                    coin.y + coin.height // 2,
-                    YELLOW,
-                    random.uniform(-3, 3),
-                    random.uniform(-3, 3),
-                    30,
-                )
-            )
+        self.particles.emit(
+            coin.x + coin.width // 2,
+            coin.y + coin.height // 2,
+            YELLOW,
+            count=8,
+            spread_x=3,
+            spread_y=3,
+            lifetime=30,
+            rng=self.rng,
+        )
 
+    @profiled("portals")
     def _update_portals(self):
         """Update portals and handle level transitions"""
         for portal in self.level.portals:
@@ -1154,12 +1397,13 @@ class Game:
                         )
                     self._transition_to_level(portal.destination)
 
+    @profiled("enemies")
     def _update_enemies(self):
         """Update enemies and check collisions"""
 
-        for enemy in self.level.enemies:
+        for enemy in self.active_region.get_awake("enemies"):
             if not enemy.dead:
-                enemy.update(self.level.tiles)
+                enemy.update(self.level, self.game_clock.ticks)
 
                 # Turret shooting logic
                 if enemy.type == EnemyType.TURRET.value and enemy.can_shoot():
@@ -1178,35 +1422,40 @@ class Game:
                         spawn_y = enemy.y + enemy.height // 2 + math.sin(angle) * spawn_distance
 
                         # Create angled projectile
-                        proj = Projectile(
+                        self.projectiles.spawn_angled(
                             spawn_x - 6,  # Center horizontally
                             spawn_y - 3,  # Center vertically
-                            1,  # Direction (doesn't matter for angled shots)
+                            angle,
                             4,  # Speed (slower than player shots)
-                            enemy.damage,  # Damage
+                            enemy.damage,
                             ORANGE,  # Orange color for enemy projectiles
-                            angle=angle  # Pass the angle here!
+                            ProjectilePool.ENEMY,
                         )
-                        
-                        self.projectiles.append(proj)
                         enemy.reset_shoot_timer()
-                        
-                # Check collision with player
-                if self.player.get_rect().colliderect(enemy.get_rect()):
-                    self._handle_enemy_player_collision(enemy)
-
-                # Check melee attack
-                if self.player.melee_active:
-                    if self.player.get_melee_rect().colliderect(enemy.get_rect()):
-                        enemy.take_damage(self.player.weapon_level + 1)
-                        self.player.score += SCORE_MELEE_HIT
-                        if enemy.dead:
-                            self.level.enemies.remove(enemy)
-                            self.enemies_defeated += 1
-                            self._create_enemy_death_particles(enemy)
-                            # When enemy dies from melee:
-                            if self.achievement_manager:
-                                self.achievement_manager.add_enemy_kill('melee')
+
+        self.broadphase.set_group(
+            "enemies", [enemy for enemy in self.level.enemies if not enemy.dead]
+        )
+
+        # Only enemies sharing a cell with the player or melee swing can touch
+        reach = self.player.get_rect()
+        if self.player.melee_active:
+            reach = reach.union(self.player.get_melee_rect())
+
+        for enemy in self.broadphase.query("enemies", reach):
+            # Check collision with player
+            if self.player.get_rect().colliderect(enemy.get_rect()):
+                self._handle_enemy_player_collision(enemy)
+
+            # Check melee attack
+            if self.player.melee_active and not enemy.dead:
+                if self.player.get_melee_rect().colliderect(enemy.get_rect()):
+                    enemy.take_damage(self.player.weapon_level + 1)
+                    self.player.score += SCORE_MELEE_HIT
+                    if enemy.dead:
+                        self._on_enemy_killed(enemy, "melee")
+
+        self._remove_dead_enemies()
 
     def _handle_enemy_player_collision(self, enemy):
         """Handle collision between player and enemy"""
@@ -1219,35 +1468,48 @@ class Game:
             self.player.dy = -10
             self.player.score += SCORE_ENEMY_KILL
             if enemy.dead:
-                self.level.enemies.remove(enemy)
-                self.enemies_defeated += 1
-                self._create_enemy_death_particles(enemy)
-                # When enemy dies from stomp:
-                if self.achievement_manager:
-                    self.achievement_manager.add_enemy_kill('stomp')
+                self._on_enemy_killed(enemy, "stomp")
         else:
             self.player.take_damage(enemy.damage)
             self.total_damage_taken += enemy.damage
 
+    def _on_enemy_killed(self, enemy, method):
+        """
+        Record an enemy kill. The enemy is dropped from the level by
+        _remove_dead_enemies once the current collision pass is finished
+        Args:
+            enemy: Enemy that just died
+            method: Kill method for achievements ('stomp', 'melee', 'projectile')
+        """
+        self.enemies_defeated += 1
+        self._create_enemy_death_particles(enemy)
+        if self.achievement_manager:
+            self.achievement_manager.add_enemy_kill(method)
+
+    def _remove_dead_enemies(self):
+        """Compact dead enemies out of the level in one pass"""
+        if any(enemy.dead for enemy in self.level.enemies):
+            self.level.enemies = [enemy for enemy in self.level.enemies if not enemy.dead]
+
     def _create_enemy_death_particles(self, enemy):
         """Create particles when enemy dies"""
         from config.settings import RED
 
-        for _ in range(15):
-            self.particles.append(
-                Particle(
-                    enemy.x + enemy.width // 2,
-                    enemy.y + enemy.height // 2,
-                    RED,
-                    random.uniform(-4, 4),
-                    random.uniform(-4, 4),
-                    40,
-                )
-            )
+        self.particles.emit(
+            enemy.x + enemy.width // 2,
+            enemy.y + enemy.height // 2,
+            RED,
+            count=15,
+            spread_x=4,
+            spread_y=4,
+            lifetime=40,
+            rng=self.rng,
+        )
 
+    @profiled("hazards")
     def _update_hazards(self):
         """Update hazards and check platform collisions"""
-        for hazard in self.level.hazards:
+        for hazard in self.active_region.get_awake("hazards"):
             hazard.update(self.player.get_rect())
 
             # Moving platform collision
@@ -1260,63 +1522,77 @@ class Game:
                         self.player.on_ground = True
                         self.player.x += hazard.direction * hazard.speed
 
+    @profiled("projectiles")
     def _update_projectiles(self):
         """Update projectiles and check collisions"""
-        for proj in self.projectiles[:]:
-            proj.update(self.level.tiles)
-
-            if not proj.active:
-                self.projectiles.remove(proj)
+        shots = self.projectiles
+        shots.update(self.level)
+
+        # Turret shots damage the player
+        for slot in shots.hits_rect(self.player.get_rect(), ProjectilePool.ENEMY):
+            damage = int(shots.damage[slot])
+            if not self.player.invincible:
+                self.player.take_damage(damage)
+                self.total_damage_taken += damage
+            shots.kill(slot)
+
+        # Any shot still flying hits the first enemy it overlaps; turret
+        # shots that miss the player can take out other enemies too
+        for slot, enemy in shots.hits_group(self.broadphase, "enemies"):
+            if not shots.is_alive(slot) or enemy.dead:
                 continue
+            enemy.take_damage(int(shots.damage[slot]))
+            shots.kill(slot)
+            self.player.score += SCORE_ENEMY_HIT
+            if enemy.dead:
+                self._on_enemy_killed(enemy, "projectile")
 
-            # Enemy projectiles (orange = turret shots) damage the player
-            if proj.color == ORANGE:  # Enemy projectile
-                if self.player.get_rect().colliderect(proj.get_rect()):
-                    if not self.player.invincible:
-                        self.player.take_damage(proj.damage)
-                        self.total_damage_taken += proj.damage
-                    proj.active = False
-                    continue  # Skip enemy collision check for enemy projectiles
-
-            # Check enemy collision
-            for enemy in self.level.enemies:
-                if not enemy.dead and proj.get_rect().colliderect(enemy.get_rect()):
-                    enemy.take_damage(proj.damage)
-                    proj.active = False
-                    self.player.score += SCORE_ENEMY_HIT
-                    if enemy.dead:
-                        self.level.enemies.remove(enemy)
-                        self.enemies_defeated += 1
-                        self._create_enemy_death_particles(enemy)
-                        # When enemy dies from projectile:
-                        if self.achievement_manager:
-                            self.achievement_manager.add_enemy_kill('projectile')
-                    break
+        self._remove_dead_enemies()
 
+    @profiled("particles")
     def _update_particles(self):
         """Update particle effects"""
-        self.particles = [p for p in self.particles if p.update()]
+        self.particles.update()
 
     def _load_level(self, level_index):
         """Load level by index"""
-        if 0 <= level_index < len(self.levels):
+        if 0 <= level_index < len(self.level_manager):
             self.current_level_index = level_index
-            self.level = Level(self.levels[level_index])
+            self.level = self.level_manager.get_level(level_index)
+            self.active_region.bind(self.level, self.game_clock.frame)
+            self.visibility.bind(self.level)
 
             # Count total coins in this level
-            level_coin_total = sum(coin.value for coin in self.level.coins)
+            level_coin_total = self.level.get_coin_total()
             self.total_coins_in_act += level_coin_total
 
             if self.player:
                 self.player.x = self.level.spawn_x
                 self.player.y = self.level.spawn_y
+                self.player.save_position()
+            self._stream_level()
 
-            self.projectiles = []
-            self.particles = []
+            self.projectiles.clear()
+            self.particles.clear()
 
             # Check if this is a boss level and spawn boss
             self._check_and_spawn_boss()
 
+            # Build where this level's portals lead while it is played
+            self.level_manager.prefetch(self.level.get_portal_destinations())
+
+    def _stream_level(self):
+        """Load the chunks of a streamed level around the active region window"""
+        focus = self.player.get_rect() if self.player else None
+        window = self.active_region.get_window(self.camera, focus)
+        # The active region wakes whatever shares a broad-phase cell with
+        # the window, so entities up to a cell outside it can be awake
+        window.inflate_ip(BROADPHASE_CELL_SIZE * 2, BROADPHASE_CELL_SIZE * 2)
+
+        if self.level.stream([window], self.game_clock.frame, self.active_region):
+            self.active_region.reindex(self.level)
+            self.visibility.bind(self.level)
+
     def _check_and_spawn_boss(self):
         """Check if current level has a boss and spawn it"""
         from entities.boss import Boss
@@ -1336,7 +1612,7 @@ class Game:
                 self.difficulty,
             )
             self.boss_defeated = False
-            self.boss_projectiles = []
+            self.boss_projectiles.clear()
             self.boss_effects = []
             print(f"✓ Boss spawned: {boss_type}")
         else:
@@ -1344,7 +1620,7 @@ class Game:
             self.boss_defeated = False
 
     def _transition_to_level(self, level_index):
-        """Transition to new level"""
+        """Transition to new level (already built by the level manager's prefetch)"""
         # Update profile stats
         if self.current_profile:
             ProfileManager.update_profile_stats(
@@ -1453,25 +1729,13 @@ class Game:
             # Reload profiles list
             self.profiles = ProfileManager.load_profiles()
 
+    @profiled("draw")
     def _draw(self):
         """Draw current game state"""
         self.current_screen = None  # Reset at start
 
-        # Always render to 1280x720 base resolution
-        if self.settings.should_use_temp_surface():
-            game_surface = pygame.Surface((1280, 720))
-            render_target = game_surface
-        else:
-            render_target = self.screen
-
-        # # Determine render target based on fullscreen mode
-        # if self.settings.get_fullscreen():
-        #     # Create a surface at game resolution for rendering
-        #     game_surface = pygame.Surface((1280, 720))
-        #     render_target = game_surface
-        # else:
-        #     # Render directly to screen
-        #     render_target = self.screen
+        # Always render to the 1280x720 base resolution
+        render_target = self.screen
 
         # Draw to render target
         if self.state == GameState.PROFILE_SELECT:
@@ -1512,19 +1776,12 @@ class Game:
             )
         elif self.state == GameState.LEVEL_MAP:
             self.current_screen = self.menu.draw_level_map_screen(
-                render_target, self.current_profile, self.mouse_pos
+                render_target, self.current_profile, self.level_selection, self.mouse_pos
             )
         elif self.state == GameState.PLAYING:
-            # For gameplay, always render to temp surface then scale
-            if self.settings.get_fullscreen():
-                self._draw_game_to_surface(game_surface)
-            else:
-                self._draw_game()
+            self._draw_game()
         elif self.state == GameState.PAUSED:
-            if self.settings.get_fullscreen():
-                self._draw_game_to_surface(game_surface)
-            else:
-                self._draw_game()
+            self._draw_game()
             self.current_screen = self.menu.draw_pause_menu(
                 render_target, self.pause_selection, self.mouse_pos
             )
@@ -1546,110 +1803,40 @@ class Game:
         if self.show_popup:
             self.popup.draw(render_target, self.font_small)
 
-        # # If fullscreen, blit game surface centered on screen
-        # if self.settings.get_fullscreen():
-        #     self.screen.fill((0, 0, 0))  # Black bars
-        #     offset = self.settings.get_render_offset()
-        #     self.screen.blit(game_surface, offset)
-
-        # Scale/position the final output
-        if self.settings.should_use_temp_surface():
-            if self.settings.get_fullscreen():
-                # Fullscreen: center on native resolution
-                self.screen.fill((0, 0, 0))
-                offset = self.settings.get_render_offset()
-                self.screen.blit(game_surface, offset)
-            else:
-                # Windowed: scale to window size
-                self.screen.fill((0, 0, 0))
-                scale_size = self.settings.get_scale_transform()
-                if scale_size:
-                    scaled_surface = pygame.transform.scale(game_surface, scale_size)
-                    self.screen.blit(scaled_surface, (0, 0))
-                else:
-                    self.screen.blit(game_surface, (0, 0))
-
         # Draw achievement notifications (on top of everything)
         for notif in self.achievement_notifications:
             notif.draw(self.screen)
 
+        # Scale the frame to the window (no-op when drawing straight to it)
+        self.presenter.present()
         pygame.display.flip()
 
-    def _draw_game_to_surface(self, surface):
-        """Draw game to a specific surface (for fullscreen rendering)"""
-        # Same as _draw_game but renders to provided surface instead of self.screen
-        surface.fill((0, 0, 0))
-
-        # Draw background
-        self.level.draw_background(surface, self.camera)
-
-        # Draw level
-        self.level.draw(surface, self.camera)
-
-        # Draw player
-        if self.player:
-            self.player.draw(surface, self.camera)
-
-        # Draw projectiles
-        for proj in self.projectiles:
-            proj.draw(surface, self.camera)
-
-        # Draw particles
-        for particle in self.particles:
-            particle.draw(surface, self.camera)
-
-        # Draw boss if exists
-        if self.boss and not self.boss.defeated:
-            self.boss.draw(surface, self.camera)
-            for proj in self.boss_projectiles:
-                proj.draw(surface, self.camera)
-            for effect in self.boss_effects:
-                effect.draw(surface, self.camera)
-
-        # Draw HUD
-        if self.player:
-            level_name, area_name = self._get_level_info()
-            self.hud.draw(surface, self.player, level_name, area_name, self.difficulty)
+    def _apply_video_settings(self):
+        """Recreate the window from video settings and re-target the presenter"""
+        self.window = self.settings.apply_video_settings(self.window)
+        self._configure_presenter()
 
-        # Draw controls overlay
-        if self.show_controls:
-            self.hud.draw_controls(surface)
+    def _configure_presenter(self):
+        """Set the presenter up for the current window and video settings"""
+        self.screen = self.presenter.configure(
+            self.window, self.settings.get_scale_mode(), self.settings.get_render_size()
+        )
+        self.world_screen = self.presenter.world_target
 
     def _draw_popup(self):
         """Draw popup overlay"""
         if self.popup and self.popup.is_active():
             self.popup.draw(self.screen, self.font_small)
 
+    @profiled("game")
     def _draw_game(self):
         """Draw game world and HUD"""
-        from utils.textures import BackgroundManager
+        # Draw the world between the last two simulation steps
+        self.camera.begin_render(self.render_alpha, self.presenter.world_size)
+        self.visibility.update(self.camera.x, self.camera.y, *self.presenter.world_size)
 
         # Draw themed background with parallax
-        theme = self.level.theme.name if self.level else "SCIFI"
-
-        if theme == "SCIFI":
-            BackgroundManager.draw_scifi_background(
-                self.screen, self.camera.x, self.camera.y, SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-        elif theme == "NATURE":
-            BackgroundManager.draw_nature_background(
-                self.screen, self.camera.x, self.camera.y, SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-        elif theme == "SPACE":
-            BackgroundManager.draw_space_background(
-                self.screen, self.camera.x, self.camera.y, SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-        elif theme == "UNDERGROUND":
-            BackgroundManager.draw_underground_background(
-                self.screen, self.camera.x, self.camera.y, SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-        elif theme == "UNDERWATER":
-            BackgroundManager.draw_underwater_background(
-                self.screen, self.camera.x, self.camera.y, SCREEN_WIDTH, SCREEN_HEIGHT
-            )
-        else:
-            # Fallback
-            self.screen.fill((20, 20, 40))
+        self._draw_background()
 
         # Draw tiles
         self._draw_tiles()
@@ -1663,27 +1850,31 @@ class Game:
         self._draw_particles()
 
         # Draw boss
-        if self.boss and not self.boss.defeated:
-            self.boss.draw(self.screen, self.camera.x, self.camera.y)
+        if self.boss and not self.boss.defeated and self.visibility.is_visible(self.boss.get_rect()):
+            self.boss.draw(self.world_screen, self.camera.x, self.camera.y)
 
         # Draw boss attacks
-        for proj in self.boss_projectiles:
-            proj.draw(self.screen, self.camera.x, self.camera.y)
+        self.boss_projectiles.draw(self.world_screen, self.camera.x, self.camera.y, self.render_alpha)
         for effect in self.boss_effects:
-            effect.draw(self.screen, self.camera.x, self.camera.y)
+            if self.visibility.is_visible(effect.get_damage_rect()):
+                effect.draw(self.world_screen, self.camera.x, self.camera.y)
 
         # Draw player
-        self.player.draw(self.screen, self.camera.x, self.camera.y, colorblind_mode=self.settings.get_colorblind_mode())
+        self.player.draw(
+            self.world_screen,
+            *self.camera.get_render_offset(self.player, self.render_alpha),
+            colorblind_mode=self.settings.get_colorblind_mode()
+        )
+
+        # Bring a lower-resolution world up to screen size under the HUD
+        self.presenter.upscale_world()
 
         # Boss health bar
         if self.boss and not self.boss.defeated:
             self.boss.draw_health_bar(self.screen)
 
         # Draw HUD
-        level_name, area_name = self._get_level_and_area_names()
-        self.hud.draw(
-            self.screen, self.player, self.current_level_index, area_name, level_name
-        )
+        self._draw_hud()
 
         # Draw debug info
         if self.debug_mode:
@@ -1693,6 +1884,30 @@ class Game:
         if self.show_controls:
             self.hud.draw_controls_overlay(self.screen)
 
+        self.camera.end_render()
+
+    @profiled("background")
+    def _draw_background(self):
+        """Draw themed parallax background"""
+        from utils.textures import BackgroundManager
+
+        BackgroundManager.draw_background(
+            self.world_screen,
+            self.level.theme.name if self.level else "SCIFI",
+            self.camera.x,
+            self.camera.y,
+            *self.presenter.world_size,
+        )
+
+    @profiled("hud")
+    def _draw_hud(self):
+        """Draw HUD"""
+        level_name, area_name = self._get_level_and_area_names()
+        self.hud.draw(
+            self.screen, self.player, self.current_level_index, area_name, level_name
+        )
+
+    @profiled("debug_overlay")
     def _draw_debug_overlay(self):
         """Draw debug information overlay"""
         # Semi-transparent background
@@ -1733,6 +1948,70 @@ class Game:
             text = self.font_small.render(line, True, color)
             self.screen.blit(text, (20, y_offset + i * 25))
 
+        self._draw_profiler_overlay()
+
+    def _draw_profiler_overlay(self):
+        """Draw rolling section timings and a frame-time graph"""
+        font = get_font(20)
+        averages = self.profiler.get_averages(60)
+        frame_times = self.profiler.get_frame_times(200)
+        row_height = 16
+        graph_height = 60
+        width = 420
+        height = 40 + (len(averages) + 1) * row_height + graph_height
+        x = SCREEN_WIDTH - width - 10
+        y = 200
+
+        overlay = pygame.Surface((width, height))
+        overlay.set_alpha(200)
+        overlay.fill((0, 0, 0))
+        self.screen.blit(overlay, (x, y))
+
+        avg_frame = sum(frame_times[-60:]) / len(frame_times[-60:]) if frame_times else 0
+        title = f"PROFILER  frame {avg_frame:.2f} ms  (F4: dump last {PROFILER_DUMP_SECONDS}s)"
+        self.screen.blit(font.render(title, True, (255, 255, 0)), (x + 10, y + 8))
+
+        hits, misses, cached = text_cache.get_stats()
+        text_stats = f"text cache  {hits} hits  {misses} misses  {cached} cached"
+        self.screen.blit(font.render(text_stats, True, (200, 200, 200)), (x + 10, y + 28))
+
+        # One row per section, indented by depth
+        row_y = y + 28 + row_height
+        for path, ms in averages:
+            depth = path.count("/")
+            name = path.rsplit("/", 1)[-1]
+            label = font.render(f"{'  ' * depth}{name}", True, (255, 255, 255))
+            value = font.render(f"{ms:6.2f} ms", True, (200, 200, 200))
+            self.screen.blit(label, (x + 10, row_y))
+            self.screen.blit(value, (x + width - 80, row_y))
+            row_y += row_height
+
+        # Frame-time graph, scaled so the 60 FPS budget sits at mid height
+        graph_top = row_y + 6
+        graph_bottom = graph_top + graph_height - 12
+        budget_ms = 1000 / FPS
+        scale = (graph_bottom - graph_top) / (budget_ms * 2)
+        pygame.draw.line(
+            self.screen,
+            (90, 90, 90),
+            (x + 10, graph_bottom - budget_ms * scale),
+            (x + width - 10, graph_bottom - budget_ms * scale),
+        )
+        for i, frame_ms in enumerate(frame_times):
+            bar = min(frame_ms * scale, graph_bottom - graph_top)
+            color = (100, 220, 100) if frame_ms <= budget_ms else (230, 90, 70)
+            bar_x = x + 10 + i * 2
+            pygame.draw.line(self.screen, color, (bar_x, graph_bottom), (bar_x, graph_bottom - bar))
+
+    def _dump_profile(self):
+        """Write the last PROFILER_DUMP_SECONDS of profiler frames to a file"""
+        path = os.path.join(
+            PROFILER_DUMP_DIR, time.strftime("profile_%Y%m%d_%H%M%S.json")
+        )
+        count = self.profiler.dump(path, PROFILER_DUMP_SECONDS)
+        print(f"✓ Profile dumped: {path} ({count} frames)")
+        self._show_popup("Profile saved")
+
     def _get_area_name(self, level_index, player_x):
         """Get area name based on level and player position"""
         # Level-specific area mappings
@@ -1804,120 +2083,65 @@ class Game:
 
         return "Unknown Area"
 
+    @profiled("tiles")
     def _draw_tiles(self):
-        """Draw level tiles with theme-based textures"""
-        from utils.collision import is_rect_on_screen
-        from utils.textures import TextureManager
-
-        colorblind_mode = self.settings.get_colorblind_mode()
-
-        for tile in self.level.tiles:
-            if is_rect_on_screen(
-                tile["rect"], self.camera.x, self.camera.y, SCREEN_WIDTH, SCREEN_HEIGHT
-            ):
-                rect = self.camera.apply_rect(tile["rect"])
-                theme = tile.get("theme", "SCIFI")
-                color = tile["color"]
-
-                # Different pattern per theme for easy identification
-                if theme == "SCIFI":
-                    # Grid pattern for sci-fi
-                    TextureManager.draw_grid_rect(
-                        self.screen, rect, color, (200, 200, 200), grid_size=8, colorblind_mode=colorblind_mode
-                    )
-                elif theme == "NATURE":
-                    # Diagonal lines for nature
-                    TextureManager.draw_diagonal_lines(
-                        self.screen, rect, color, (150, 200, 150), spacing=6, colorblind_mode=colorblind_mode
-                    )
-                elif theme == "SPACE":
-                    # Dots for space
-                    TextureManager.draw_dotted_rect(
-                        self.screen, rect, color, (150, 150, 200), dot_size=2, spacing=8, colorblind_mode=colorblind_mode
-                    )
-                elif theme == "UNDERGROUND":
-                    # Brick pattern for underground
-                    TextureManager.draw_brick_wall(
-                        self.screen, rect, (80, 60, 40), color, colorblind_mode=colorblind_mode
-                    )
-                elif theme == "UNDERWATER":
-                    # Horizontal waves for underwater
-                    TextureManager.draw_striped_rect(
-                        self.screen,
-                        rect,
-                        color,
-                        (100, 150, 200),
-                        stripe_width=4,
-                        vertical=False,
-                        colorblind_mode=colorblind_mode,
-                    )
-                else:
-                    # Default checkered
-                    TextureManager.draw_checkered_rect(
-                        self.screen, rect, color, (120, 120, 120), check_size=8, colorblind_mode=colorblind_mode
-                    )
-
-                # Border
-                pygame.draw.rect(self.screen, WHITE, rect, 1)
+        """Draw level tiles from the level's pre-rendered chunks"""
+        self.level.draw_static(
+            self.world_screen,
+            self.camera.x,
+            self.camera.y,
+            *self.presenter.world_size,
+            colorblind_mode=self.settings.get_colorblind_mode(),
+        )
 
+    @profiled("hazards")
     def _draw_hazards(self):
-        """Draw hazards"""
-        for hazard in self.level.hazards:
-            hazard.draw(self.screen, self.camera.x, self.camera.y, colorblind_mode=self.settings.get_colorblind_mode())
+        """Draw hazards in view"""
+        for hazard in self.visibility.get_visible("hazards"):
+            hazard.draw(self.world_screen, self.camera.x, self.camera.y, colorblind_mode=self.settings.get_colorblind_mode())
 
+    @profiled("collectibles")
     def _draw_collectibles(self):
-        """Draw coins, power-ups, keys"""
-        for coin in self.level.coins:
+        """Draw coins, power-ups, keys in view"""
+        for coin in self.visibility.get_visible("coins"):
             if not coin.collected:
-                coin.draw(self.screen, self.camera.x, self.camera.y)
+                coin.draw(self.world_screen, self.camera.x, self.camera.y)
 
-        for powerup in self.level.powerups:
+        for powerup in self.visibility.get_visible("powerups"):
             if not powerup.collected:
-                powerup.draw(self.screen, self.camera.x, self.camera.y)
+                powerup.draw(self.world_screen, self.camera.x, self.camera.y)
 
-        for key in self.level.keys:
+        for key in self.visibility.get_visible("keys"):
             if not key.collected:
-                key.draw(self.screen, self.camera.x, self.camera.y)
+                key.draw(self.world_screen, self.camera.x, self.camera.y)
 
+    @profiled("portals")
     def _draw_portals(self):
-        """Draw portals"""
-        for portal in self.level.portals:
-            portal.draw(self.screen, self.camera.x, self.camera.y)
+        """Draw portals in view"""
+        for portal in self.visibility.get_visible("portals"):
+            portal.draw(self.world_screen, self.camera.x, self.camera.y)
 
+    @profiled("enemies")
     def _draw_enemies(self):
-        """Draw enemies"""
-        for enemy in self.level.enemies:
-            enemy.draw(self.screen, self.camera.x, self.camera.y, colorblind_mode=self.settings.get_colorblind_mode())
+        """Draw enemies in view"""
+        for enemy in self.visibility.get_visible("enemies"):
+            enemy.draw(
+                self.world_screen,
+                *self.camera.get_render_offset(enemy, self.render_alpha),
+                colorblind_mode=self.settings.get_colorblind_mode()
+            )
 
+    @profiled("projectiles")
     def _draw_projectiles(self):
         """Draw projectiles"""
-        for proj in self.projectiles:
-            proj.draw(self.screen, self.camera.x, self.camera.y)
+        self.projectiles.draw(self.world_screen, self.camera.x, self.camera.y, self.render_alpha)
 
+    @profiled("particles")
     def _draw_particles(self):
         """Draw particle effects"""
-        for particle in self.particles:
-            particle.draw(self.screen, self.camera.x, self.camera.y)
-
-    def _draw_boss(self):
-        """Draw boss and related combat objects"""
-        if not self.boss or self.boss.defeated:
-            return
-
-        # Draw boss entity
-        self.boss.draw(self.screen, self.camera.x, self.camera.y)
-
-        # Draw boss health bar
-        self.boss.draw_health_bar(self.screen)
-
-        # Draw boss projectiles
-        for proj in self.boss_projectiles:
-            proj.draw(self.screen, self.camera.x, self.camera.y)
-
-        # Draw boss effects
-        for effect in self.boss_effects:
-            effect.draw(self.screen, self.camera.x, self.camera.y)
+        self.particles.draw(self.world_screen, self.camera.x, self.camera.y)
 
+    @profiled("boss")
     def _get_level_and_area_names(self):
         """Get current level and area names for HUD"""
         level_names = [
@@ -1959,6 +2183,25 @@ class Game:
                 self.state = GameState.OPTIONS
 
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # Scaling mode dropdown. Its open list covers the controls
+            # below it, so a click it takes goes no further
+            if components['scale_dropdown'].check_click(self.mouse_pos, pygame.mouse.get_pressed()):
+                mode = SCALE_MODES[components['scale_dropdown'].get_selected_index()]
+                if mode != self.settings.get_scale_mode():
+                    self.settings.set_scale_mode(mode)
+                    self._configure_presenter()
+                    self.settings.save_settings()
+                return
+
+            # Render scale dropdown
+            if components['render_scale_dropdown'].check_click(self.mouse_pos, pygame.mouse.get_pressed()):
+                scale = RENDER_SCALES[components['render_scale_dropdown'].get_selected_index()]
+                if scale != self.settings.get_render_scale():
+                    self.settings.set_render_scale(scale)
+                    self._configure_presenter()
+                    self.settings.save_settings()
+                return
+
             # Resolution dropdown
             old_res = self.settings.settings['video']['resolution_index']
             if components['res_dropdown'].check_click(self.mouse_pos, pygame.mouse.get_pressed()):
@@ -1971,7 +2214,7 @@ class Game:
             if components['fullscreen_toggle'].check_click(self.mouse_pos, pygame.mouse.get_pressed()):
                 self.settings.toggle_fullscreen()
                 # Apply immediately
-                self.screen = self.settings.apply_video_settings(self.screen)
+                self._apply_video_settings()
                 self.settings.save_settings()
 
             # Music toggle
@@ -2044,7 +2287,7 @@ class Game:
                         if components['fullscreen_toggle'].check_click(self.mouse_pos, pygame.mouse.get_pressed()):
                             self.settings.toggle_fullscreen()
                             # Apply immediately
-                            self.screen = self.settings.apply_video_settings(self.screen)
+                            self._apply_video_settings()
 
                     # Music toggle
                     if 'music_toggle' in components:
@@ -0,0 +1,67 @@
+"""
+Input sources - where the game reads held keys from each update
+"""
+
+import pygame
+
+
+class KeyState:
+    """
+    Held-key snapshot indexable like pygame.key.get_pressed()
+    (keys[pygame.K_SPACE] -> bool), but backed by a set of key codes
+    """
+
+    def __init__(self, pressed=()):
+        """
+        Args:
+            pressed: Iterable of pygame key codes that are held
+        """
+        self.pressed = frozenset(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class KeyboardInput:
+    """Reads the real keyboard"""
+
+    def get_pressed(self):
+        """Get held keys for this update"""
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput:
+    """
+    Programmatic input for bots, tests and benchmarks. Keys can be held and
+    released directly, or produced per update by a script function
+    """
+
+    def __init__(self, script=None):
+        """
+        Args:
+            script: Optional function(frame) returning the key codes held on
+                that update. Without one, keys held via press() are used
+        """
+        self.script = script
+        self.held = set()
+        self.frame = 0
+
+    def press(self, *keys):
+        """Hold keys until released"""
+        self.held.update(keys)
+
+    def release(self, *keys):
+        """Release held keys (all of them if none are given)"""
+        if keys:
+            self.held.difference_update(keys)
+        else:
+            self.held.clear()
+
+    def get_pressed(self):
+        """Get held keys for this update and advance the script"""
+        if self.script:
+            state = KeyState(self.script(self.frame))
+        else:
+            state = KeyState(self.held)
+        self.frame += 1
+        return state
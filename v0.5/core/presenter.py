@@ -0,0 +1,160 @@
+"""
+Presenter - owns the render target and puts each frame on the window
+"""
+
+import pygame
+
+from config.settings import (DEFAULT_SCALE_MODE, SCALE_MODE_INTEGER,
+                             SCALE_MODE_SMOOTH, SCALE_MODES, SCREEN_HEIGHT,
+                             SCREEN_WIDTH)
+
+
+class Presenter:
+    """
+    The game always draws at the base resolution. When the window has that
+    size the game draws straight to it; otherwise it draws into a persistent
+    display-format target that is scaled into a fixed rect of the window,
+    with black letterbox bars around it.
+
+    At a render scale below 1 the game world is drawn into a smaller world
+    target first and upscaled (nearest-neighbour) into the target, under
+    the HUD and menus, which stay at the base resolution.
+
+    Targets, destination rect and bars are worked out in configure() (at
+    startup and whenever video settings change), so presenting a frame
+    allocates nothing: scaling writes straight into a subsurface of the
+    window.
+    """
+
+    def __init__(self, base_size=(SCREEN_WIDTH, SCREEN_HEIGHT), scale_mode=DEFAULT_SCALE_MODE, world_size=None):
+        """
+        Args:
+            base_size: (width, height) the game draws at
+            scale_mode: One of SCALE_MODES (see config.settings)
+            world_size: (width, height) the world is drawn at (None: base_size)
+        """
+        self.base_size = base_size
+        self.scale_mode = scale_mode
+        self.world_size = world_size or base_size
+        self.window = None
+        self.target = None
+        self.world_target = None
+        self.dest_rect = pygame.Rect((0, 0), base_size)
+        self.bars = []  # Window rects outside dest_rect, filled black each frame
+        self._dest = None  # Window subsurface at dest_rect (None: plain blit)
+        self._scale = pygame.transform.scale
+
+    def configure(self, window, scale_mode=None, world_size=None):
+        """
+        Set up for a (new) window surface
+        Args:
+            window: Display surface from pygame.display.set_mode
+            scale_mode: New scaling mode (None keeps the current one)
+            world_size: New world render size (None keeps the current one)
+        Returns:
+            Surface the game should draw into this frame and every frame after
+            (the world goes into world_target, which may be the same surface)
+        """
+        if scale_mode in SCALE_MODES:
+            self.scale_mode = scale_mode
+        if world_size:
+            self.world_size = tuple(world_size)
+        self.window = window
+        self._configure_target(window)
+
+        if self.world_size == self.base_size:
+            self.world_target = self.target
+        else:
+            self.world_target = pygame.Surface(self.world_size).convert(self.target)
+        return self.target
+
+    def _configure_target(self, window):
+        """Set up the base-resolution target and how it reaches the window"""
+        window_rect = window.get_rect()
+
+        if window_rect.size == self.base_size:
+            # Draw straight to the display
+            self.target = window
+            self.dest_rect = window_rect
+            self.bars = []
+            self._dest = None
+            return
+
+        if self.target is None or self.target is window or self.target.get_size() != self.base_size:
+            self.target = pygame.Surface(self.base_size)
+        # Match the (possibly new) display format so presenting needs no conversion
+        self.target = self.target.convert(window)
+
+        self.dest_rect = pygame.Rect((0, 0), self._get_dest_size(window_rect.size))
+        self.dest_rect.center = window_rect.center
+        self.bars = self._get_bars(window_rect, self.dest_rect)
+
+        if self.dest_rect.size == self.base_size:
+            self._dest = None
+        else:
+            self._dest = window.subsurface(self.dest_rect)
+
+        # smoothscale only handles 24/32-bit surfaces
+        if self.scale_mode == SCALE_MODE_SMOOTH and self.target.get_bitsize() >= 24:
+            self._scale = pygame.transform.smoothscale
+        else:
+            self._scale = pygame.transform.scale
+
+    def upscale_world(self):
+        """Stretch the world target over the target (after drawing the world)"""
+        if self.world_target is not self.target:
+            pygame.transform.scale(self.world_target, self.base_size, self.target)
+
+    def present(self):
+        """Copy this frame's target to the window (before display.flip)"""
+        if self.target is self.window:
+            return
+
+        for bar in self.bars:
+            self.window.fill((0, 0, 0), bar)
+
+        if self._dest is None:
+            self.window.blit(self.target, self.dest_rect)
+        else:
+            self._scale(self.target, self.dest_rect.size, self._dest)
+
+    def window_to_target(self, pos):
+        """
+        Map a window position (e.g. the mouse) to target coordinates
+        Args:
+            pos: (x, y) in window pixels
+        Returns:
+            (x, y) in base-resolution pixels
+        """
+        if self.target is self.window:
+            return pos
+        rect = self.dest_rect
+        return (
+            (pos[0] - rect.x) * self.base_size[0] // rect.width,
+            (pos[1] - rect.y) * self.base_size[1] // rect.height,
+        )
+
+    def _get_dest_size(self, window_size):
+        """Size the target is scaled to inside a window, keeping its aspect"""
+        base_width, base_height = self.base_size
+        window_width, window_height = window_size
+
+        if self.scale_mode == SCALE_MODE_INTEGER:
+            factor = min(window_width // base_width, window_height // base_height)
+            if factor >= 1:
+                return (base_width * factor, base_height * factor)
+            # Window smaller than the base: shrink to fit instead
+
+        factor = min(window_width / base_width, window_height / base_height)
+        return (round(base_width * factor), round(base_height * factor))
+
+    @staticmethod
+    def _get_bars(window_rect, dest_rect):
+        """Get the parts of the window left uncovered by dest_rect"""
+        bars = [
+            pygame.Rect(window_rect.left, window_rect.top, window_rect.width, dest_rect.top - window_rect.top),
+            pygame.Rect(window_rect.left, dest_rect.bottom, window_rect.width, window_rect.bottom - dest_rect.bottom),
+            pygame.Rect(window_rect.left, dest_rect.top, dest_rect.left - window_rect.left, dest_rect.height),
+            pygame.Rect(dest_rect.right, dest_rect.top, window_rect.right - dest_rect.right, dest_rect.height),
+        ]
+        return [bar for bar in bars if bar.width > 0 and bar.height > 0]
@@ -0,0 +1,219 @@
+"""
+Input replays - record per-frame actions and play them back bit-exactly
+
+File layout (little endian):
+    header  magic "PPRP", version u16, seed u64, level u16, character u8,
+            difficulty 8 bytes (ascii, zero padded), run count u32
+    runs    run count x (frames u16, action mask u16)
+
+Each run is a stretch of consecutive frames with the same set of held
+actions, so idle and held-direction stretches cost 4 bytes each.
+"""
+
+import struct
+
+from config import controls
+from core.input import KeyState
+
+REPLAY_MAGIC = b"PPRP"
+REPLAY_VERSION = 1
+
+_HEADER = struct.Struct("<4sHQHB8sI")
+_RUN = struct.Struct("<HH")
+_MAX_RUN = 0xFFFF
+
+# Bit order of the action mask. Append only - reordering breaks old files
+ACTIONS = [
+    ("MOVE_LEFT", controls.MOVE_LEFT),
+    ("MOVE_RIGHT", controls.MOVE_RIGHT),
+    ("MOVE_UP", controls.MOVE_UP),
+    ("MOVE_DOWN", controls.MOVE_DOWN),
+    ("JUMP", controls.JUMP),
+    ("SHOOT", controls.SHOOT),
+    ("MELEE", controls.MELEE),
+    ("UPGRADE_WEAPON", controls.UPGRADE_WEAPON),
+    ("PAUSE", controls.PAUSE),
+    ("SAVE_GAME", controls.SAVE_GAME),
+    ("TOGGLE_CONTROLS", controls.TOGGLE_CONTROLS),
+    ("DEBUG_TOGGLE", controls.DEBUG_TOGGLE),
+]
+
+
+def _playback_keys():
+    """
+    Pick one key per action to press on playback. A key bound to no other
+    action is preferred so replaying one action never fakes another
+    """
+    keys = []
+    for name, bound in ACTIONS:
+        others = {
+            key for other, other_keys in ACTIONS if other != name for key in other_keys
+        }
+        unique = [key for key in bound if key not in others]
+        keys.append(unique[0] if unique else bound[0])
+    return keys
+
+
+PLAYBACK_KEYS = _playback_keys()
+
+
+def encode_actions(keys):
+    """
+    Pack held keys into an action bitmask
+    Args:
+        keys: Key state indexable by pygame key code
+    Returns:
+        int bitmask with bit i set when ACTIONS[i] is held
+    """
+    mask = 0
+    for bit, (_, bound) in enumerate(ACTIONS):
+        if controls.check_key_pressed(keys, bound):
+            mask |= 1 << bit
+    return mask
+
+
+def decode_actions(mask):
+    """Turn an action bitmask back into a key state"""
+    return KeyState(
+        key for bit, key in enumerate(PLAYBACK_KEYS) if mask & (1 << bit)
+    )
+
+
+class Replay:
+    """A recorded run: starting conditions plus one action mask per frame"""
+
+    def __init__(self, seed, level=0, difficulty="NORMAL", character=0, frames=None):
+        """
+        Args:
+            seed: Seed for Game.rng at the start of the run
+            level: Starting level index
+            difficulty: "EASY", "NORMAL" or "HARD"
+            character: Character skin index
+            frames: List of per-frame action masks
+        """
+        self.seed = seed
+        self.level = level
+        self.difficulty = difficulty
+        self.character = character
+        self.frames = frames if frames is not None else []
+
+    def __len__(self):
+        return len(self.frames)
+
+    def get_runs(self):
+        """Run-length encode frames into (count, mask) pairs"""
+        runs = []
+        for mask in self.frames:
+            if runs and runs[-1][1] == mask and runs[-1][0] < _MAX_RUN:
+                runs[-1][0] += 1
+            else:
+                runs.append([1, mask])
+        return runs
+
+    def to_bytes(self):
+        """Serialize to the binary replay format"""
+        runs = self.get_runs()
+        data = [
+            _HEADER.pack(
+                REPLAY_MAGIC,
+                REPLAY_VERSION,
+                self.seed,
+                self.level,
+                self.character,
+                self.difficulty.encode("ascii"),
+                len(runs),
+            )
+        ]
+        data.extend(_RUN.pack(count, mask) for count, mask in runs)
+        return b"".join(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Parse the binary replay format
+        Raises:
+            ValueError: If the data is not a replay this version can read
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Replay data is truncated")
+
+        magic, version, seed, level, character, difficulty, run_count = (
+            _HEADER.unpack_from(data, 0)
+        )
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        if len(data) < _HEADER.size + run_count * _RUN.size:
+            raise ValueError("Replay data is truncated")
+
+        frames = []
+        for count, mask in _RUN.iter_unpack(
+            data[_HEADER.size:_HEADER.size + run_count * _RUN.size]
+        ):
+            frames.extend([mask] * count)
+
+        return cls(
+            seed,
+            level,
+            difficulty.rstrip(b"\0").decode("ascii"),
+            character,
+            frames,
+        )
+
+    def save(self, path):
+        """Write replay to a file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read replay from a file"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """
+    Input source wrapper that records every frame read through it.
+    Use as Game's input_source, then take .replay when done
+    """
+
+    def __init__(self, source, replay):
+        """
+        Args:
+            source: Input source actually producing keys
+            replay: Replay to append frames to (its header describes the run)
+        """
+        self.source = source
+        self.replay = replay
+
+    def get_pressed(self):
+        """Get held keys from the source, keeping only what a replay can store"""
+        mask = encode_actions(self.source.get_pressed())
+        self.replay.frames.append(mask)
+        # Return the decoded state so the live run sees exactly what playback will
+        return decode_actions(mask)
+
+
+class ReplayInput:
+    """Input source that plays back a Replay frame by frame"""
+
+    def __init__(self, replay):
+        """
+        Args:
+            replay: Replay to play
+        """
+        self.replay = replay
+        self.frame = 0
+
+    @property
+    def finished(self):
+        """True once every recorded frame has been played"""
+        return self.frame >= len(self.replay.frames)
+
+    def get_pressed(self):
+        """Get held keys for the next recorded frame (nothing held after the end)"""
+        mask = self.replay.frames[self.frame] if not self.finished else 0
+        self.frame += 1
+        return decode_actions(mask)
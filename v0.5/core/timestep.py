@@ -0,0 +1,85 @@
+"""
+Fixed timestep accumulator - decouples simulation rate from render rate
+"""
+
+from config.settings import FPS, MAX_CATCHUP_STEPS
+
+
+class FixedTimestep:
+    """
+    Turns variable render frame times into a whole number of fixed
+    simulation steps, carrying the remainder over to the next frame
+    """
+
+    def __init__(self, step_rate=FPS, max_steps=MAX_CATCHUP_STEPS):
+        """
+        Args:
+            step_rate: Simulation steps per second
+            max_steps: Most steps run for one frame. Time beyond that is
+                dropped so a slow frame can't snowball into slower ones
+        """
+        self.step_time = 1.0 / step_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """
+        Add elapsed real time and get how many steps to simulate
+        Args:
+            frame_time: Seconds since the previous frame
+        Returns:
+            Number of fixed steps to run this frame
+        """
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.step_time)
+
+        if steps > self.max_steps:
+            # Spiral of death guard - let the game slow down instead
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step_time
+
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step left in the accumulator (0..1), for interpolation"""
+        return min(self.accumulator / self.step_time, 1.0)
+
+    def reset(self):
+        """Drop any accumulated time (e.g. after a long load)"""
+        self.accumulator = 0.0
+
+
+class GameClock:
+    """
+    Simulation clock counted in fixed steps rather than wall time, so
+    anything timed by it replays identically
+    """
+
+    def __init__(self, step_rate=FPS):
+        """
+        Args:
+            step_rate: Simulation steps per second
+        """
+        self.step_rate = step_rate
+        self.frame = 0
+
+    def tick(self):
+        """Advance by one simulation step"""
+        self.frame += 1
+
+    @property
+    def ticks(self):
+        """Elapsed game time in ms (drop-in for pygame.time.get_ticks)"""
+        return self.frame * 1000 // self.step_rate
+
+    def reset(self):
+        """Restart from frame 0"""
+        self.frame = 0
+
+
+def interpolate(previous, current, alpha):
+    """Blend between the previous and current simulated value"""
+    return previous + (current - previous) * alpha
@@ -0,0 +1,92 @@
+"""
+Visibility pass - per-frame sets of level entities inside the camera view
+"""
+
+import pygame
+
+from config.settings import BROADPHASE_CELL_SIZE, VISIBILITY_MARGIN
+from utils.collision import BroadPhase
+
+
+class Visibility:
+    """
+    Works out once per drawn frame which level entities can be on screen,
+    so draw cost follows what is visible rather than level size.
+
+    Entities are indexed when a level loads by the area they can occupy
+    (their activity rect, or their rect for things that never move). Each
+    frame the view is queried and the candidates are confirmed against
+    their current rect.
+    """
+
+    # Level lists drawn through visible sets
+    GROUPS = ("hazards", "coins", "powerups", "keys", "portals", "enemies")
+
+    def __init__(self, margin=VISIBILITY_MARGIN):
+        """
+        Args:
+            margin: Pixels beyond each view edge that still count as visible
+        """
+        self.margin = margin
+        self.index = BroadPhase(BROADPHASE_CELL_SIZE)
+        self.visible = {group: [] for group in self.GROUPS}
+        self.view = pygame.Rect(0, 0, 0, 0)
+        self.level_height = 0
+
+    def bind(self, level):
+        """
+        Index a freshly loaded level
+        Args:
+            level: Level whose entities are drawn
+        """
+        self.level_height = level.height
+        for group in self.GROUPS:
+            self.index.set_group(group, getattr(level, group), self._get_index_rect)
+            self.visible[group] = []
+
+    def add(self, group, entity):
+        """
+        Index an entity game code added to a level list after bind()
+        (e.g. the portal a defeated boss leaves behind)
+        Args:
+            group: One of GROUPS
+            entity: The new entity
+        """
+        self.index.add(group, entity, self._get_index_rect(entity))
+
+    def _get_index_rect(self, entity):
+        """Get the area an entity can occupy while the level is played"""
+        if hasattr(entity, "get_activity_rect"):
+            return entity.get_activity_rect(self.level_height)
+        return entity.get_rect()
+
+    def update(self, camera_x, camera_y, view_width, view_height):
+        """
+        Recompute visible sets for this frame
+        Args:
+            camera_x, camera_y: Camera position used for drawing
+            view_width, view_height: Size of the area drawn
+        """
+        margin = self.margin
+        view = pygame.Rect(
+            int(camera_x) - margin,
+            int(camera_y) - margin,
+            view_width + margin * 2,
+            view_height + margin * 2,
+        )
+        self.view = view
+
+        for group in self.GROUPS:
+            self.visible[group] = [
+                entity
+                for entity in self.index.query(group, view)
+                if view.colliderect(entity.get_rect())
+            ]
+
+    def get_visible(self, group):
+        """Get visible entities of a group, in level order"""
+        return self.visible[group]
+
+    def is_visible(self, rect):
+        """Check a world rect (e.g. of an effect) against this frame's view"""
+        return self.view.colliderect(rect)
@@ -7,6 +7,7 @@ import math
 import pygame
 from config.settings import (CYAN, GRAVITY, MAX_FALL_SPEED, ORANGE, PURPLE,
                              RED, WHITE, YELLOW)
+from ui.fonts import get_font
 
 
 class Boss:
@@ -94,12 +95,12 @@ class Boss:
         }
         return schemes.get(self.type, schemes["guardian"])
 
-    def update(self, player, tiles, current_time):
+    def update(self, player, level, current_time):
         """
         Update boss AI and combat
         Args:
             player: Player object
-            tiles: Level tiles
+            level: Current level
             current_time: Current game time in ms
         """
         if self.dead or self.defeated:
@@ -112,7 +113,7 @@ class Boss:
         self._update_timers()
 
         # Movement AI
-        self._update_movement(player)
+        self._update_movement(player, current_time)
 
         # Attack AI
         self._update_attacks(player, current_time)
@@ -160,16 +161,16 @@ class Boss:
 
         self.attack_timer += 1
 
-    def _update_movement(self, player):
+    def _update_movement(self, player, current_time):
         """Update boss movement patterns"""
         if self.floating:
             # Floating movement pattern
-            self._floating_movement(player)
+            self._floating_movement(player, current_time)
         else:
             # Ground-based movement
             self._ground_movement(player)
 
-    def _floating_movement(self, player):
+    def _floating_movement(self, player, current_time):
         """Floating boss movement (most bosses)"""
         # Move toward player horizontally
         if self.x < player.x - 100:
@@ -182,7 +183,7 @@ class Boss:
         self.x += self.dx
 
         # Sine wave vertical movement
-        self.float_offset = math.sin(pygame.time.get_ticks() / 300) * 30
+        self.float_offset = math.sin(current_time / 300) * 30
         self.y = self.start_y + self.float_offset
 
     def _ground_movement(self, player):
@@ -356,7 +357,7 @@ class Boss:
         )
 
         # Text
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         text = font.render(f"BOSS: {self.health}/{self.max_health}", True, WHITE)
         text_x = bar_x + bar_width // 2 - text.get_width() // 2
         text_y = bar_y + 5
@@ -365,66 +366,3 @@ class Boss:
         # Phase indicator
         phase_text = font.render(f"PHASE {self.phase}/{self.max_phases}", True, YELLOW)
         surface.blit(phase_text, (bar_x + bar_width + 20, bar_y + 5))
-
-
-class BossProjectile:
-    """Projectile fired by boss"""
-
-    def __init__(self, x, y, angle, speed, damage, color):
-        """
-        Args:
-            x, y: Starting position
-            angle: Direction in radians
-            speed: Pixels per frame
-            damage: Damage dealt
-            color: RGB tuple
-        """
-        self.x = x
-        self.y = y
-        self.angle = angle
-        self.speed = speed
-        self.damage = damage
-        self.color = color
-        self.width = 16
-        self.height = 16
-        self.active = True
-        self.lifetime = 300  # 5 seconds
-        self.age = 0
-
-    def update(self, tiles):
-        """Update projectile"""
-        self.x += math.cos(self.angle) * self.speed
-        self.y += math.sin(self.angle) * self.speed
-        self.age += 1
-
-        if self.age >= self.lifetime:
-            self.active = False
-
-        # Check tile collision
-        for tile in tiles:
-            if tile.get("solid", True) and self.get_rect().colliderect(tile["rect"]):
-                self.active = False
-
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def draw(self, surface, camera_x, camera_y):
-        """Render projectile"""
-        screen_x = self.x - camera_x
-        screen_y = self.y - camera_y
-
-        # Glowing projectile
-        pygame.draw.circle(
-            surface,
-            self.color,
-            (int(screen_x + self.width // 2), int(screen_y + self.height // 2)),
-            self.width // 2,
-        )
-        pygame.draw.circle(
-            surface,
-            WHITE,
-            (int(screen_x + self.width // 2), int(screen_y + self.height // 2)),
-            self.width // 2,
-            2,
-        )
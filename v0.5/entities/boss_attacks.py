@@ -6,7 +6,6 @@ import math
 
 import pygame
 from config.settings import RED
-from entities.boss import BossProjectile
 
 
 class BossAttackManager:
@@ -22,7 +21,8 @@ class BossAttackManager:
             player: Player object
             current_time: Current game time
         Returns:
-            List of projectiles/effects created
+            List of effect dicts; "projectile" ones are shots for the
+            boss ProjectilePool, the rest become BossAttackEffects
         """
         attacks = {
             "projectile": BossAttackManager.projectile_single,
@@ -35,6 +35,19 @@ class BossAttackManager:
             return attack_func(boss, player, current_time)
         return []
 
+    @staticmethod
+    def _projectile(x, y, angle, speed, damage, boss):
+        """Describe one boss shot for ProjectilePool.spawn_angled"""
+        return {
+            "type": "projectile",
+            "x": x,
+            "y": y,
+            "angle": angle,
+            "speed": speed,
+            "damage": damage,
+            "color": boss.colors["accent"],
+        }
+
     @staticmethod
     def projectile_single(boss, player, current_time):
         """Fire single projectile at player"""
@@ -45,11 +58,7 @@ class BossAttackManager:
         dy = player.y - spawn_y
         angle = math.atan2(dy, dx)
 
-        projectile = BossProjectile(
-            spawn_x, spawn_y, angle, speed=5, damage=10, color=boss.colors["accent"]
-        )
-
-        return [projectile]
+        return [BossAttackManager._projectile(spawn_x, spawn_y, angle, 5, 10, boss)]
 
     @staticmethod
     def projectile_spread(boss, player, current_time):
@@ -70,10 +79,9 @@ class BossAttackManager:
             offset = (i - count // 2) * (spread / count)
             angle = base_angle + offset
 
-            projectile = BossProjectile(
-                spawn_x, spawn_y, angle, speed=4, damage=8, color=boss.colors["accent"]
+            projectiles.append(
+                BossAttackManager._projectile(spawn_x, spawn_y, angle, 4, 8, boss)
             )
-            projectiles.append(projectile)
 
         return projectiles
 
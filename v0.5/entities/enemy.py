@@ -11,11 +11,17 @@ from config.settings import (CYAN, ENEMY_BASE_DAMAGE, ENEMY_BASE_HEALTH,
                              ENEMY_SHOOT_COOLDOWN, GRAVITY, MAX_FALL_SPEED,
                              ORANGE, RED, WHITE)
 from utils.enums import EnemyType
+from utils.sprites import SpriteCache
 
 
 class Enemy:
     """Enemy entity with AI behavior"""
 
+    # Attributes that change during play, rewound by level snapshots
+    STATE_FIELDS = (
+        "x", "y", "prev_x", "prev_y", "health", "direction", "dy", "dead", "shoot_timer",
+    )
+
     def __init__(self, x, y, enemy_type, patrol_distance=200, audio=None):
         """
         Args:
@@ -27,6 +33,8 @@ class Enemy:
         self.y = y
         self.start_x = x
         self.start_y = y
+        self.prev_x = x  # Position before the last step, for interpolation
+        self.prev_y = y
         self.type = enemy_type
         self.width = 32
         self.height = 32
@@ -46,23 +54,29 @@ class Enemy:
             self.speed = ENEMY_FLYING_SPEED
         else:
             self.speed = 0
+        self._patrol_period = None  # Cached lazily for active-region catch-up
 
         # SFX manager
         self.audio = audio
 
-    def update(self, tiles):
-        """Update enemy AI and movement"""
+    def update(self, level, current_time):
+        """
+        Update enemy AI and movement
+        Args:
+            level: Level providing spatial tile lookups
+            current_time: Current game time in ms
+        """
         if self.dead:
             return
 
         if self.type == EnemyType.GROUND.value:
-            self._update_ground_enemy(tiles)
+            self._update_ground_enemy(level)
         elif self.type == EnemyType.FLYING.value:
-            self._update_flying_enemy()
+            self._update_flying_enemy(current_time)
         elif self.type == EnemyType.TURRET.value:
             self._update_turret()
 
-    def _update_ground_enemy(self, tiles):
+    def _update_ground_enemy(self, level):
         """Update ground patrolling enemy"""
         self.x += self.direction * self.speed
 
@@ -73,19 +87,23 @@ class Enemy:
         # Apply gravity
         self.dy += GRAVITY
         self.dy = min(self.dy, MAX_FALL_SPEED)
-        self.y += self.dy
 
-        # Check ground collision
-        for tile in tiles:
-            if tile.get("solid", True) and self.get_rect().colliderect(tile["rect"]):
-                if self.dy > 0:
-                    self.y = tile["rect"].top - self.height
-                    self.dy = 0
+        # Fall until the floor; a sub-pixel step stops flush on it
+        _, move_y = level.sweep_rect(self.x, self.y, self.width, self.height, 0, self.dy)
+        self.y += move_y
+        if move_y < self.dy:
+            self.dy = 0
+
+        # Walking into a wall steps up onto it
+        for tile in level.get_solid_tiles_in_rect(self.get_rect()):
+            self.y = tile["rect"].top - self.height
+            self.dy = 0
+            break
 
-    def _update_flying_enemy(self):
+    def _update_flying_enemy(self, current_time):
         """Update flying enemy with sine wave pattern"""
         self.x += self.direction * self.speed
-        self.y = self.start_y + math.sin(pygame.time.get_ticks() / 500) * 50
+        self.y = self.start_y + math.sin(current_time / 500) * 50
 
         if abs(self.x - self.start_x) > self.patrol_distance:
             self.direction *= -1
@@ -94,6 +112,65 @@ class Enemy:
         """Update stationary turret enemy"""
         self.shoot_timer += 1
 
+    def save_position(self):
+        """Remember position before a simulation step (for render interpolation)"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def get_activity_rect(self, level_height):
+        """
+        Get the area this enemy can occupy while awake, used to decide
+        whether it is near enough to the camera to simulate
+        """
+        reach = self.patrol_distance + self.speed
+        if self.type == EnemyType.FLYING.value:
+            return pygame.Rect(
+                self.start_x - reach, self.start_y - 50, reach * 2 + self.width, 100 + self.height
+            )
+        if self.type == EnemyType.GROUND.value:
+            # Ground enemies can drop to any floor below their spawn
+            return pygame.Rect(
+                self.start_x - reach, 0, reach * 2 + self.width, max(level_height, self.start_y + self.height)
+            )
+        return self.get_rect()
+
+    def wake(self, frames_asleep):
+        """Catch up after being outside the active region"""
+        # Turrets keep their shoot timers running while asleep
+        if self.type == EnemyType.TURRET.value:
+            self.shoot_timer += frames_asleep
+        elif self.speed:
+            # Patrols are horizontal only; gravity resumes from the new x
+            self._advance_patrol(frames_asleep)
+            self.save_position()
+
+    def _advance_patrol(self, frames):
+        """
+        Move along the patrol route as if updated for a number of frames.
+        The route is periodic, so only the remainder of a full cycle is stepped
+        """
+        if self._patrol_period is None:
+            self._patrol_period = self._find_patrol_period()
+        if self._patrol_period:
+            frames %= self._patrol_period
+
+        for _ in range(frames):
+            self.x += self.direction * self.speed
+            if abs(self.x - self.start_x) > self.patrol_distance:
+                self.direction *= -1
+
+    def _find_patrol_period(self):
+        """Get the patrol cycle length in frames, or 0 if it never repeats"""
+        x, direction = self.x, self.direction
+        limit = 4 * int((self.patrol_distance + self.speed) / self.speed) + 4
+        for step in range(1, limit + 1):
+            x += direction * self.speed
+            if abs(x - self.start_x) > self.patrol_distance:
+                direction *= -1
+            if x == self.x and direction == self.direction:
+                return step
+        return 0
+
     def take_damage(self, damage):
         """Take damage and die if health depletes"""
         self.health -= damage
@@ -118,14 +195,24 @@ class Enemy:
 
     def draw(self, surface, camera_x, camera_y, colorblind_mode=False):
         """Render enemy to screen with distinct patterns"""
-        from utils.textures import TextureManager
-
         if self.dead:
             return
 
         rect = pygame.Rect(
             self.x - camera_x, self.y - camera_y, self.width, self.height
         )
+        sprite = SpriteCache.get_sprite(
+            ("enemy", self.type, self.width, self.height, colorblind_mode),
+            rect.size,
+            lambda target: self._draw_sprite(target, colorblind_mode),
+        )
+        surface.blit(sprite, rect.topleft)
+
+    def _draw_sprite(self, surface, colorblind_mode):
+        """Bake the enemy's pattern, border and eyes filling surface"""
+        from utils.textures import TextureManager
+
+        rect = surface.get_rect()
 
         # Different patterns per enemy type
         if self.type == EnemyType.GROUND.value:
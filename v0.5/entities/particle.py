@@ -4,41 +4,202 @@ Particle effects system
 
 import pygame
 
+from config.settings import PARTICLE_CAPACITY, PARTICLE_GRAVITY
 
-class Particle:
-    """Visual particle effect"""
+# NumPy is optional - without it ParticleSystem falls back to plain lists
+try:
+    import numpy as np
 
-    def __init__(self, x, y, color, dx, dy, lifetime):
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class ParticleSystem:
+    """
+    All particles in one structure-of-arrays store with a fixed capacity.
+    Live particles are packed into slots [0, count); dead ones are replaced
+    by particles moved down from the tail, so nothing is reallocated.
+    Uses NumPy when available for a single vectorized update step
+    """
+
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        """
+        Args:
+            capacity: Max live particles (emits beyond it are dropped)
+        """
+        self.capacity = capacity
+        self.count = 0
+
+        if NUMPY_AVAILABLE:
+            self.x = np.zeros(capacity)
+            self.y = np.zeros(capacity)
+            self.dx = np.zeros(capacity)
+            self.dy = np.zeros(capacity)
+            self.age = np.zeros(capacity, dtype=np.int32)
+            self.lifetime = np.ones(capacity, dtype=np.int32)
+            self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        else:
+            self.x = [0.0] * capacity
+            self.y = [0.0] * capacity
+            self.dx = [0.0] * capacity
+            self.dy = [0.0] * capacity
+            self.age = [0] * capacity
+            self.lifetime = [1] * capacity
+            self.color = [(0, 0, 0)] * capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
+
+    def emit(self, x, y, color, count, spread_x, spread_y, lifetime, rng):
+        """
+        Emit a burst from one point with random velocities
+        Args:
+            x, y: Emit position
+            color: RGB tuple
+            count: Number of particles
+            spread_x, spread_y: Velocities are uniform in [-spread, spread]
+            lifetime: Frames each particle lives
+            rng: random.Random to draw velocities from
+        """
+        dxs = []
+        dys = []
+        for _ in range(count):
+            dxs.append(rng.uniform(-spread_x, spread_x))
+            dys.append(rng.uniform(-spread_y, spread_y))
+        self.emit_batch([x] * count, [y] * count, dxs, dys, color, lifetime)
+
+    def emit_batch(self, xs, ys, dxs, dys, color, lifetime):
         """
+        Emit many particles sharing a color and lifetime
         Args:
-            x, y: Starting position
+            xs, ys: Start positions
+            dxs, dys: Start velocities
             color: RGB tuple
-            dx, dy: Velocity
-            lifetime: Number of frames before particle disappears
+            lifetime: Frames each particle lives
         """
-        self.x = x
-        self.y = y
-        self.color = color
-        self.dx = dx
-        self.dy = dy
-        self.lifetime = lifetime
-        self.age = 0
+        start = self.count
+        n = min(len(xs), self.capacity - start)
+        if n <= 0:
+            return
+        end = start + n
+
+        if NUMPY_AVAILABLE:
+            self.x[start:end] = xs[:n]
+            self.y[start:end] = ys[:n]
+            self.dx[start:end] = dxs[:n]
+            self.dy[start:end] = dys[:n]
+            self.age[start:end] = 0
+            self.lifetime[start:end] = lifetime
+            self.color[start:end] = color
+        else:
+            self.x[start:end] = xs[:n]
+            self.y[start:end] = ys[:n]
+            self.dx[start:end] = dxs[:n]
+            self.dy[start:end] = dys[:n]
+            self.age[start:end] = [0] * n
+            self.lifetime[start:end] = [lifetime] * n
+            self.color[start:end] = [tuple(color)] * n
+
+        self.count = end
 
     def update(self):
-        """Update particle position and age. Returns True if still alive"""
-        self.x += self.dx
-        self.y += self.dy
-        self.dy += 0.3  # Gravity effect
-        self.age += 1
-        return self.age < self.lifetime
+        """Move, age and compact all particles in one step"""
+        if not self.count:
+            return
+        if NUMPY_AVAILABLE:
+            self._update_numpy()
+        else:
+            self._update_lists()
+
+    def _update_numpy(self):
+        """Vectorized update with swap-compaction"""
+        n = self.count
+        x, y, dx, dy = self.x[:n], self.y[:n], self.dx[:n], self.dy[:n]
+        x += dx
+        y += dy
+        dy += PARTICLE_GRAVITY
+        age = self.age[:n]
+        age += 1
+
+        dead = np.flatnonzero(age >= self.lifetime[:n])
+        if not len(dead):
+            return
+
+        # Fill holes below the new count with survivors from above it
+        live_count = n - len(dead)
+        holes = dead[dead < live_count]
+        if len(holes):
+            tail = np.flatnonzero(age[live_count:] < self.lifetime[live_count:n]) + live_count
+            for array in (self.x, self.y, self.dx, self.dy, self.age, self.lifetime, self.color):
+                array[holes] = array[tail]
+        self.count = live_count
+
+    def _update_lists(self):
+        """Plain-Python update with swap-compaction"""
+        x, y, dx, dy = self.x, self.y, self.dx, self.dy
+        age, lifetime, color = self.age, self.lifetime, self.color
+
+        i = 0
+        n = self.count
+        while i < n:
+            x[i] += dx[i]
+            y[i] += dy[i]
+            dy[i] += PARTICLE_GRAVITY
+            age[i] += 1
+            if age[i] < lifetime[i]:
+                i += 1
+                continue
+
+            # Dead: move the last particle here and process it next
+            n -= 1
+            if i < n:
+                last = n
+                # The tail particle hasn't been stepped yet this frame
+                x[i], y[i], dx[i], dy[i] = x[last], y[last], dx[last], dy[last]
+                age[i], lifetime[i], color[i] = age[last], lifetime[last], color[last]
+        self.count = n
 
     def draw(self, surface, camera_x, camera_y):
-        """Render particle to screen"""
-        # Fade out over lifetime
-        alpha = int(255 * (1 - self.age / self.lifetime))
-        size = max(1, 4 - self.age // 5)
+        """Render particles that fall inside the surface, shrinking as they age"""
+        n = self.count
+        if not n:
+            return
+
+        reach = 4  # Largest particle radius
+        view_width, view_height = surface.get_size()
 
-        screen_x = int(self.x - camera_x)
-        screen_y = int(self.y - camera_y)
+        if NUMPY_AVAILABLE:
+            screen_x = (self.x[:n] - camera_x).astype(np.int32)
+            screen_y = (self.y[:n] - camera_y).astype(np.int32)
+            visible = np.flatnonzero(
+                (screen_x >= -reach)
+                & (screen_x < view_width + reach)
+                & (screen_y >= -reach)
+                & (screen_y < view_height + reach)
+            )
+            if not len(visible):
+                return
+            screen_x = screen_x[visible].tolist()
+            screen_y = screen_y[visible].tolist()
+            sizes = np.maximum(1, 4 - self.age[visible] // 5).tolist()
+            colors = [tuple(c) for c in self.color[visible].tolist()]
+        else:
+            screen_x, screen_y, sizes, colors = [], [], [], []
+            for i in range(n):
+                x = int(self.x[i] - camera_x)
+                y = int(self.y[i] - camera_y)
+                if -reach <= x < view_width + reach and -reach <= y < view_height + reach:
+                    screen_x.append(x)
+                    screen_y.append(y)
+                    sizes.append(max(1, 4 - self.age[i] // 5))
+                    colors.append(self.color[i])
 
-        pygame.draw.circle(surface, self.color, (screen_x, screen_y), size)
+        draw_circle = pygame.draw.circle
+        for i in range(len(colors)):
+            draw_circle(surface, colors[i], (screen_x[i], screen_y[i]), sizes[i])
@@ -26,6 +26,8 @@ class Player:
         # Position and physics
         self.x = x
         self.y = y
+        self.prev_x = x  # Position before the last step, for interpolation
+        self.prev_y = y
         self.width = PLAYER_WIDTH
         self.height = PLAYER_HEIGHT
         self.dx = 0
@@ -70,12 +72,12 @@ class Player:
         self.enemies_killed_projectile = 0
         self.enemies_killed_melee = 0
 
-    def update(self, keys, tiles, hazards):
+    def update(self, keys, level, hazards):
         """
         Update player state
         Args:
             keys: Pygame key state
-            tiles: List of tile dictionaries
+            level: Level providing spatial tile lookups
             hazards: List of hazard objects
         """
         # Handle power-up timers
@@ -94,10 +96,9 @@ class Player:
 
         # Update position with collision
         self.x += self.dx
-        self._check_collision_x(tiles)
+        self._check_collision_x(level)
 
-        self.y += self.dy
-        self._check_collision_y(tiles)
+        self._move_y(level)
 
         # Check hazards
         if not self.invincible:
@@ -142,38 +143,53 @@ class Player:
             if abs(self.dx) < 0.1:
                 self.dx = 0
 
-    def _check_collision_x(self, tiles):
+    def _check_collision_x(self, level):
         """Check and resolve horizontal collisions"""
         self.on_wall = False
         player_rect = self.get_rect()
 
-        for tile in tiles:
-            if tile.get("solid", True) and player_rect.colliderect(tile["rect"]):
-                if self.dx > 0:
-                    self.x = tile["rect"].left - self.width
-                    self.on_wall = True
-                    self.wall_direction = 1
-                elif self.dx < 0:
-                    self.x = tile["rect"].right
-                    self.on_wall = True
-                    self.wall_direction = -1
-                self.dx = 0
+        for tile in level.get_solid_tiles_in_rect(player_rect):
+            if self.dx > 0:
+                self.x = tile["rect"].left - self.width
+                self.on_wall = True
+                self.wall_direction = 1
+            elif self.dx < 0:
+                self.x = tile["rect"].right
+                self.on_wall = True
+                self.wall_direction = -1
+            self.dx = 0
+
+    def _move_y(self, level):
+        """
+        Move vertically. Falls are swept through the level, so a sub-pixel
+        step lands flush on the floor instead of sinking into it first
+        """
+        if self.dy > 0:
+            _, move_y = level.sweep_rect(self.x, self.y, self.width, self.height, 0, self.dy)
+            if move_y < self.dy:
+                self.y += move_y
+                self.dy = 0
+                self.on_ground = True
+                self.jump_count = 0
+                return
 
-    def _check_collision_y(self, tiles):
+        self.y += self.dy
+        self._check_collision_y(level)
+
+    def _check_collision_y(self, level):
         """Check and resolve vertical collisions"""
         self.on_ground = False
         player_rect = self.get_rect()
 
-        for tile in tiles:
-            if tile.get("solid", True) and player_rect.colliderect(tile["rect"]):
-                if self.dy > 0:
-                    self.y = tile["rect"].top - self.height
-                    self.dy = 0
-                    self.on_ground = True
-                    self.jump_count = 0
-                elif self.dy < 0:
-                    self.y = tile["rect"].bottom
-                    self.dy = 0
+        for tile in level.get_solid_tiles_in_rect(player_rect):
+            if self.dy > 0:
+                self.y = tile["rect"].top - self.height
+                self.dy = 0
+                self.on_ground = True
+                self.jump_count = 0
+            elif self.dy < 0:
+                self.y = tile["rect"].bottom
+                self.dy = 0
 
     def _check_hazard_collision(self, hazards):
         """Check collision with hazards"""
@@ -266,6 +282,7 @@ class Player:
         self.dy = 0
         self.invincible = True
         self.invincible_timer = 120
+        self.save_position()  # Don't interpolate across the teleport
 
     def add_powerup(self, ptype):
         """Apply power-up effect"""
@@ -294,6 +311,11 @@ class Player:
                 return True
         return False
 
+    def save_position(self):
+        """Remember position before a simulation step (for render interpolation)"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+
     def get_rect(self):
         """Get collision rectangle"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
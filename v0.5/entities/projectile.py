@@ -1,75 +1,400 @@
 """
-Projectile entity
+Projectile storage - pooled, array-backed shots for player, turrets and bosses
 """
 
-import pygame
 import math
 
-from config.settings import WHITE
+import pygame
+
+from config.settings import (
+    PROJECTILE_CAPACITY,
+    PROJECTILE_LIFETIME,
+    PROJECTILE_SIZE,
+    WHITE,
+)
+from utils.collision import SolidityGrid
+
+# NumPy is optional - without it ProjectilePool falls back to plain lists
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
-class Projectile:
-    """Projectile fired by player or enemies"""
+class ProjectilePool:
+    """
+    Fixed-capacity store of same-sized shots in structure-of-arrays form.
+    Live shots are packed into slots [0, count) in firing order; dead ones
+    are squeezed out once per update, keeping that order so hit resolution
+    matches the order shots were fired. Velocities are precomputed on spawn
+    so straight and angled shots integrate with the same vectorized add.
+    """
 
-    def __init__(self, x, y, direction, speed, damage, color, angle=None):
+    # Owners
+    PLAYER = 0
+    ENEMY = 1
+
+    # Shapes
+    RECT = "rect"  # Filled bar with a white border
+    ORB = "orb"  # Glowing circle
+
+    def __init__(
+        self,
+        capacity=PROJECTILE_CAPACITY,
+        size=PROJECTILE_SIZE,
+        lifetime=PROJECTILE_LIFETIME,
+        shape=RECT,
+    ):
         """
         Args:
-            x, y: Starting position
-            direction: 1 for right, -1 for left (used if angle is None)
-            speed: Pixels per frame
+            capacity: Max live shots (spawns beyond it are dropped)
+            size: (width, height) of every shot in pixels
+            lifetime: Frames a shot lives before expiring
+            shape: RECT or ORB, how shots are drawn
+        """
+        self.capacity = capacity
+        self.width, self.height = size
+        self.lifetime = lifetime
+        self.shape = shape
+        self.count = 0
+
+        # Solid tile bounds of the last tile list tested, for exact vectorized tests
+        self._tile_list = None
+        self._tile_bounds = None
+
+        if NUMPY_AVAILABLE:
+            self.x = np.zeros(capacity)
+            self.y = np.zeros(capacity)
+            self.prev_x = np.zeros(capacity)
+            self.prev_y = np.zeros(capacity)
+            self.vx = np.zeros(capacity)
+            self.vy = np.zeros(capacity)
+            self.age = np.zeros(capacity, dtype=np.int32)
+            self.damage = np.zeros(capacity, dtype=np.int32)
+            self.owner = np.zeros(capacity, dtype=np.int8)
+            self.alive = np.zeros(capacity, dtype=bool)
+            self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        else:
+            self.x = [0.0] * capacity
+            self.y = [0.0] * capacity
+            self.prev_x = [0.0] * capacity
+            self.prev_y = [0.0] * capacity
+            self.vx = [0.0] * capacity
+            self.vy = [0.0] * capacity
+            self.age = [0] * capacity
+            self.damage = [0] * capacity
+            self.owner = [0] * capacity
+            self.alive = [False] * capacity
+            self.color = [(0, 0, 0)] * capacity
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove all shots"""
+        self.count = 0
+
+    def spawn(self, x, y, vx, vy, damage, color, owner=PLAYER):
+        """
+        Fire a shot
+        Args:
+            x, y: Top-left start position
+            vx, vy: Velocity in pixels per frame
             damage: Damage dealt on hit
             color: RGB tuple
-            angle: Optional angle in radians for aimed shots (turrets, bosses)
-        """
-        self.x = x
-        self.y = y
-        self.direction = direction
-        self.speed = speed
-        self.damage = damage
-        self.color = color
-        self.angle = angle  # NEW - for angled shots
-        self.width = 12
-        self.height = 6
-        self.active = True
-
-        # Add lifetime to prevent projectiles from living forever
-        self.lifetime = 180  # 3 seconds at 60 FPS
-        self.age = 0
-
-    def update(self, tiles):
-        """Update projectile position and check tile collision"""
-        # Age tracking
-        self.age += 1
-        if self.age >= self.lifetime:
-            self.active = False
-            return
+            owner: PLAYER or ENEMY (only ENEMY shots hurt the player; both
+                hit enemies and the boss)
+        Returns:
+            Slot index, or -1 if the pool is full
+        """
+        slot = self.count
+        if slot >= self.capacity:
+            return -1
+
+        self.x[slot] = self.prev_x[slot] = x
+        self.y[slot] = self.prev_y[slot] = y
+        self.vx[slot] = vx
+        self.vy[slot] = vy
+        self.age[slot] = 0
+        self.damage[slot] = damage
+        self.owner[slot] = owner
+        self.alive[slot] = True
+        self.color[slot] = tuple(color)
+        self.count = slot + 1
+        return slot
+
+    def spawn_angled(self, x, y, angle, speed, damage, color, owner=PLAYER):
+        """
+        Fire a shot along an angle
+        Args:
+            angle: Direction in radians
+            speed: Pixels per frame
+            (other args as spawn)
+        """
+        return self.spawn(
+            x, y, math.cos(angle) * speed, math.sin(angle) * speed, damage, color, owner
+        )
+
+    def is_alive(self, slot):
+        """Check whether a slot still holds a live shot this frame"""
+        return bool(self.alive[slot])
 
-        # Movement - check if angled or horizontal
-        if self.angle is not None:
-            # Angle-based movement (for turrets and bosses)
-            self.x += math.cos(self.angle) * self.speed
-            self.y += math.sin(self.angle) * self.speed
+    def kill(self, slot):
+        """Remove a shot (its slot is reclaimed on the next update)"""
+        self.alive[slot] = False
+
+    def get_rect(self, slot):
+        """Get collision rectangle of one shot"""
+        return pygame.Rect(self.x[slot], self.y[slot], self.width, self.height)
+
+    def save_positions(self):
+        """Remember positions before a simulation step (for render interpolation)"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def update(self, level):
+        """
+        Age, move and tile-test every shot, then compact the survivors.
+        A shot that reaches its lifetime expires without moving
+        Args:
+            level: Level providing the solidity grid and exact tile lookups
+        """
+        if not self.count:
+            return
+        if NUMPY_AVAILABLE:
+            self._update_numpy(level)
         else:
-            # Horizontal movement (for player)
-            self.x += self.direction * self.speed
+            self._update_lists(level)
 
-        # Check collision with solid tiles
-        for tile in tiles:
-            if tile.get("solid", True) and self.get_rect().colliderect(tile["rect"]):
-                self.active = False
-                return
+    def _update_numpy(self, level):
+        """Vectorized update"""
+        n = self.count
+        alive = self.alive[:n]
+        age = self.age[:n]
+        age += 1
+        alive &= age < self.lifetime
 
-    def get_rect(self):
-        """Get collision rectangle"""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
 
-    def draw(self, surface, camera_x, camera_y):
-        """Render projectile to screen"""
-        rect = pygame.Rect(
-            self.x - camera_x, self.y - camera_y, self.width, self.height
-        )
+        live = np.flatnonzero(alive)
+        if len(live):
+            alive[live[self._solid_mask(level, live)]] = False
+
+        keep = np.flatnonzero(alive)
+        if len(keep) < n:
+            for array in (
+                self.x, self.y, self.prev_x, self.prev_y, self.vx, self.vy,
+                self.age, self.damage, self.owner, self.alive, self.color,
+            ):
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
+
+    def _solid_mask(self, level, slots):
+        """
+        Test shots against level tiles. Each shot is looked up in the
+        solidity grid; only shots touching PARTIAL cells need exact tests
+        Args:
+            level: Level to test against
+            slots: Index array of live slots
+        Returns:
+            Bool array, True where the shot overlaps a solid tile
+        """
+        grid = level.solid_grid
+        size = grid.cell_size
+        left = self.x[slots].astype(np.int64)  # Truncates like pygame.Rect
+        top = self.y[slots].astype(np.int64)
+
+        if self.width > size or self.height > size:
+            # Shots spanning more than two cells per axis: exact tests only
+            return np.array(
+                [level.solid_in_rect(self.get_rect(slot)) for slot in slots.tolist()],
+                dtype=bool,
+            )
+
+        # Shots no bigger than a cell touch at most 2x2 cells
+        cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.rows, grid.cols)
+        columns = (left // size, (left + self.width - 1) // size)
+        rows = (top // size, (top + self.height - 1) // size)
+        state = np.zeros(len(slots), dtype=np.uint8)
+        for cy in rows:
+            for cx in columns:
+                inside = (cx >= 0) & (cx < grid.cols) & (cy >= 0) & (cy < grid.rows)
+                values = np.full(len(slots), grid.outside_state, dtype=np.uint8)
+                values[inside] = cells[cy[inside], cx[inside]]
+                np.maximum(state, values, out=state)
+
+        solid = state == SolidityGrid.FULL
+        partial = np.flatnonzero(state == SolidityGrid.PARTIAL)
+        if len(partial):
+            # Exact test of the few shots near tile edges against every solid tile
+            lefts, tops, rights, bottoms = self._get_tile_bounds(level)
+            px = left[partial, None]
+            py = top[partial, None]
+            overlap = (
+                (px < rights)
+                & (px + self.width > lefts)
+                & (py < bottoms)
+                & (py + self.height > tops)
+            )
+            solid[partial] = overlap.any(axis=1)
+        return solid
+
+    def _get_tile_bounds(self, level):
+        """Get (lefts, tops, rights, bottoms) arrays of the level's solid tiles"""
+        # Streamed levels swap in a new tile list whenever chunks change
+        if self._tile_list is not level.tiles:
+            rects = [tile["rect"] for tile in level.tiles if tile["solid"]]
+            self._tile_bounds = tuple(
+                np.array([getattr(rect, side) for rect in rects], dtype=np.int64)
+                for side in ("left", "top", "right", "bottom")
+            )
+            self._tile_list = level.tiles
+        return self._tile_bounds
+
+    def _update_lists(self, level):
+        """Plain-Python update"""
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        age, alive = self.age, self.alive
+
+        write = 0
+        for i in range(self.count):
+            age[i] += 1
+            if not alive[i] or age[i] >= self.lifetime:
+                continue
+            x[i] += vx[i]
+            y[i] += vy[i]
+            if level.solid_in_rect(pygame.Rect(x[i], y[i], self.width, self.height)):
+                continue
+
+            # Survivor: pack it down, keeping firing order
+            if write != i:
+                for array in (
+                    x, y, self.prev_x, self.prev_y, vx, vy,
+                    age, self.damage, self.owner, self.color,
+                ):
+                    array[write] = array[i]
+                alive[write] = True
+            write += 1
+        self.count = write
+
+    def _live_slots(self, owner=None):
+        """Get live slots (optionally of one owner) in firing order"""
+        n = self.count
+        if NUMPY_AVAILABLE:
+            mask = self.alive[:n].copy()
+            if owner is not None:
+                mask &= self.owner[:n] == owner
+            return np.flatnonzero(mask).tolist()
+        return [
+            i
+            for i in range(n)
+            if self.alive[i] and (owner is None or self.owner[i] == owner)
+        ]
+
+    def hits_rect(self, rect, owner=None):
+        """
+        Get live shots overlapping a rectangle
+        Args:
+            rect: pygame.Rect to test (e.g. the player or boss)
+            owner: Only consider shots of this owner (None for all)
+        Returns:
+            List of slot indexes in firing order
+        """
+        n = self.count
+        if not n:
+            return []
+
+        if NUMPY_AVAILABLE:
+            left = self.x[:n].astype(np.int64)
+            top = self.y[:n].astype(np.int64)
+            mask = (
+                self.alive[:n]
+                & (left < rect.right)
+                & (left + self.width > rect.left)
+                & (top < rect.bottom)
+                & (top + self.height > rect.top)
+            )
+            if owner is not None:
+                mask &= self.owner[:n] == owner
+            return np.flatnonzero(mask).tolist()
+
+        return [
+            slot
+            for slot in self._live_slots(owner)
+            if rect.colliderect(self.get_rect(slot))
+        ]
 
-        # Draw filled rectangle
-        pygame.draw.rect(surface, self.color, rect)
-        # Draw white border
-        pygame.draw.rect(surface, WHITE, rect, 1)
+    def hits_group(self, broadphase, group, owner=None):
+        """
+        Get (slot, target) pairs of shots overlapping members of a
+        broad-phase group, confirmed with an exact rect test
+        Args:
+            broadphase: BroadPhase holding the target group
+            group: Group name (members expose get_rect())
+            owner: Only consider shots of this owner (None for all)
+        Returns:
+            List of (slot, target) ordered by slot, then registration order
+        """
+        pairs = []
+        for slot in self._live_slots(owner):
+            rect = self.get_rect(slot)
+            for target in broadphase.query(group, rect):
+                if rect.colliderect(target.get_rect()):
+                    pairs.append((slot, target))
+        return pairs
+
+    def draw(self, surface, camera_x, camera_y, alpha=1.0):
+        """
+        Render shots that fall inside the surface
+        Args:
+            surface: Surface to draw on
+            camera_x, camera_y: Camera offset
+            alpha: Fraction of a step elapsed since the last update (0..1)
+        """
+        n = self.count
+        if not n:
+            return
+
+        width, height = self.width, self.height
+        view_width, view_height = surface.get_size()
+
+        if NUMPY_AVAILABLE:
+            screen_x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha - camera_x
+            screen_y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha - camera_y
+            visible = np.flatnonzero(
+                (screen_x > -width)
+                & (screen_x < view_width)
+                & (screen_y > -height)
+                & (screen_y < view_height)
+            )
+            if not len(visible):
+                return
+            screen_x = screen_x[visible].tolist()
+            screen_y = screen_y[visible].tolist()
+            colors = [tuple(c) for c in self.color[visible].tolist()]
+        else:
+            screen_x, screen_y, colors = [], [], []
+            for i in range(n):
+                x = self.prev_x[i] + (self.x[i] - self.prev_x[i]) * alpha - camera_x
+                y = self.prev_y[i] + (self.y[i] - self.prev_y[i]) * alpha - camera_y
+                if -width < x < view_width and -height < y < view_height:
+                    screen_x.append(x)
+                    screen_y.append(y)
+                    colors.append(self.color[i])
+
+        if self.shape == self.ORB:
+            radius = width // 2
+            for i in range(len(colors)):
+                center = (int(screen_x[i] + width // 2), int(screen_y[i] + height // 2))
+                pygame.draw.circle(surface, colors[i], center, radius)
+                pygame.draw.circle(surface, WHITE, center, radius, 2)
+        else:
+            for i in range(len(colors)):
+                rect = pygame.Rect(screen_x[i], screen_y[i], width, height)
+                pygame.draw.rect(surface, colors[i], rect)
+                pygame.draw.rect(surface, WHITE, rect, 1)
@@ -0,0 +1,456 @@
+"""
+Level lint and optimizer
+Run from the project folder:
+
+    python level_lint.py                          # Act 1 levels and levels/data/*.json
+    python level_lint.py levels/data/cave.json    # Only these editor files
+    python level_lint.py --out optimized          # Also write optimized copies
+    python level_lint.py --verbose                # List every finding
+
+Every level is checked for data that costs simulation or draw time without
+adding anything to play: repeated and hidden tiles, duplicate entities,
+pickups inside solid geometry, spikes the loader has to snap out of the
+ground, entities the player can never reach and chunks much busier than
+the rest of the level. The exit status is 1 when any problem was found;
+notes (partial tile overlaps, density hotspots) do not count.
+
+Optimized levels are written as editor JSON (level_<n>.json for Act 1
+levels, the same file name for editor files). They drop tiles hidden under
+later-drawn tiles and have spikes snapped as LevelLoader does. Everything
+else is kept as authored, so the optimized level plays and draws the same.
+"""
+
+import argparse
+import copy
+import glob
+import json
+import math
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from config.settings import (LEVELS_DIR, PLAYER_HEIGHT, PLAYER_WIDTH,
+                             STATIC_CHUNK_SIZE, TILE_INDEX_CELL_SIZE, TILE_SIZE)
+from levels.level import Level
+from levels.level_compiler import get_records
+from levels.level_loader import LevelLoader
+from utils.collision import SpatialHash
+
+ENTITY_GROUPS = ("enemies", "hazards", "coins", "powerups", "keys", "portals")
+PICKUP_GROUPS = ("coins", "powerups", "keys")  # Pointless inside solid tiles
+TOUCH_GROUPS = ("coins", "powerups", "keys", "portals")  # The player has to reach these
+
+REACH_CELL = 4  # Pixel size of the reachability grid
+REACH_HEADROOM = PLAYER_HEIGHT * 2  # Nothing stops the player above the level, so it can go over walls
+DENSITY_FACTOR = 3.0  # Chunks this many times busier than the level's average are hotspots
+DENSITY_MIN_OBJECTS = 24  # ...if they hold at least this many objects
+EXAMPLE_LIMIT = 5  # Findings listed per category without --verbose
+
+
+class LevelReport:
+    """Findings for one level, grouped by category"""
+
+    def __init__(self, name):
+        """
+        Args:
+            name: Label printed for the level
+        """
+        self.name = name
+        self.problems = {}  # Category -> list of (x, y, detail)
+        self.notes = {}
+        self.summary = []  # Extra lines printed under the findings
+
+    def add(self, category, x, y, detail="", note=False):
+        """Record one finding at a world position"""
+        findings = self.notes if note else self.problems
+        findings.setdefault(category, []).append((x, y, detail))
+
+    def print(self, limit):
+        """
+        Print the report
+        Args:
+            limit: Findings listed per category (None lists all)
+        """
+        status = "✗" if self.problems else "✓"
+        print(f"\n{status} {self.name}")
+        for label, findings in (("", self.problems), ("note: ", self.notes)):
+            for category, entries in findings.items():
+                print(f"  {label}{category}: {len(entries)}")
+                for x, y, detail in entries[:limit]:
+                    print(f"      at ({x}, {y}) {detail}".rstrip())
+                if limit is not None and len(entries) > limit:
+                    print(f"      ... {len(entries) - limit} more")
+        for line in self.summary:
+            print(f"  {line}")
+
+
+def is_covered(rect, covers):
+    """
+    Check whether the union of some rects covers a rect completely
+    Args:
+        rect: pygame.Rect to test
+        covers: Rects that may cover it
+    """
+    covers = [other for other in covers if other.colliderect(rect)]
+    if not covers:
+        return False
+
+    # Split the rect along every edge inside it; each piece is then either
+    # fully inside or fully outside every cover
+    xs = sorted({rect.left, rect.right}.union(
+        x for other in covers for x in (other.left, other.right) if rect.left < x < rect.right
+    ))
+    ys = sorted({rect.top, rect.bottom}.union(
+        y for other in covers for y in (other.top, other.bottom) if rect.top < y < rect.bottom
+    ))
+    return all(
+        any(other.collidepoint(x, y) for other in covers)
+        for x in xs[:-1]
+        for y in ys[:-1]
+    )
+
+
+def find_hidden_tiles(tiles):
+    """
+    Find tiles that add nothing to the level: every pixel is drawn over by
+    later tiles and, for solid tiles, every pixel is solid in a later tile
+    Args:
+        tiles: Tile records (see levels.level_compiler.get_records)
+    Returns:
+        Set of indices into tiles
+    """
+    rects = [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y, *_ in tiles]
+    index = SpatialHash(TILE_INDEX_CELL_SIZE)
+    hidden = set()
+
+    # Back to front, so only tiles that stay are candidates to cover
+    for order in range(len(tiles) - 1, -1, -1):
+        rect = rects[order]
+        solid = tiles[order][3]
+        covers = [
+            rects[other]
+            for other in index.query(rect)
+            if tiles[other][3] or not solid
+        ]
+        if is_covered(rect, covers):
+            hidden.add(order)
+        else:
+            index.insert(order, rect)
+    return hidden
+
+
+class Reachability:
+    """
+    Where the player can get to from the spawn point.
+
+    The level is divided into REACH_CELL squares, one bit per square in a
+    Python int per row. A position is open when the player's box fits there
+    without touching a solid tile, and reachable when it connects to the
+    spawn through open positions. The grid starts REACH_HEADROOM above the
+    level. Jump height is not modelled, so this finds entities in sealed
+    pockets or buried in geometry, not jumps that are merely too hard.
+    """
+
+    def __init__(self, width, height, solid_rects, spawn):
+        """
+        Args:
+            width, height: Level size in pixels
+            solid_rects: Rects of every solid tile
+            spawn: Player (x, y) at the start of the level
+        """
+        cell = REACH_CELL
+        self.columns = columns = math.ceil(width / cell)
+        self.rows = rows = math.ceil((height + REACH_HEADROOM) / cell)
+
+        blocked = [0] * rows
+        for rect in solid_rects:
+            cells = self._cell_range(rect)
+            if cells is None:
+                continue
+            x0, y0, x1, y1 = cells
+            mask = ((1 << (x1 - x0 + 1)) - 1) << x0
+            for y in range(y0, y1 + 1):
+                blocked[y] |= mask
+
+        # Bit x of open_rows[y]: the player's box fits with its top-left
+        # corner in cell (x, y)
+        box_w = math.ceil(PLAYER_WIDTH / cell)
+        box_h = math.ceil(PLAYER_HEIGHT / cell)
+        in_bounds = (1 << max(columns - box_w + 1, 0)) - 1
+        self.open_rows = []
+        for y in range(rows):
+            if y + box_h > rows:
+                self.open_rows.append(0)
+                continue
+            column_blocked = 0
+            for row in blocked[y:y + box_h]:
+                column_blocked |= row
+            box_blocked = 0
+            for shift in range(box_w):
+                box_blocked |= column_blocked >> shift
+            self.open_rows.append(~box_blocked & in_bounds)
+
+        start = self._find_start(spawn[0] // cell, (spawn[1] + REACH_HEADROOM) // cell)
+        self.spawn_open = start is not None
+        reached = self._flood(start) if start is not None else [0] * rows
+
+        # Cells any reachable box overlaps
+        spread = []
+        for row in reached:
+            covered = 0
+            for shift in range(box_w):
+                covered |= row << shift
+            spread.append(covered)
+        self.touched = []
+        for y in range(rows):
+            covered = 0
+            for row in spread[max(y - box_h + 1, 0):y + 1]:
+                covered |= row
+            self.touched.append(covered)
+
+    def _cell_range(self, rect):
+        """Get inclusive grid cells (x0, y0, x1, y1) a world rect covers, or None if off the grid"""
+        cell = REACH_CELL
+        x0 = max(rect.left // cell, 0)
+        x1 = min((rect.right - 1) // cell, self.columns - 1)
+        y0 = max((rect.top + REACH_HEADROOM) // cell, 0)
+        y1 = min((rect.bottom - 1 + REACH_HEADROOM) // cell, self.rows - 1)
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0, y0, x1, y1
+
+    def _find_start(self, x, y):
+        """Get the open cell nearest the spawn, within a tile of it"""
+        reach = math.ceil(TILE_SIZE / REACH_CELL)
+        candidates = sorted(
+            (abs(dx) + abs(dy), x + dx, y + dy)
+            for dx in range(-reach, reach + 1)
+            for dy in range(-reach, reach + 1)
+        )
+        for _, cx, cy in candidates:
+            if 0 <= cy < self.rows and cx >= 0 and self.open_rows[cy] >> cx & 1:
+                return cx, cy
+        return None
+
+    def _fill_row(self, seed, open_row):
+        """Spread seed bits left and right through the open bits of one row"""
+        result = seed
+        for direction in (1, -1):
+            gen = seed
+            pro = open_row
+            shift = 1
+            while shift < self.columns:
+                if direction > 0:
+                    gen |= pro & (gen << shift)
+                    pro &= pro << shift
+                else:
+                    gen |= pro & (gen >> shift)
+                    pro &= pro >> shift
+                shift *= 2
+            result |= gen
+        return result
+
+    def _flood(self, start):
+        """Get reachable rows (bit masks) from a start cell"""
+        open_rows = self.open_rows
+        reached = [0] * self.rows
+        x, y = start
+        reached[y] = self._fill_row(1 << x, open_rows[y])
+
+        changed = True
+        while changed:
+            changed = False
+            sweeps = (range(1, self.rows), range(self.rows - 2, -1, -1))
+            for sweep, step in zip(sweeps, (-1, 1)):
+                for y in sweep:
+                    new = reached[y + step] & open_rows[y] & ~reached[y]
+                    if new:
+                        reached[y] = self._fill_row(reached[y] | new, open_rows[y])
+                        changed = True
+        return reached
+
+    def can_touch(self, rect):
+        """Check whether the player can overlap a world rect"""
+        cells = self._cell_range(rect)
+        if cells is None:
+            return False
+        x0, y0, x1, y1 = cells
+        mask = ((1 << (x1 - x0 + 1)) - 1) << x0
+        return any(self.touched[y] & mask for y in range(y0, y1 + 1))
+
+
+def lint_level(name, level_data, chunk_size=STATIC_CHUNK_SIZE):
+    """
+    Check one level and build its optimized copy
+    Args:
+        name: Label for the report
+        level_data: Level data dictionary as authored (spikes not snapped)
+        chunk_size: Side of the square chunks density is measured in
+    Returns:
+        (LevelReport, optimized level data dictionary)
+    """
+    report = LevelReport(name)
+    bounds = pygame.Rect(0, 0, level_data["width"], level_data["height"])
+
+    # Spikes LevelLoader would move out of the ground
+    fixed = LevelLoader.fix_spike_positions(copy.deepcopy(level_data))
+    for before, after in zip(level_data.get("hazards", []), fixed.get("hazards", [])):
+        if before.get("y") != after.get("y"):
+            report.add("spikes in ground", before["x"], before["y"], f"snapped to y={after['y']}")
+
+    # Tiles
+    tiles = get_records(fixed, "tiles")
+    rects = [pygame.Rect(x, y, TILE_SIZE, TILE_SIZE) for x, y, *_ in tiles]
+    by_position = {}
+    for order, record in enumerate(tiles):
+        by_position.setdefault(record[:2], []).append(order)
+
+    outside = {order for order, rect in enumerate(rects) if not rect.colliderect(bounds)}
+    hidden = find_hidden_tiles(tiles)
+    for order, (x, y, tile_type, solid, color) in enumerate(tiles):
+        if order in outside:
+            report.add("tiles outside level", x, y)
+            continue
+        later = [other for other in by_position[(x, y)] if other > order]
+        if any(tiles[other] == tiles[order] for other in later):
+            report.add("duplicate tiles", x, y)
+        elif later:
+            report.add("conflicting tiles", x, y, f"{tile_type} under {tiles[later[-1]][2]}")
+        elif order in hidden:
+            report.add("hidden tiles", x, y, "covered by later tiles")
+
+    overlap_index = SpatialHash(TILE_INDEX_CELL_SIZE)
+    for order, rect in enumerate(rects):
+        overlap_index.insert(order, rect)
+    for order, rect in enumerate(rects):
+        if order in hidden or order in outside:
+            continue
+        if any(
+            other != order and other not in hidden and rect.colliderect(rects[other])
+            and rect != rects[other]
+            for other in overlap_index.query(rect)
+        ):
+            report.add("partial tile overlaps", rect.x, rect.y, "blocks tile merging", note=True)
+
+    solid_index = SpatialHash(TILE_INDEX_CELL_SIZE)
+    solid_rects = [rect for rect, record in zip(rects, tiles) if record[3]]
+    for rect in solid_rects:
+        solid_index.insert(rect, rect)
+
+    # Entities, with the sizes the game gives them
+    level = Level(fixed, merge_tiles=False, streaming=False)
+    reach = Reachability(bounds.width, bounds.height, solid_rects, (level.spawn_x, level.spawn_y))
+    if not reach.spawn_open:
+        report.add("blocked spawn", level.spawn_x, level.spawn_y, "no room for the player")
+
+    entity_rects = []
+    for group in ENTITY_GROUPS:
+        seen = set()
+        for record, entity in zip(get_records(fixed, group), getattr(level, group)):
+            rect = entity.get_rect()
+            entity_rects.append((group, rect))
+            x, y = record[0], record[1]
+            key = repr(record)
+            if key in seen:
+                report.add("duplicate entities", x, y, group)
+            seen.add(key)
+
+            if not rect.colliderect(bounds):
+                report.add("entities outside level", x, y, group)
+                continue
+            solid_near = [other for other in solid_index.query(rect) if other.colliderect(rect)]
+            if solid_near and is_covered(rect, solid_near):
+                report.add("buried entities", x, y, group)
+            elif solid_near and group in PICKUP_GROUPS:
+                report.add("pickups in solid", x, y, group)
+            elif group in TOUCH_GROUPS and reach.spawn_open and not reach.can_touch(rect):
+                report.add("unreachable entities", x, y, group)
+
+    # Density per chunk, by where each object's center falls
+    chunks = {}
+    objects = [("tiles", rect) for order, rect in enumerate(rects) if order not in outside]
+    objects.extend(entity_rects)
+    for group, rect in objects:
+        key = (rect.centerx // chunk_size, rect.centery // chunk_size)
+        counts = chunks.setdefault(key, {})
+        counts[group] = counts.get(group, 0) + 1
+    if chunks:
+        totals = {key: sum(counts.values()) for key, counts in chunks.items()}
+        average = sum(totals.values()) / len(totals)
+        for (cx, cy), total in sorted(totals.items()):
+            if total >= DENSITY_MIN_OBJECTS and total >= average * DENSITY_FACTOR:
+                breakdown = ", ".join(f"{count} {group}" for group, count in chunks[(cx, cy)].items())
+                report.add(
+                    "density hotspots", cx * chunk_size, cy * chunk_size,
+                    f"{total} objects ({breakdown}), level average {average:.1f}", note=True,
+                )
+
+    # Optimized copy: as authored, minus hidden tiles, spikes snapped.
+    # Tiles outside the level stay, the player is not kept inside it
+    optimized = fixed
+    optimized["tiles"] = [tile for order, tile in enumerate(fixed["tiles"]) if order not in hidden]
+    report.summary.append(f"optimized: {len(tiles)} -> {len(optimized['tiles'])} tiles")
+    return report, optimized
+
+
+def load_levels(paths):
+    """
+    Load the levels to lint
+    Args:
+        paths: Editor JSON files; none means the Act 1 levels and every
+            file in LEVELS_DIR
+    Returns:
+        List of (name, output file name, level data dictionary)
+    """
+    levels = []
+    if not paths:
+        for index, level_data in enumerate(LevelLoader.create_default_levels(fix_spikes=False)):
+            levels.append((f"Act 1 level {index}", f"level_{index}.json", level_data))
+        paths = sorted(glob.glob(os.path.join(LEVELS_DIR, "*.json")))
+
+    for path in paths:
+        with open(path) as f:
+            levels.append((path, os.path.basename(path), json.load(f)))
+    return levels
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Level lint and optimizer")
+    parser.add_argument("paths", nargs="*", help="Editor level JSON files (default: Act 1 and levels/data)")
+    parser.add_argument("--out", help="Folder to write optimized level JSON to")
+    parser.add_argument(
+        "--chunk-size", type=int, default=STATIC_CHUNK_SIZE,
+        help=f"Chunk side for density hotspots in pixels (default {STATIC_CHUNK_SIZE})",
+    )
+    parser.add_argument("--verbose", action="store_true", help="List every finding")
+    args = parser.parse_args()
+    for path in args.paths:
+        if not os.path.isfile(path):
+            parser.error(f"no such level file: {path}")
+
+    problems = 0
+    for name, filename, level_data in load_levels(args.paths):
+        report, optimized = lint_level(name, level_data, args.chunk_size)
+        report.print(None if args.verbose else EXAMPLE_LIMIT)
+        problems += sum(len(entries) for entries in report.problems.values())
+
+        if args.out:
+            os.makedirs(args.out, exist_ok=True)
+            filepath = os.path.join(args.out, filename)
+            with open(filepath, "w") as f:
+                json.dump(optimized, f, indent=2)
+            print(f"  written to {filepath}")
+
+    if problems:
+        print(f"\n✗ {problems} problem(s)")
+        sys.exit(1)
+    print("\n✓ No problems")
+
+
+if __name__ == "__main__":
+    main()
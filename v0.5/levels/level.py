@@ -2,91 +2,475 @@
 Level class for managing level data
 """
 
+import math
+from collections import OrderedDict
+
 import pygame
 
-from config.settings import THEME_TILE_COLORS, TILE_SIZE
+from config.settings import (BROADPHASE_CELL_SIZE, LEVEL_STREAMING_MIN_WIDTH,
+                             MERGE_LEVEL_TILES, STATIC_CHUNK_CACHE_SIZE,
+                             STATIC_CHUNK_SIZE, THEME_TILE_COLORS,
+                             TILE_INDEX_CELL_SIZE, TILE_SIZE)
 from entities.enemy import Enemy
+from levels.level_compiler import CompiledLevel, get_records
+from levels.level_snapshot import LevelSnapshot
+from levels.level_streaming import LevelStreamer
 from objects.collectibles import Coin, Key, PowerUp
 from objects.hazards import Hazard
 from objects.portal import Portal
+from utils.collision import BroadPhase, SolidityGrid, SpatialHash
 from utils.enums import Theme
+from utils.textures import COLORKEY, TextureManager
 
 
 class Level:
     """Level containing all game objects"""
 
-    def __init__(self, level_data):
+    def __init__(self, level_data, merge_tiles=MERGE_LEVEL_TILES, streaming=None):
         """
         Args:
-            level_data: Dictionary containing level configuration
+            level_data: Dictionary containing level configuration, or a
+                CompiledLevel read from the level artifact
+            merge_tiles: Merge adjacent solid tiles into larger rects
+            streaming: Keep only chunks near the camera loaded (see stream());
+                None streams levels at least LEVEL_STREAMING_MIN_WIDTH wide
         """
+        self.merge_tiles = merge_tiles
         self.width = level_data["width"]
         self.height = level_data["height"]
         self.theme = Theme[level_data.get("theme", "SCIFI")]
         self.spawn_x = level_data.get("spawn_x", 100)
         self.spawn_y = level_data.get("spawn_y", 500)
 
-        # Create all level objects from data
-        self.tiles = self._create_tiles(level_data["tiles"])
-        self.enemies = self._create_enemies(level_data.get("enemies", []))
-        self.hazards = self._create_hazards(level_data.get("hazards", []))
-        self.coins = self._create_coins(level_data.get("coins", []))
-        self.powerups = self._create_powerups(level_data.get("powerups", []))
-        self.keys = self._create_keys(level_data.get("keys", []))
-        self.portals = self._create_portals(level_data.get("portals", []))
+        # Create all level objects from normalized records, unpacked
+        # straight from the artifact for compiled levels
+        if isinstance(level_data, CompiledLevel):
+            records = level_data.get_records
+        else:
+            records = lambda table: get_records(level_data, table)
+
+        tiles = self._create_tiles(records("tiles"))
+        if streaming is None:
+            streaming = self.width >= LEVEL_STREAMING_MIN_WIDTH
+
+        if streaming:
+            # Everything starts unloaded; stream() fills the lists
+            self.tiles = []
+            for group in LevelStreamer.GROUPS:
+                setattr(self, group, [])
+            self.streamer = LevelStreamer(
+                self, tiles, {group: records(group) for group in LevelStreamer.GROUPS}
+            )
+        else:
+            self.streamer = None
+            self.tiles = tiles
+            for group in LevelStreamer.GROUPS:
+                setattr(self, group, self.create_entities(group, records(group)))
+        self.rebuild_indexes()
+
+        # Tiles pre-rendered into STATIC_CHUNK_SIZE squares on first draw
+        self.static_chunks = OrderedDict()  # (cx, cy) -> Surface or None if empty
+        self.static_colorblind_mode = None
+
+        # Entity state as built, for reset() (streamed levels rebuild chunks instead)
+        self.initial_state = LevelSnapshot(self) if self.streamer is None else None
+
+    def rebuild_indexes(self):
+        """Index the tiles and pickups in the level's lists (again, after streaming)"""
+        self.tile_index = self._build_tile_index(self.tiles)
+
+        # Pickups never move, so their broad-phase groups are only rebuilt
+        # when the loaded set changes
+        self.pickup_index = BroadPhase(BROADPHASE_CELL_SIZE)
+        self.pickup_index.set_group("coins", self.coins)
+        self.pickup_index.set_group("powerups", self.powerups)
+        self.pickup_index.set_group("keys", self.keys)
+
+    def stream(self, areas, frame=0, tracker=None):
+        """
+        Load and unload chunks of a streamed level (no-op otherwise)
+        Args:
+            areas: World rects that need the level around them
+            frame: Current game frame
+            tracker: ActiveRegion to hand (un)loaded entities to
+        Returns:
+            True if the tiles or entity lists changed
+        """
+        if self.streamer is None:
+            return False
+        return self.streamer.update(areas, frame, tracker)
+
+    def get_coin_total(self):
+        """Get the value of every coin in the level, loaded or not"""
+        if self.streamer is not None:
+            return sum(value for _, _, value in self.streamer.records["coins"])
+        return sum(coin.value for coin in self.coins)
 
-    def _create_tiles(self, tile_data):
-        """Create tile list from data with textures"""
-        from utils.textures import TextureManager
+    def get_portal_destinations(self):
+        """Get the level indices the level's portals lead to, loaded or not"""
+        if self.streamer is not None:
+            return [record[2] for record in self.streamer.records["portals"]]
+        return [portal.destination for portal in self.portals]
 
+    def _create_tiles(self, tile_records):
+        """Create tile list from (x, y, type, solid, color) records"""
         tiles = []
         default_color = THEME_TILE_COLORS.get(self.theme.name, (100, 100, 100))
+        self.solid_grid = SolidityGrid(self.width, self.height, TILE_SIZE)
 
-        for tile in tile_data:
+        for x, y, tile_type, solid, color in tile_records:
             tile_dict = {
-                "rect": pygame.Rect(tile["x"], tile["y"], TILE_SIZE, TILE_SIZE),
-                "type": tile.get("type", "ground"),
-                "solid": tile.get("solid", True),
-                "color": tuple(tile.get("color", default_color)),
+                "rect": pygame.Rect(x, y, TILE_SIZE, TILE_SIZE),
+                "type": tile_type,
+                "solid": solid,
+                "color": color if color is not None else tuple(default_color),
                 "theme": self.theme.name,  # Add theme for drawing
             }
             tiles.append(tile_dict)
 
+        if self.merge_tiles:
+            tiles = self._merge_tiles(tiles)
+
+        for tile_dict in tiles:
+            if tile_dict["solid"]:
+                self.solid_grid.mark(tile_dict["rect"])
+
         return tiles
 
-    def _create_enemies(self, enemy_data):
-        """Create enemy list from data"""
+    def _merge_tiles(self, tiles):
+        """
+        Compile tiles into fewer, larger rects.
+        Exact duplicates are dropped, then solid tiles sharing type and color
+        are joined into horizontal runs and runs of equal span are stacked
+        vertically. Tiles that partially overlap others are left alone.
+        Merged rects stay a whole number of TILE_SIZE cells so drawing can
+        still texture them one cell at a time.
+        Returns:
+            New tile list, ordered by each rect's first source tile
+        """
+        # Drop exact duplicates. The last copy is the one drawn on top, so
+        # it keeps its source position
+        unique = {}
+        for order, tile in enumerate(tiles):
+            rect = tile["rect"]
+            key = (
+                rect.x, rect.y, rect.width, rect.height,
+                tile["type"], tile["solid"], tile["color"],
+            )
+            unique.pop(key, None)
+            unique[key] = (order, tile)
+
+        # Tiles that partially overlap another tile keep their own rect so
+        # the draw order between them (and so the final picture) is unchanged
+        overlap_index = SpatialHash(TILE_INDEX_CELL_SIZE)
+        for entry in unique.values():
+            overlap_index.insert(entry, entry[1]["rect"])
+        overlapping = set()
+        for order, tile in unique.values():
+            for other_order, other in overlap_index.query(tile["rect"]):
+                if other_order != order and tile["rect"].colliderect(other["rect"]):
+                    overlapping.add(order)
+                    break
+
+        groups = {}
+        merged = []
+        for order, tile in unique.values():
+            if tile["solid"] and order not in overlapping:
+                group = (tile["type"], tile["color"], tile["theme"])
+                groups.setdefault(group, []).append((order, tile))
+            else:
+                merged.append((order, tile))
+
+        for (tile_type, color, theme), members in groups.items():
+            # Horizontal runs: same row, each tile starting where the last ended
+            rows = {}
+            for order, tile in members:
+                rect = tile["rect"]
+                rows.setdefault((rect.y, rect.height), []).append((rect.x, order, rect))
+
+            runs = []
+            for (y, height), row in rows.items():
+                row.sort()
+                start_x, first, rect = row[0]
+                end_x = rect.right
+                for x, order, rect in row[1:]:
+                    if x == end_x:
+                        end_x = rect.right
+                        first = min(first, order)
+                    else:
+                        runs.append((start_x, end_x - start_x, y, height, first))
+                        start_x, end_x, first = x, rect.right, order
+                runs.append((start_x, end_x - start_x, y, height, first))
+
+            # Vertical stacking: runs with identical x span that touch
+            columns = {}
+            for x, width, y, height, first in runs:
+                columns.setdefault((x, width), []).append((y, height, first))
+
+            for (x, width), column in columns.items():
+                column.sort()
+                top, height, first = column[0]
+                bottom = top + height
+                for y, run_height, order in column[1:]:
+                    if y == bottom:
+                        bottom = y + run_height
+                        first = min(first, order)
+                    else:
+                        merged.append((first, self._make_tile(x, top, width, bottom - top, tile_type, color, theme)))
+                        top, bottom, first = y, y + run_height, order
+                merged.append((first, self._make_tile(x, top, width, bottom - top, tile_type, color, theme)))
+
+        merged.sort(key=lambda entry: entry[0])
+        return [tile for _, tile in merged]
+
+    def _make_tile(self, x, y, width, height, tile_type, color, theme):
+        """Create a solid tile dictionary covering a merged rect"""
+        return {
+            "rect": pygame.Rect(x, y, width, height),
+            "type": tile_type,
+            "solid": True,
+            "color": color,
+            "theme": theme,
+        }
+
+    def _build_tile_index(self, tiles):
+        """Bucket tiles into a spatial hash once so lookups skip far tiles"""
+        index = SpatialHash(TILE_INDEX_CELL_SIZE)
+        for tile in tiles:
+            index.insert(tile, tile["rect"])
+        return index
+
+    def get_tiles_in_rect(self, rect):
+        """
+        Get tiles overlapping a rectangle
+        Args:
+            rect: pygame.Rect in world coordinates
+        Returns:
+            List of tile dictionaries in level order
+        """
+        return [
+            tile
+            for tile in self.tile_index.query(rect)
+            if rect.colliderect(tile["rect"])
+        ]
+
+    def get_solid_tiles_in_rect(self, rect):
+        """
+        Get solid tiles overlapping a rectangle. Answers from the solidity
+        grid alone when the rectangle only covers empty cells
+        """
+        if self.solid_grid.max_state(rect) == SolidityGrid.EMPTY:
+            return []
+        return [tile for tile in self.get_tiles_in_rect(rect) if tile["solid"]]
+
+    def is_solid(self, cx, cy):
+        """
+        Check whether any solid geometry touches a grid cell
+        Args:
+            cx, cy: Cell coordinates (pixels // TILE_SIZE)
+        """
+        return self.solid_grid.get(cx, cy) != SolidityGrid.EMPTY
+
+    def solid_in_rect(self, rect):
+        """Check whether a rectangle overlaps any solid tile"""
+        state = self.solid_grid.max_state(rect)
+        if state == SolidityGrid.EMPTY:
+            return False
+        if state == SolidityGrid.FULL:
+            return True
+        return any(tile["solid"] for tile in self.get_tiles_in_rect(rect))
+
+    def sweep_rect(self, x, y, width, height, dx, dy):
+        """
+        Move a box through solid tiles, x axis first then y. Positions and
+        distances may be fractional; the box stops flush against the first
+        tile in its way. Tiles the box already overlaps don't block, like
+        the resolve-after-move checks the entities use
+        Args:
+            x, y: Top-left of the box in pixels
+            width, height: Box size in pixels
+            dx, dy: Requested movement in pixels
+        Returns:
+            (move_x, move_y) distances that can be travelled before contact
+        """
+        move_x = self._sweep_axis(x, y, width, height, dx, horizontal=True)
+        move_y = self._sweep_axis(x + move_x, y, width, height, dy, horizontal=False)
+        return move_x, move_y
+
+    def _sweep_axis(self, x, y, width, height, distance, horizontal):
+        """Clamp movement along one axis against the first blocking tile"""
+        if distance == 0:
+            return 0
+
+        left, top, right, bottom = x, y, x + width, y + height
+        if horizontal:
+            sweep_left, sweep_right = min(left, left + distance), max(right, right + distance)
+            sweep_top, sweep_bottom = top, bottom
+        else:
+            sweep_left, sweep_right = left, right
+            sweep_top, sweep_bottom = min(top, top + distance), max(bottom, bottom + distance)
+
+        # Round outward so a sub-pixel step still reaches the next tile
+        swept_left = math.floor(sweep_left)
+        swept_top = math.floor(sweep_top)
+        swept = pygame.Rect(
+            swept_left,
+            swept_top,
+            math.ceil(sweep_right) - swept_left,
+            math.ceil(sweep_bottom) - swept_top,
+        )
+        if not self.solid_in_rect(swept):
+            return distance
+
+        # Only tiles across the box's path and wholly ahead of it block
+        for tile in self.get_solid_tiles_in_rect(swept):
+            tile_rect = tile["rect"]
+            if horizontal:
+                if tile_rect.top >= bottom or tile_rect.bottom <= top:
+                    continue
+                if distance > 0 and tile_rect.left >= right:
+                    distance = min(distance, tile_rect.left - right)
+                elif distance < 0 and tile_rect.right <= left:
+                    distance = max(distance, tile_rect.right - left)
+            else:
+                if tile_rect.left >= right or tile_rect.right <= left:
+                    continue
+                if distance > 0 and tile_rect.top >= bottom:
+                    distance = min(distance, tile_rect.top - bottom)
+                elif distance < 0 and tile_rect.bottom <= top:
+                    distance = max(distance, tile_rect.bottom - top)
+        return distance
+
+    def create_entities(self, group, group_records):
+        """
+        Create the entities of one group from records
+        Args:
+            group: "enemies", "hazards", "coins", "powerups", "keys" or "portals"
+            group_records: Record tuples of that group
+        Returns:
+            List of entities in record order
+        """
+        return getattr(self, "_create_" + group)(group_records)
+
+    def _create_enemies(self, enemy_records):
+        """Create enemy list from (x, y, type, patrol) records"""
+        return [Enemy(x, y, enemy_type, patrol) for x, y, enemy_type, patrol in enemy_records]
+
+    def _create_hazards(self, hazard_records):
+        """Create hazard list from (x, y, type, width, height) records"""
         return [
-            Enemy(e["x"], e["y"], e["type"], e.get("patrol", 200)) for e in enemy_data
+            Hazard(x, y, hazard_type, width, height)
+            for x, y, hazard_type, width, height in hazard_records
         ]
 
-    def _create_hazards(self, hazard_data):
-        """Create hazard list from data"""
+    def _create_coins(self, coin_records):
+        """Create coin list from (x, y, value) records"""
+        return [Coin(x, y, value) for x, y, value in coin_records]
+
+    def _create_powerups(self, powerup_records):
+        """Create power-up list from (x, y, type) records"""
+        return [PowerUp(x, y, powerup_type) for x, y, powerup_type in powerup_records]
+
+    def _create_keys(self, key_records):
+        """Create key list from (x, y, color) records"""
+        return [Key(x, y, color) for x, y, color in key_records]
+
+    def _create_portals(self, portal_records):
+        """Create portal list from (x, y, dest, color, required keys) records"""
         return [
-            Hazard(h["x"], h["y"], h["type"], h.get("width", 32), h.get("height", 32))
-            for h in hazard_data
+            Portal(x, y, dest, color, keys) for x, y, dest, color, keys in portal_records
         ]
 
-    def _create_coins(self, coin_data):
-        """Create coin list from data"""
-        return [Coin(c["x"], c["y"], c.get("value", 1)) for c in coin_data]
+    def draw_static(self, surface, camera_x, camera_y, view_width, view_height, colorblind_mode=False):
+        """
+        Draw the level's tiles by blitting the pre-rendered chunks the view
+        overlaps, so the cost depends on the view size, not the tile count
+        Args:
+            surface: Surface to draw on
+            camera_x, camera_y: Camera offset
+            view_width, view_height: Size of the visible area
+            colorblind_mode: Draw tile patterns (chunks re-render on change)
+        """
+        if colorblind_mode != self.static_colorblind_mode:
+            self.static_chunks.clear()
+            self.static_colorblind_mode = colorblind_mode
+
+        size = STATIC_CHUNK_SIZE
+        first_cx = int(camera_x // size)
+        last_cx = int((camera_x + view_width - 1) // size)
+        first_cy = int(camera_y // size)
+        last_cy = int((camera_y + view_height - 1) // size)
 
-    def _create_powerups(self, powerup_data):
-        """Create power-up list from data"""
-        return [PowerUp(p["x"], p["y"], p["type"]) for p in powerup_data]
+        # Floor keeps every chunk on the same pixel grid as its neighbours
+        origin_x = math.floor(-camera_x)
+        origin_y = math.floor(-camera_y)
 
-    def _create_keys(self, key_data):
-        """Create key list from data"""
-        return [Key(k["x"], k["y"], tuple(k["color"])) for k in key_data]
+        blits = []
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                chunk = self._get_static_chunk(cx, cy)
+                if chunk:
+                    blits.append((chunk, (origin_x + cx * size, origin_y + cy * size)))
+        surface.blits(blits, doreturn=False)
 
-    def _create_portals(self, portal_data):
-        """Create portal list from data"""
-        portals = []
-        for p in portal_data:
-            color = tuple(p["color"]) if "color" in p else None
-            keys = p.get("required_keys", [])
-            portals.append(Portal(p["x"], p["y"], p["dest"], color, keys))
-        return portals
+    def _get_static_chunk(self, cx, cy):
+        """Get a rendered chunk from the LRU cache, rendering it if missing"""
+        chunks = self.static_chunks
+        key = (cx, cy)
+        if key in chunks:
+            chunks.move_to_end(key)
+            return chunks[key]
+
+        chunk = self._render_static_chunk(cx, cy)
+        chunks[key] = chunk
+        if len(chunks) > STATIC_CHUNK_CACHE_SIZE:
+            chunks.popitem(last=False)
+        return chunk
+
+    def _render_static_chunk(self, cx, cy):
+        """
+        Render every tile cell overlapping one chunk
+        Returns:
+            Colorkeyed Surface, or None when the chunk holds no tiles
+        """
+        size = STATIC_CHUNK_SIZE
+        bounds = pygame.Rect(cx * size, cy * size, size, size)
+        tiles = self.get_tiles_in_rect(bounds)
+        if not tiles:
+            return None
+
+        chunk = pygame.Surface((size, size))
+        chunk.fill(COLORKEY)
+
+        # Merged tiles are drawn one TILE_SIZE cell at a time so they
+        # look exactly like the tiles they were built from
+        blits = []
+        for tile in tiles:
+            texture = TextureManager.get_tile_texture(
+                tile["theme"], tile["color"], TILE_SIZE, self.static_colorblind_mode
+            )
+            tile_rect = tile["rect"]
+            visible = tile_rect.clip(bounds)
+            first_col = (visible.left - tile_rect.left) // TILE_SIZE
+            last_col = (visible.right - 1 - tile_rect.left) // TILE_SIZE
+            first_row = (visible.top - tile_rect.top) // TILE_SIZE
+            last_row = (visible.bottom - 1 - tile_rect.top) // TILE_SIZE
+
+            for row in range(first_row, last_row + 1):
+                for col in range(first_col, last_col + 1):
+                    blits.append((
+                        texture,
+                        (
+                            tile_rect.left + col * TILE_SIZE - bounds.left,
+                            tile_rect.top + row * TILE_SIZE - bounds.top,
+                        ),
+                    ))
+        chunk.blits(blits, doreturn=False)
+
+        if pygame.display.get_surface():
+            chunk = chunk.convert()
+        chunk.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return chunk
 
     def get_background_color(self):
         """Get background color for this theme"""
@@ -95,17 +479,13 @@ class Level:
         return THEME_BACKGROUNDS.get(self.theme.name, (0, 0, 0))
 
     def reset(self):
-        """Reset level state (respawn collectibles, etc.)"""
-        from config.settings import ENEMY_BASE_HEALTH
-
-        for coin in self.coins:
-            coin.collected = False
-        for powerup in self.powerups:
-            powerup.collected = False
-        for key in self.keys:
-            key.collected = False
-        for enemy in self.enemies:
-            enemy.dead = False
-            enemy.health = ENEMY_BASE_HEALTH
-            enemy.x = enemy.start_x
-            enemy.y = enemy.start_y
+        """
+        Reset level state to how it was built (respawn collectibles and
+        enemies, rewind hazards and portals). Tiles and their rendered
+        chunks are kept, so this is much cheaper than building a new Level.
+        A streamed level unloads everything, to be streamed in fresh
+        """
+        if self.streamer is not None:
+            self.streamer.reset()
+        else:
+            self.initial_state.restore()
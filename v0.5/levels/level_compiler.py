@@ -0,0 +1,403 @@
+"""
+Level compiler - packs level data into a compact binary artifact
+
+The artifact holds every level of a set as fixed-size record tables (tiles,
+enemies, hazards, coins, power-ups, keys, portals) behind a small header with
+a content hash of the sources it was built from. The loader memory-maps it,
+so starting the game reads records straight from the file instead of
+building the source dictionaries, and only recompiles when the hash changes.
+
+Layout (little-endian):
+    file header     magic, format version, content hash, level count
+    offset table    (offset, length) of each level block
+    level block     meta length, meta JSON, then the record tables
+
+The meta JSON carries the scalar fields (width, theme, time_limit...), the
+string table that type ids index into and where each record table starts.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b"LVLC"
+FORMAT_VERSION = 1
+
+FILE_HEADER = struct.Struct("<4sH32sI")  # magic, version, content hash, level count
+OFFSET_ENTRY = struct.Struct("<II")  # level block offset, length
+META_LENGTH = struct.Struct("<I")
+
+# Record layouts. Type names are ids into the level's string table; colors
+# carry a flag so "no color" keeps meaning "use the default"
+RECORDS = {
+    "tiles": struct.Struct("<iiHBBBBB"),  # x, y, type, solid, has color, r, g, b
+    "enemies": struct.Struct("<iiHi"),  # x, y, type, patrol
+    "hazards": struct.Struct("<iiHii"),  # x, y, type, width, height
+    "coins": struct.Struct("<iii"),  # x, y, value
+    "powerups": struct.Struct("<iiH"),  # x, y, type
+    "keys": struct.Struct("<iiBBB"),  # x, y, r, g, b
+    "portals": struct.Struct("<iiiBBBBII"),  # x, y, dest, has color, r, g, b, first key, key count
+    "portal_keys": struct.Struct("<BBB"),  # r, g, b of each required key
+}
+
+# Fields stored as records; everything else at the top level goes into meta
+TABLE_FIELDS = ("tiles", "enemies", "hazards", "coins", "powerups", "keys", "portals")
+
+
+class LevelCompileError(ValueError):
+    """Raised when level data does not fit the packed record layouts"""
+
+
+def get_records(level_data, table):
+    """
+    Read one table of a level dictionary as normalized record tuples,
+    with defaults filled in the way Level applies them
+    Args:
+        level_data: Level data dictionary
+        table: One of TABLE_FIELDS
+    Returns:
+        List of tuples:
+            tiles     (x, y, type, solid, color or None)
+            enemies   (x, y, type, patrol)
+            hazards   (x, y, type, width, height)
+            coins     (x, y, value)
+            powerups  (x, y, type)
+            keys      (x, y, color)
+            portals   (x, y, dest, color or None, required key colors)
+    """
+    entries = level_data.get(table, []) if table != "tiles" else level_data["tiles"]
+
+    if table == "tiles":
+        return [
+            (
+                t["x"], t["y"], t.get("type", "ground"), t.get("solid", True),
+                tuple(t["color"]) if "color" in t else None,
+            )
+            for t in entries
+        ]
+    if table == "enemies":
+        return [(e["x"], e["y"], e["type"], e.get("patrol", 200)) for e in entries]
+    if table == "hazards":
+        return [
+            (h["x"], h["y"], h["type"], h.get("width", 32), h.get("height", 32))
+            for h in entries
+        ]
+    if table == "coins":
+        return [(c["x"], c["y"], c.get("value", 1)) for c in entries]
+    if table == "powerups":
+        return [(p["x"], p["y"], p["type"]) for p in entries]
+    if table == "keys":
+        return [(k["x"], k["y"], tuple(k["color"])) for k in entries]
+    if table == "portals":
+        return [
+            (
+                p["x"], p["y"], p["dest"],
+                tuple(p["color"]) if "color" in p else None,
+                [tuple(color) for color in p.get("required_keys", [])],
+            )
+            for p in entries
+        ]
+    raise KeyError(table)
+
+
+def get_source_hash(source_paths, extra=()):
+    """
+    Hash the files a level set is built from
+    Args:
+        source_paths: Paths of the source modules (read as bytes)
+        extra: Further values folded into the hash (e.g. TILE_SIZE)
+    Returns:
+        32-byte sha256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(b"%d" % FORMAT_VERSION)
+    for path in source_paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    for value in extra:
+        digest.update(repr(value).encode("utf-8"))
+    return digest.digest()
+
+
+def compile_levels(levels, content_hash):
+    """
+    Pack a list of level dictionaries into artifact bytes
+    Args:
+        levels: Level data dictionaries
+        content_hash: 32-byte digest of the sources (see get_source_hash)
+    Returns:
+        bytes of the whole artifact
+    Raises:
+        LevelCompileError: When a value does not fit its record field
+    """
+    blocks = [_compile_level(index, level) for index, level in enumerate(levels)]
+
+    offset = FILE_HEADER.size + OFFSET_ENTRY.size * len(blocks)
+    parts = [FILE_HEADER.pack(MAGIC, FORMAT_VERSION, content_hash, len(blocks))]
+    for block in blocks:
+        parts.append(OFFSET_ENTRY.pack(offset, len(block)))
+        offset += len(block)
+    parts.extend(blocks)
+    return b"".join(parts)
+
+
+def _compile_level(index, level_data):
+    """Pack one level into a block: meta JSON followed by its record tables"""
+    strings = []
+    string_ids = {}
+
+    def string_id(name):
+        if name not in string_ids:
+            string_ids[name] = len(strings)
+            strings.append(name)
+        return string_ids[name]
+
+    def color_fields(color):
+        return (1, *color) if color is not None else (0, 0, 0, 0)
+
+    rows = {
+        "tiles": [
+            (x, y, string_id(tile_type), bool(solid), *color_fields(color))
+            for x, y, tile_type, solid, color in get_records(level_data, "tiles")
+        ],
+        "enemies": [
+            (x, y, string_id(enemy_type), patrol)
+            for x, y, enemy_type, patrol in get_records(level_data, "enemies")
+        ],
+        "hazards": [
+            (x, y, string_id(hazard_type), width, height)
+            for x, y, hazard_type, width, height in get_records(level_data, "hazards")
+        ],
+        "coins": get_records(level_data, "coins"),
+        "powerups": [
+            (x, y, string_id(powerup_type))
+            for x, y, powerup_type in get_records(level_data, "powerups")
+        ],
+        "keys": [(x, y, *color) for x, y, color in get_records(level_data, "keys")],
+        "portals": [],
+        "portal_keys": [],
+    }
+    for x, y, dest, color, required_keys in get_records(level_data, "portals"):
+        rows["portals"].append(
+            (x, y, dest, *color_fields(color), len(rows["portal_keys"]), len(required_keys))
+        )
+        rows["portal_keys"].extend(required_keys)
+
+    tables = {}
+    packed = []
+    offset = 0
+    for table, record in RECORDS.items():
+        try:
+            data = b"".join(record.pack(*row) for row in rows[table])
+        except struct.error as e:
+            raise LevelCompileError(f"Level {index} {table}: {e}") from e
+        tables[table] = [offset, len(rows[table])]
+        packed.append(data)
+        offset += len(data)
+
+    meta = {
+        key: value for key, value in level_data.items() if key not in TABLE_FIELDS
+    }
+    meta["strings"] = strings
+    meta["tables"] = tables
+    try:
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    except TypeError as e:
+        raise LevelCompileError(f"Level {index} meta: {e}") from e
+
+    return META_LENGTH.pack(len(meta_bytes)) + meta_bytes + b"".join(packed)
+
+
+def write_artifact(path, data):
+    """Write artifact bytes, replacing any old file in one step"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+
+def read_content_hash(path):
+    """
+    Get the content hash stored in an artifact
+    Returns:
+        32-byte digest, or None if the file is missing or not an artifact
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(FILE_HEADER.size)
+    except OSError:
+        return None
+    if len(header) < FILE_HEADER.size:
+        return None
+    magic, version, content_hash, _ = FILE_HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return content_hash
+
+
+class CompiledLevels:
+    """
+    Read-only sequence of the levels in an artifact. Level blocks are
+    sliced out of the (memory-mapped) buffer and decoded on access.
+    """
+
+    def __init__(self, buffer):
+        """
+        Args:
+            buffer: Artifact bytes or mmap (kept open while levels are read)
+        """
+        magic, version, content_hash, count = FILE_HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise LevelCompileError("Not a compiled level artifact of this version")
+        offsets = [
+            OFFSET_ENTRY.unpack_from(buffer, FILE_HEADER.size + i * OFFSET_ENTRY.size)
+            for i in range(count)
+        ]
+        if any(offset + length > len(buffer) for offset, length in offsets):
+            raise LevelCompileError("Compiled level artifact is truncated")
+
+        self.content_hash = content_hash
+        self._buffer = memoryview(buffer)
+        self._offsets = offsets
+
+    @classmethod
+    def open(cls, path):
+        """
+        Memory-map an artifact file
+        Args:
+            path: Artifact path
+        Returns:
+            CompiledLevels reading from the mapping
+        """
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapping)
+        except (LevelCompileError, struct.error):
+            mapping.close()
+            raise
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        offset, length = self._offsets[index]
+        return CompiledLevel(self._buffer[offset:offset + length])
+
+
+class CompiledLevel:
+    """
+    One level of an artifact. Scalar fields read like a level dictionary
+    (level["width"], level.get("theme")); record tables are read with
+    get_records(), which yields the same tuples as the module function
+    does for a dictionary.
+    """
+
+    def __init__(self, block):
+        """
+        Args:
+            block: memoryview of the level block
+        """
+        (meta_length,) = META_LENGTH.unpack_from(block, 0)
+        start = META_LENGTH.size
+        self.meta = json.loads(bytes(block[start:start + meta_length]))
+        self._tables = block[start + meta_length:]
+        self._strings = self.meta.pop("strings")
+        self._table_offsets = self.meta.pop("tables")
+
+    def __getitem__(self, key):
+        return self.meta[key]
+
+    def __contains__(self, key):
+        return key in self.meta
+
+    def get(self, key, default=None):
+        """Get a scalar field, like dict.get"""
+        return self.meta.get(key, default)
+
+    def _iter_rows(self, table):
+        """Unpack the raw rows of one record table"""
+        offset, count = self._table_offsets[table]
+        record = RECORDS[table]
+        return record.iter_unpack(self._tables[offset:offset + count * record.size])
+
+    def get_records(self, table):
+        """
+        Read one record table
+        Args:
+            table: One of TABLE_FIELDS
+        Returns:
+            List of tuples in the layout documented on get_records()
+        """
+        strings = self._strings
+
+        if table == "tiles":
+            return [
+                (x, y, strings[type_id], bool(solid), (r, g, b) if has_color else None)
+                for x, y, type_id, solid, has_color, r, g, b in self._iter_rows(table)
+            ]
+        if table == "enemies":
+            return [
+                (x, y, strings[type_id], patrol)
+                for x, y, type_id, patrol in self._iter_rows(table)
+            ]
+        if table == "hazards":
+            return [
+                (x, y, strings[type_id], width, height)
+                for x, y, type_id, width, height in self._iter_rows(table)
+            ]
+        if table == "coins":
+            return list(self._iter_rows(table))
+        if table == "powerups":
+            return [(x, y, strings[type_id]) for x, y, type_id in self._iter_rows(table)]
+        if table == "keys":
+            return [(x, y, (r, g, b)) for x, y, r, g, b in self._iter_rows(table)]
+        if table == "portals":
+            portal_keys = list(self._iter_rows("portal_keys"))
+            return [
+                (
+                    x, y, dest, (r, g, b) if has_color else None,
+                    portal_keys[first_key:first_key + key_count],
+                )
+                for x, y, dest, has_color, r, g, b, first_key, key_count
+                in self._iter_rows(table)
+            ]
+        raise KeyError(table)
+
+    def to_dict(self):
+        """Rebuild the level dictionary (for tools such as the editor)"""
+        level_data = dict(self.meta)
+        level_data["tiles"] = [
+            {"x": x, "y": y, "type": tile_type, "solid": solid, **({"color": list(color)} if color else {})}
+            for x, y, tile_type, solid, color in self.get_records("tiles")
+        ]
+        level_data["enemies"] = [
+            {"x": x, "y": y, "type": enemy_type, "patrol": patrol}
+            for x, y, enemy_type, patrol in self.get_records("enemies")
+        ]
+        level_data["hazards"] = [
+            {"x": x, "y": y, "type": hazard_type, "width": width, "height": height}
+            for x, y, hazard_type, width, height in self.get_records("hazards")
+        ]
+        level_data["coins"] = [
+            {"x": x, "y": y, "value": value} for x, y, value in self.get_records("coins")
+        ]
+        level_data["powerups"] = [
+            {"x": x, "y": y, "type": powerup_type}
+            for x, y, powerup_type in self.get_records("powerups")
+        ]
+        level_data["keys"] = [
+            {"x": x, "y": y, "color": list(color)} for x, y, color in self.get_records("keys")
+        ]
+        level_data["portals"] = [
+            {
+                "x": x, "y": y, "dest": dest,
+                **({"color": list(color)} if color else {}),
+                **({"required_keys": [list(k) for k in keys]} if keys else {}),
+            }
+            for x, y, dest, color, keys in self.get_records("portals")
+        ]
+        return level_data
@@ -5,13 +5,31 @@ UPDATED: Now loads complete Act 1 (Levels 0-6)
 
 import json
 import os
+import struct
 
-from config.settings import LEVELS_DIR, TILE_SIZE
+from config.settings import COMPILED_LEVELS_PATH, LEVELS_DIR, TILE_SIZE
+from levels.level_compiler import (CompiledLevels, LevelCompileError,
+                                   compile_levels, get_source_hash,
+                                   read_content_hash, write_artifact)
+
+_LEVELS_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
 class LevelLoader:
     """Loads and manages level data"""
 
+    # Modules the default level set is built from; the compiled artifact
+    # is rebuilt whenever one of them changes
+    DEFAULT_LEVEL_SOURCES = tuple(
+        os.path.join(_LEVELS_PACKAGE_DIR, name)
+        for name in (
+            "act1_levels_design.py",
+            "act1_complete_levels.py",
+            "level_loader.py",
+            "level_compiler.py",
+        )
+    )
+
     @staticmethod
     def fix_spike_positions(level_data):
         """Fix spike positions to be on top of ground"""
@@ -56,9 +74,51 @@ class LevelLoader:
             return False
 
     @staticmethod
-    def create_default_levels():
+    def load_default_levels(path=COMPILED_LEVELS_PATH):
+        """
+        Load the Act 1 level set from its compiled artifact, compiling it
+        first when it is missing, was built from other sources or can't
+        be read
+        Args:
+            path: Artifact path
+        Returns:
+            Memory-mapped CompiledLevels, or level data dictionaries when
+            the levels cannot be compiled
+        """
+        try:
+            content_hash = get_source_hash(LevelLoader.DEFAULT_LEVEL_SOURCES, (TILE_SIZE,))
+        except OSError as e:
+            print(f"⚠️  Could not hash level sources: {e}")
+            return LevelLoader.create_default_levels()
+
+        if read_content_hash(path) == content_hash:
+            try:
+                return CompiledLevels.open(path)
+            except (OSError, ValueError, struct.error) as e:
+                print(f"⚠️  Could not read compiled levels {path}, rebuilding: {e}")
+
+        levels = LevelLoader.create_default_levels()
+        if not levels:
+            return levels
+        try:
+            data = compile_levels(levels, content_hash)
+        except LevelCompileError as e:
+            print(f"⚠️  Could not compile levels: {e}")
+            return levels
+        try:
+            write_artifact(path, data)
+            return CompiledLevels.open(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️  Could not write compiled levels {path}: {e}")
+            return CompiledLevels(data)
+
+    @staticmethod
+    def create_default_levels(fix_spikes=True):
         """
         Create complete Act 1 level set
+        Args:
+            fix_spikes: Snap spikes placed inside the ground (see
+                fix_spike_positions); off gives the data as authored
         Returns:
             List of 7 level data dictionaries (Levels 0-6)
         """
@@ -80,7 +140,8 @@ class LevelLoader:
             levels.extend(act1_complete)  # Add Levels 2-6
 
             # FIX SPIKE POSITIONS
-            levels = [LevelLoader.fix_spike_positions(level) for level in levels]
+            if fix_spikes:
+                levels = [LevelLoader.fix_spike_positions(level) for level in levels]
 
             print(f"✓ Loaded {len(levels)} Act 1 levels")
             return levels
@@ -0,0 +1,105 @@
+"""
+Level manager - builds levels on demand and prefetches the next ones
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config.settings import LEVEL_PREFETCH
+from levels.level import Level
+from levels.level_loader import LevelLoader
+
+
+class LevelManager:
+    """
+    Hands out freshly built Level objects by index. Level data is only
+    loaded when first needed, and while a level is played the levels its
+    portals lead to are built on a worker thread, so going through a
+    portal just swaps in the Level that is already waiting.
+
+    Each prefetched Level is handed out once. Asking again for the level
+    handed out last (a restart, a loaded save) rewinds that Level to its
+    built state instead of building it again.
+    """
+
+    def __init__(self, prefetch=LEVEL_PREFETCH):
+        """
+        Args:
+            prefetch: Build likely next levels in the background
+        """
+        self.prefetch_enabled = prefetch
+        self._levels = None  # Level data sequence, loaded on first use
+        self._levels_lock = threading.Lock()
+        self._executor = None
+        self._pending = {}  # Level index -> Future of a prefetched Level
+        self._current = None  # (index, Level) handed out last
+
+    def __len__(self):
+        return len(self._get_levels())
+
+    def _get_levels(self):
+        """Get the level data sequence, loading it on first use"""
+        with self._levels_lock:
+            if self._levels is None:
+                self._levels = LevelLoader.load_default_levels()
+            return self._levels
+
+    def _build(self, level_index):
+        """Build a Level from its data (runs on either thread)"""
+        return Level(self._get_levels()[level_index])
+
+    def get_level(self, level_index):
+        """
+        Get a Level in its built state, taking the prefetched one when
+        there is one
+        Args:
+            level_index: Index into the level set
+        Returns:
+            Level ready to play
+        """
+        if self._current is not None and self._current[0] == level_index:
+            level = self._current[1]
+            level.reset()
+            return level
+
+        future = self._pending.pop(level_index, None)
+        if future is not None:
+            # Waits only if the player outran the worker
+            level = future.result()
+        else:
+            level = self._build(level_index)
+        self._current = (level_index, level)
+        return level
+
+    def prefetch(self, level_indices):
+        """
+        Start building levels in the background, dropping earlier
+        prefetches that are no longer wanted
+        Args:
+            level_indices: Indices that may be loaded next (out of range
+                ones, such as the "after the last level" portal, are ignored)
+        """
+        if not self.prefetch_enabled:
+            return
+
+        count = len(self)
+        wanted = sorted({index for index in level_indices if 0 <= index < count})
+
+        for index in list(self._pending):
+            if index not in wanted:
+                self._pending.pop(index).cancel()
+
+        for index in wanted:
+            if index not in self._pending:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="level-prefetch"
+                    )
+                self._pending[index] = self._executor.submit(self._build, index)
+
+    def shutdown(self):
+        """Stop the worker, dropping builds that have not started"""
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,94 @@
+"""
+Level snapshots - entity state captured once and rewound in bulk
+"""
+
+from array import array
+
+
+class EntityState:
+    """
+    Packed state of groups of entities. Each entity class lists the
+    attributes that change during play in STATE_FIELDS; the state keeps one
+    column per (group, attribute), packed into an array when all values
+    share a numeric type, so values come back with the types they had.
+    """
+
+    # array typecodes for columns whose values all have one type
+    TYPECODES = {bool: "b", int: "q", float: "d"}
+
+    def __init__(self, groups):
+        """
+        Args:
+            groups: Mapping of group name -> sequence of entities
+        """
+        self.columns = []  # (group, attribute, packed values, type to restore)
+        for group, entities in groups.items():
+            fields = {field for entity in entities for field in type(entity).STATE_FIELDS}
+            for field in sorted(fields):
+                values, value_type = self._pack([getattr(e, field) for e in entities])
+                self.columns.append((group, field, values, value_type))
+
+    @classmethod
+    def _pack(cls, values):
+        """
+        Store a column compactly
+        Returns:
+            (values, type) - an array plus the type to convert items back to,
+            or a tuple and None when the values are of mixed types
+        """
+        value_types = {type(value) for value in values}
+        if len(value_types) == 1:
+            value_type = value_types.pop()
+            typecode = cls.TYPECODES.get(value_type)
+            if typecode:
+                try:
+                    return array(typecode, values), value_type
+                except OverflowError:
+                    pass
+        return tuple(values), None
+
+    def apply(self, groups):
+        """
+        Write the captured values into entities
+        Args:
+            groups: The captured groups, or entities rebuilt from the same
+                data in the same order
+        """
+        for group, field, values, value_type in self.columns:
+            entities = groups[group]
+            if value_type is bool:
+                # Stored as small ints
+                for entity, value in zip(entities, values):
+                    setattr(entity, field, value == 1)
+            else:
+                for entity, value in zip(entities, values):
+                    setattr(entity, field, value)
+
+
+class LevelSnapshot:
+    """
+    State of every entity in a level, captured right after it is built.
+    Restoring refills the group lists in place and writes the state back
+    into the same entity objects, so a reset is one pass over the entities
+    and builds no new ones.
+    """
+
+    GROUPS = ("enemies", "hazards", "coins", "powerups", "keys", "portals")
+
+    def __init__(self, level):
+        """
+        Args:
+            level: Freshly built Level
+        """
+        self.level = level
+        self.groups = {group: tuple(getattr(level, group)) for group in self.GROUPS}
+        self.state = EntityState(self.groups)
+
+    def restore(self):
+        """Put the level's entities back into their captured state"""
+        level = self.level
+        for group, entities in self.groups.items():
+            # Group lists may have been replaced (dead enemies are compacted
+            # out), so refill whatever list the level holds now
+            getattr(level, group)[:] = entities
+        self.state.apply(self.groups)
@@ -0,0 +1,262 @@
+"""
+Level streaming - wide levels split into chunks loaded around the camera
+"""
+
+import math
+from array import array
+
+import pygame
+
+from config.settings import LEVEL_STREAM_CHUNK_WIDTH, LEVEL_STREAM_MARGIN
+from levels.level_snapshot import EntityState
+
+
+class LevelChunk:
+    """One horizontal strip of a streamed level"""
+
+    def __init__(self, index, left, right):
+        """
+        Args:
+            index: Position of the strip, left to right
+            left, right: Horizontal pixel bounds of the strip
+        """
+        self.index = index
+        # Horizontal extent of everything the chunk owns: its strip plus the
+        # activity rects of its entities, which may reach into neighbours
+        self.left = left
+        self.right = right
+        self.tile_ids = []  # Tiles overlapping the extent
+        self.records = {group: [] for group in LevelStreamer.GROUPS}  # (order, record)
+
+        self.entities = None  # Group -> entities while loaded
+        self.saved = None  # EntityState captured at the last unload
+        self.last_frames = None  # Group -> array of last simulated frames at the last unload
+
+
+class LevelStreamer:
+    """
+    Keeps only the parts of a wide level near the camera alive.
+
+    The level is cut into LEVEL_STREAM_CHUNK_WIDTH strips. Entities belong
+    to the strip their data position falls in, and a chunk's extent grows
+    to cover where its entities can go; tiles belong to every chunk whose
+    extent they overlap. A chunk loads when its extent comes within
+    LEVEL_STREAM_MARGIN of an area that needs the level (the active region
+    window, the player) and unloads once it is twice that far from all of
+    them. Unloading keeps the state of the chunk's entities (see
+    EntityState) and the frame each was last simulated, so a chunk that
+    comes back continues where it left off, with the same sleep catch-up
+    the active region gives entities that never left memory.
+
+    Tile and entity objects, and the work done for them each frame, are
+    bounded by the loaded chunks. What stays for the whole level is
+    compact: tile and entity records, saved chunk states and the level's
+    solidity grid.
+    """
+
+    GROUPS = ("enemies", "hazards", "coins", "powerups", "keys", "portals")
+
+    def __init__(self, level, tiles, records, chunk_width=LEVEL_STREAM_CHUNK_WIDTH, margin=LEVEL_STREAM_MARGIN):
+        """
+        Args:
+            level: Level being streamed (its tiles and entity lists start empty)
+            tiles: Every tile dictionary of the level, merged
+            records: Group -> entity records (see levels.level_compiler.get_records)
+            chunk_width: Strip width in pixels
+            margin: Load distance beyond the areas passed to update()
+        """
+        self.level = level
+        self.chunk_width = chunk_width
+        self.margin = margin
+        self.records = records
+
+        count = max(1, math.ceil(level.width / chunk_width))
+        self.chunks = [
+            LevelChunk(index, index * chunk_width, (index + 1) * chunk_width)
+            for index in range(count)
+        ]
+        self.loaded = set()  # Indices of loaded chunks
+        self.live_tiles = {}  # Tile id -> tile dictionary while any owner is loaded
+        self.order = {}  # id(entity) -> index in the level data, to keep lists in data order
+
+        # Entities are built once here, only to find how far each can reach
+        for group in self.GROUPS:
+            group_records = records[group]
+            entities = level.create_entities(group, group_records)
+            for order, (record, entity) in enumerate(zip(group_records, entities)):
+                chunk = self.chunks[self._strip_range(record[0], record[0] + 1)[0]]
+                chunk.records[group].append((order, record))
+                if hasattr(entity, "get_activity_rect"):
+                    rect = entity.get_activity_rect(level.height)
+                else:
+                    rect = entity.get_rect()
+                chunk.left = min(chunk.left, rect.left)
+                chunk.right = max(chunk.right, rect.right)
+
+        # How far any chunk reaches past its strip, to bound chunk lookups
+        self.overhang = max(
+            max(chunk.index * chunk_width - chunk.left, chunk.right - (chunk.index + 1) * chunk_width)
+            for chunk in self.chunks
+        )
+
+        # Tiles belong to every chunk whose extent they overlap, so the
+        # ground under an entity is loaded wherever it can walk
+        self.tile_records = [
+            (tile["rect"].x, tile["rect"].y, tile["rect"].width, tile["rect"].height,
+             tile["type"], tile["solid"], tile["color"])
+            for tile in tiles
+        ]
+        for tile_id, tile in enumerate(tiles):
+            rect = tile["rect"]
+            first, last = self._strip_range(rect.left - self.overhang, rect.right + self.overhang)
+            for chunk in self.chunks[first:last + 1]:
+                if chunk.left < rect.right and chunk.right > rect.left:
+                    chunk.tile_ids.append(tile_id)
+
+    def _strip_range(self, left, right):
+        """Get the first and last strip index covering [left, right)"""
+        last_index = len(self.chunks) - 1
+        first = min(max(int(left // self.chunk_width), 0), last_index)
+        last = min(max(int((right - 1) // self.chunk_width), 0), last_index)
+        return first, last
+
+    def _chunks_near(self, areas, distance):
+        """Get indices of chunks whose extent comes within distance of any area"""
+        found = set()
+        for area in areas:
+            left = area.left - distance
+            right = area.right + distance
+            first, last = self._strip_range(left - self.overhang, right + self.overhang)
+            for chunk in self.chunks[first:last + 1]:
+                if chunk.left < right and chunk.right > left:
+                    found.add(chunk.index)
+        return found
+
+    def update(self, areas, frame=0, tracker=None):
+        """
+        Load chunks near the areas and unload chunks far from all of them
+        Args:
+            areas: World rects that need the level around them
+            frame: Current game frame
+            tracker: ActiveRegion that (un)loaded entities of its groups are
+                handed to
+        Returns:
+            True if any chunk was loaded or unloaded
+        """
+        wanted = self._chunks_near(areas, self.margin)
+        kept = self._chunks_near(areas, self.margin * 2)
+        to_load = sorted(wanted - self.loaded)
+        to_unload = sorted(self.loaded - kept)
+        if not to_load and not to_unload:
+            return False
+
+        removed = set()
+        for index in to_unload:
+            removed.update(self._unload(self.chunks[index], frame, tracker))
+        added = {group: [] for group in self.GROUPS}
+        for index in to_load:
+            for group, entities in self._load(self.chunks[index], tracker).items():
+                added[group].extend(entities)
+
+        self._update_tiles()
+        self._update_entity_lists(removed, added)
+        self.level.rebuild_indexes()
+        return True
+
+    def _load(self, chunk, tracker):
+        """Build a chunk's entities, continuing from its saved state"""
+        level = self.level
+        chunk.entities = {
+            group: level.create_entities(group, [record for _, record in chunk.records[group]])
+            for group in self.GROUPS
+        }
+        if chunk.saved is not None:
+            chunk.saved.apply(chunk.entities)
+
+        for group, entities in chunk.entities.items():
+            for (order, _), entity in zip(chunk.records[group], entities):
+                self.order[id(entity)] = order
+            if tracker is not None and group in tracker.GROUPS:
+                last_frames = chunk.last_frames[group] if chunk.last_frames else None
+                tracker.adopt(entities, last_frames)
+
+        self.loaded.add(chunk.index)
+        return chunk.entities
+
+    def _unload(self, chunk, frame, tracker):
+        """
+        Save a chunk's entity state and drop its entities
+        Returns:
+            Set of id() of the dropped entities
+        """
+        chunk.saved = EntityState(chunk.entities)
+        if tracker is not None:
+            chunk.last_frames = {
+                group: array("q", tracker.release(entities, frame))
+                for group, entities in chunk.entities.items()
+                if group in tracker.GROUPS
+            }
+
+        removed = set()
+        for entities in chunk.entities.values():
+            for entity in entities:
+                removed.add(id(entity))
+                self.order.pop(id(entity), None)
+        chunk.entities = None
+        self.loaded.discard(chunk.index)
+        return removed
+
+    def _update_tiles(self):
+        """Create tiles of newly loaded chunks and drop tiles no loaded chunk owns"""
+        needed = set()
+        for index in self.loaded:
+            needed.update(self.chunks[index].tile_ids)
+
+        live = self.live_tiles
+        for tile_id in list(live):
+            if tile_id not in needed:
+                del live[tile_id]
+
+        theme = self.level.theme.name
+        for tile_id in needed:
+            if tile_id not in live:
+                x, y, width, height, tile_type, solid, color = self.tile_records[tile_id]
+                live[tile_id] = {
+                    "rect": pygame.Rect(x, y, width, height),
+                    "type": tile_type,
+                    "solid": solid,
+                    "color": color,
+                    "theme": theme,
+                }
+
+        # A new list, so caches keyed on the tile list notice the change
+        self.level.tiles = [live[tile_id] for tile_id in sorted(live)]
+
+    def _update_entity_lists(self, removed, added):
+        """Swap unloaded entities in the level's lists for loaded ones, in data order"""
+        level = self.level
+        order = self.order
+        for group in self.GROUPS:
+            entities = [e for e in getattr(level, group) if id(e) not in removed]
+            # Enemies killed before their chunk unloaded stay out of the
+            # list, as _remove_dead_enemies left them
+            entities.extend(e for e in added[group] if not getattr(e, "dead", False))
+            # Entities added at runtime (a boss's exit portal) keep their place at the end
+            entities.sort(key=lambda e: order.get(id(e), math.inf))
+            setattr(level, group, entities)
+
+    def reset(self):
+        """Forget every chunk's saved state and unload everything"""
+        for chunk in self.chunks:
+            chunk.entities = None
+            chunk.saved = None
+            chunk.last_frames = None
+        self.loaded.clear()
+        self.live_tiles.clear()
+        self.order.clear()
+
+        level = self.level
+        level.tiles = []
+        for group in self.GROUPS:
+            setattr(level, group, [])
+        level.rebuild_indexes()
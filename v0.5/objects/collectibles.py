@@ -8,11 +8,20 @@ import pygame
 
 from config.settings import CYAN, ORANGE, PURPLE, RED, WHITE, YELLOW
 from utils.enums import PowerUpType
+from utils.sprites import SpriteCache
 
 
 class Coin:
     """Collectible coin"""
 
+    # Attributes that change during play, rewound by level snapshots
+    STATE_FIELDS = ("collected", "rotation")
+
+    # Rotation animation: degrees per frame and the baked frames covering a turn
+    ROTATION_STEP = 5
+    FRAME_COUNT = 360 // ROTATION_STEP
+    FRAME_SIZE = 24  # Baked frame side, with room for the star's outline
+
     def __init__(self, x, y, value=1):
         """
         Args:
@@ -29,26 +38,48 @@ class Coin:
 
     def update(self):
         """Animate coin rotation"""
-        self.rotation = (self.rotation + 5) % 360
+        self.rotation = (self.rotation + self.ROTATION_STEP) % 360
 
     def get_rect(self):
         """Get collision rectangle"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
+    def get_activity_rect(self, level_height):
+        """Get the area this coin occupies (coins never move)"""
+        return self.get_rect()
+
+    def wake(self, frames_asleep):
+        """Catch up after being outside the active region"""
+        self.rotation = (self.rotation + self.ROTATION_STEP * frames_asleep) % 360
+
     def draw(self, surface, camera_x, camera_y):
         """Render coin with star pattern"""
         width = abs(math.cos(math.radians(self.rotation))) * self.width
         screen_x = self.x - camera_x + (self.width - width) / 2
         screen_y = self.y - camera_y
 
-        # Draw coin as star shape instead of circle
+        # Star is centered on the (squashed) coin; frames hold it around the middle
         center = (int(screen_x + width / 2), int(screen_y + self.height / 2))
+        frames = SpriteCache.get_frames(
+            ("coin", self.width, self.height, min(self.value, 5)),
+            (self.FRAME_SIZE, self.FRAME_SIZE),
+            self.FRAME_COUNT,
+            self._draw_frame,
+        )
+        frame = frames[int(self.rotation) // self.ROTATION_STEP % self.FRAME_COUNT]
+        half = self.FRAME_SIZE // 2
+        surface.blit(frame, (center[0] - half, center[1] - half))
+
+    def _draw_frame(self, surface, index):
+        """Bake one rotation frame (star plus value dots) centered in surface"""
+        rotation = index * self.ROTATION_STEP
+        center = (self.FRAME_SIZE // 2, self.FRAME_SIZE // 2)
         radius = int(self.height / 2)
 
         # 8-point star
         points = []
         for i in range(16):
-            angle = (i * math.pi / 8) + (self.rotation * math.pi / 180)
+            angle = (i * math.pi / 8) + (rotation * math.pi / 180)
             r = radius if i % 2 == 0 else radius * 0.5
             x = center[0] + r * math.cos(angle)
             y = center[1] + r * math.sin(angle)
@@ -66,6 +97,9 @@ class Coin:
 class Key:
     """Collectible key for unlocking doors/portals"""
 
+    # Attributes that change during play, rewound by level snapshots
+    STATE_FIELDS = ("collected",)
+
     def __init__(self, x, y, color):
         """
         Args:
@@ -100,6 +134,9 @@ class Key:
 class PowerUp:
     """Power-up collectible"""
 
+    # Attributes that change during play, rewound by level snapshots
+    STATE_FIELDS = ("collected", "float_offset")
+
     def __init__(self, x, y, ptype):
         """
         Args:
@@ -114,18 +151,28 @@ class PowerUp:
         self.collected = False
         self.float_offset = 0
 
-    def update(self):
-        """Animate floating effect"""
-        self.float_offset = math.sin(pygame.time.get_ticks() / 200) * 5
+    def update(self, current_time):
+        """
+        Animate floating effect
+        Args:
+            current_time: Current game time in ms
+        """
+        self.float_offset = math.sin(current_time / 200) * 5
 
     def get_rect(self):
         """Get collision rectangle"""
         return pygame.Rect(self.x, self.y + self.float_offset, self.width, self.height)
 
+    def get_activity_rect(self, level_height):
+        """Get the area this power-up can occupy while bobbing"""
+        return pygame.Rect(self.x, self.y - 5, self.width, self.height + 10)
+
+    def wake(self, frames_asleep):
+        """Catch up after being outside the active region"""
+        # Bobbing follows the game clock; the next update resyncs it
+
     def draw(self, surface, camera_x, camera_y):
         """Render power-up with distinct shape per type"""
-        from utils.textures import TextureManager
-
         rect = pygame.Rect(
             self.x - camera_x,
             self.y + self.float_offset - camera_y,
@@ -133,6 +180,20 @@ class PowerUp:
             self.height,
         )
 
+        # Only the bobbing moves, so each type is a single baked sprite
+        sprite = SpriteCache.get_sprite(
+            ("powerup", self.type, self.width, self.height),
+            rect.size,
+            self._draw_sprite,
+        )
+        surface.blit(sprite, rect.topleft)
+
+    def _draw_sprite(self, surface):
+        """Bake the power-up's pattern, border and icon filling surface"""
+        from utils.textures import TextureManager
+
+        rect = surface.get_rect()
+
         colors = {
             PowerUpType.HEALTH.value: RED,
             PowerUpType.DOUBLE_JUMP.value: CYAN,
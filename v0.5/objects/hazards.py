@@ -11,6 +11,9 @@ from utils.enums import HazardType
 class Hazard:
     """Environmental hazard"""
 
+    # Attributes that change during play, rewound by level snapshots
+    STATE_FIELDS = ("x", "y", "dy", "falling", "respawn_timer", "direction")
+
     def __init__(self, x, y, hazard_type, width=32, height=32):
         """
         Args:
@@ -52,7 +55,10 @@ class Hazard:
         """Update falling block behavior"""
         if not self.falling and player_rect.colliderect(self.get_trigger_rect()):
             self.falling = True
+        self._advance_falling_block()
 
+    def _advance_falling_block(self):
+        """Fall for one frame, then count down to the respawn once off screen"""
         if self.falling:
             self.dy += GRAVITY
             self.y += self.dy
@@ -76,6 +82,37 @@ class Hazard:
         """Get collision rectangle"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
+    def get_activity_rect(self, level_height):
+        """
+        Get the area this hazard can occupy while awake, used to decide
+        whether it is near enough to the camera to simulate
+        """
+        if self.type == HazardType.MOVING_PLATFORM.value:
+            reach = self.move_distance + self.speed
+            return pygame.Rect(
+                self.start_x - reach, self.start_y, reach * 2 + self.width, self.height
+            )
+        if self.type == HazardType.FALLING_BLOCK.value:
+            # Trigger zone above plus the whole drop below
+            top = self.start_y - 100
+            return pygame.Rect(
+                self.start_x - 50, top, self.width + 100, max(level_height, SCREEN_HEIGHT + 100) - top
+            )
+        return self.get_rect()
+
+    def wake(self, frames_asleep):
+        """
+        Catch up after being outside the active region. A dropped block
+        finishes its fall and respawn countdown frame by frame, as update()
+        would have; the player was out of reach, so nothing retriggers it
+        """
+        if self.type != HazardType.FALLING_BLOCK.value:
+            return
+        for _ in range(frames_asleep):
+            if not self.falling:
+                break  # Resting blocks only change when triggered
+            self._advance_falling_block()
+
     def get_trigger_rect(self):
         """Get trigger zone for falling blocks"""
         return pygame.Rect(self.x - 50, self.y - 100, self.width + 100, 100)
@@ -7,11 +7,18 @@ import math
 import pygame
 
 from config.settings import PURPLE
+from utils.sprites import SpriteCache
 
 
 class Portal:
     """Portal for transitioning between levels"""
 
+    FRAME_COUNT = 360  # One baked frame per animation step
+    WOBBLE = 8  # Max horizontal sway of the layers in pixels
+
+    # Attributes that change during play, rewound by level snapshots
+    STATE_FIELDS = ("animation_offset", "locked")
+
     def __init__(self, x, y, destination_level, color=None, required_keys=None):
         """
         Args:
@@ -61,12 +68,15 @@ class Portal:
         x = self.x - camera_x
         y = self.y - camera_y
 
-        # Animated portal effect with multiple layers
-        for i in range(3):
-            offset = math.sin(math.radians(self.animation_offset + i * 120)) * 8
-            rect = pygame.Rect(x + offset, y, self.width - abs(offset) * 2, self.height)
-            color = tuple(max(0, c - i * 60) for c in self.color)
-            pygame.draw.ellipse(surface, color, rect)
+        # Animated portal effect with multiple layers, baked per animation step
+        frames = SpriteCache.get_frames(
+            ("portal", tuple(self.color), self.width, self.height),
+            (self.WOBBLE + self.width, self.height),
+            self.FRAME_COUNT,
+            self._draw_frame,
+        )
+        frame = frames[int(self.animation_offset) % self.FRAME_COUNT]
+        surface.blit(frame, (x - self.WOBBLE, y))
 
         # Draw lock symbol if locked
         if self.locked:
@@ -83,3 +93,12 @@ class Portal:
             )
             # Keyhole
             pygame.draw.circle(surface, BLACK, (lock_x, lock_y + 6), 2)
+
+    def _draw_frame(self, surface, index):
+        """Bake one animation step; the layers wobble up to WOBBLE px left of x"""
+        x = self.WOBBLE
+        for i in range(3):
+            offset = math.sin(math.radians(index + i * 120)) * self.WOBBLE
+            rect = pygame.Rect(x + offset, 0, self.width - abs(offset) * 2, self.height)
+            color = tuple(max(0, c - i * 60) for c in self.color)
+            pygame.draw.ellipse(surface, color, rect)
@@ -0,0 +1,145 @@
+"""
+Active region tests - sleeping entities and their wake catch-up
+Run from the project folder with pytest, or directly:
+
+    python test_active_region.py
+"""
+
+import os
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.active_region import ActiveRegion
+from objects.hazards import Hazard
+from utils.enums import HazardType
+
+
+class Tracked:
+    """Stand-in entity that records the wake calls it gets"""
+
+    def __init__(self, x):
+        self.rect = pygame.Rect(x, 0, 32, 32)
+        self.woken = []
+
+    def get_activity_rect(self, level_height):
+        return self.rect
+
+    def wake(self, frames_asleep):
+        self.woken.append(frames_asleep)
+
+
+class View:
+    """Camera stand-in whose view is a fixed rect"""
+
+    def __init__(self, x):
+        self.rect = pygame.Rect(x, 0, 200, 200)
+
+    def get_view_rect(self, margin):
+        return self.rect.inflate(margin * 2, margin * 2)
+
+
+class Groups:
+    """Level stand-in holding the groups ActiveRegion tracks"""
+
+    height = 200
+
+    def __init__(self, enemies):
+        self.enemies = enemies
+        self.hazards = []
+        self.coins = []
+        self.powerups = []
+
+
+def test_sleep_state_stays_with_entity():
+    """Wake catch-up follows the entity object, not a reusable id"""
+    region = ActiveRegion(margin=0)
+    near, far = Tracked(0), Tracked(5000)
+    level = Groups([near, far])
+    region.bind(level, frame=10)
+
+    region.update(View(0), frame=11)
+    assert region.get_awake("enemies") == [near]
+    assert near.woken == [] and near.sleep_frame is None
+
+    # far slept since bind: frames 11-19 were missed
+    region.update(View(5000), frame=20)
+    assert region.get_awake("enemies") == [far]
+    assert far.woken == [9]
+    assert near.sleep_frame == 19
+
+    # An entity that joins without being adopted has no sleep state to inherit
+    newcomer = Tracked(5000)
+    level.enemies.append(newcomer)
+    region.reindex(level)
+    region.update(View(5000), frame=30)
+    assert newcomer.woken == []
+
+    # Leaving the level hands the sleep frame back out and forgets it
+    assert region.release([near], frame=30) == [19]
+    assert near.sleep_frame is None
+
+
+def make_block():
+    """Falling block the player just triggered"""
+    block = Hazard(0, 300, HazardType.FALLING_BLOCK.value)
+    block.update(block.get_trigger_rect())
+    assert block.falling
+    return block
+
+
+def block_state(block):
+    """Get the snapshot fields of a block"""
+    return tuple(getattr(block, field) for field in Hazard.STATE_FIELDS)
+
+
+def test_falling_block_catches_up():
+    """A block that sleeps mid-fall ends where one left awake would"""
+    far_away = pygame.Rect(-10000, 0, 1, 1)
+    for awake_frames, asleep_frames in ((0, 5), (3, 20), (10, 200), (5, 400), (1, 2000)):
+        awake = make_block()
+        for _ in range(awake_frames + asleep_frames):
+            awake.update(far_away)
+
+        sleeper = make_block()
+        for _ in range(awake_frames):
+            sleeper.update(far_away)
+        sleeper.wake(asleep_frames)
+
+        assert block_state(sleeper) == block_state(awake), (awake_frames, asleep_frames)
+
+
+TESTS = [
+    ("Sleep state stays with entity", test_sleep_state_stays_with_entity),
+    ("Falling block catches up", test_falling_block_catches_up),
+]
+
+
+def main():
+    """Run all tests from a temporary folder, like pytest does (conftest.py)"""
+    failed = 0
+    project_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for name, test_func in TESTS:
+                try:
+                    test_func()
+                    print(f"✓ PASS: {name}")
+                except Exception as e:
+                    failed += 1
+                    print(f"✗ FAIL: {name}: {e!r}")
+        finally:
+            os.chdir(project_dir)
+
+    print(f"\nTotal: {len(TESTS) - failed}/{len(TESTS)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
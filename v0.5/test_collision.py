@@ -0,0 +1,198 @@
+"""
+Collision tests - solidity grid, tile queries and the movement sweep
+Run from the project folder with pytest, or directly:
+
+    python test_collision.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from config.settings import TILE_SIZE
+from levels.level import Level
+from levels.level_loader import LevelLoader
+from utils.collision import SolidityGrid
+
+
+def make_level(tiles, cols=10, rows=6):
+    """
+    Build a small level from tile positions
+    Args:
+        tiles: (x, y) pixel positions of solid tiles
+        cols, rows: Level size in tiles
+    """
+    return Level(
+        {
+            "width": cols * TILE_SIZE,
+            "height": rows * TILE_SIZE,
+            "tiles": [{"x": x, "y": y} for x, y in tiles],
+        },
+        streaming=False,
+    )
+
+
+def test_out_of_bounds_cells():
+    """Cells outside the grid report EMPTY until geometry reaches past the edge"""
+    grid = SolidityGrid(4 * TILE_SIZE, 3 * TILE_SIZE, TILE_SIZE)
+    grid.mark(pygame.Rect(0, 0, TILE_SIZE, TILE_SIZE))
+    for cell in ((-1, 0), (0, -1), (4, 0), (0, 3)):
+        assert grid.get(*cell) == SolidityGrid.EMPTY
+
+    grid.mark(pygame.Rect(-TILE_SIZE, 2 * TILE_SIZE, 2 * TILE_SIZE, TILE_SIZE))
+    assert grid.get(-1, 2) == SolidityGrid.PARTIAL
+    assert grid.get(100, 100) == SolidityGrid.PARTIAL
+    assert grid.get(0, 2) == SolidityGrid.FULL
+
+    level = make_level([(0, 0)])
+    assert level.is_solid(0, 0)
+    assert not level.is_solid(-1, 0)
+    assert not level.is_solid(level.solid_grid.cols, 0)
+
+
+def test_partial_and_full_cells():
+    """Aligned tiles fill their cell, offset ones only touch two"""
+    half = TILE_SIZE // 2
+    level = make_level([(0, 0), (3 * TILE_SIZE + half, 0)], cols=6, rows=2)
+    grid = level.solid_grid
+
+    assert grid.get(0, 0) == SolidityGrid.FULL
+    assert grid.get(3, 0) == SolidityGrid.PARTIAL
+    assert grid.get(4, 0) == SolidityGrid.PARTIAL
+    assert grid.get(1, 0) == SolidityGrid.EMPTY
+    assert level.is_solid(3, 0) and level.is_solid(4, 0)
+    assert not level.is_solid(1, 0)
+
+    # PARTIAL cells fall back to exact tests against the tiles
+    assert not level.solid_in_rect(pygame.Rect(3 * TILE_SIZE, 0, half, TILE_SIZE))
+    assert level.solid_in_rect(pygame.Rect(3 * TILE_SIZE, 0, half + 1, TILE_SIZE))
+    assert level.solid_in_rect(pygame.Rect(5, 5, 1, 1))
+
+
+def test_sweep_stops_flush():
+    """Sweeps stop exactly at the tile edge, sub-pixel moves included"""
+    wall_x = 6 * TILE_SIZE
+    floor_y = 4 * TILE_SIZE
+    level = make_level(
+        [(wall_x, y * TILE_SIZE) for y in range(4)]
+        + [(x * TILE_SIZE, floor_y) for x in range(10)]
+    )
+    width = height = 20
+
+    # Long horizontal move stops flush against the wall
+    x = 2 * TILE_SIZE + 0.25
+    move_x, move_y = level.sweep_rect(x, TILE_SIZE, width, height, 200, 0)
+    assert x + move_x + width == wall_x
+    assert move_y == 0
+
+    # Half a pixel short of the wall, a one-pixel step only takes the half
+    x = wall_x - width - 0.5
+    move_x, _ = level.sweep_rect(x, TILE_SIZE, width, height, 1, 0)
+    assert move_x == 0.5
+
+    # Moving away from the wall isn't blocked
+    move_x, _ = level.sweep_rect(wall_x - width, TILE_SIZE, width, height, -10, 0)
+    assert move_x == -10
+
+    # A sub-pixel fall lands flush on the floor, and resting there stays put
+    y = floor_y - height - 0.5
+    _, move_y = level.sweep_rect(TILE_SIZE, y, width, height, 0, 0.8)
+    assert y + move_y + height == floor_y
+    _, move_y = level.sweep_rect(TILE_SIZE, floor_y - height, width, height, 0, 0.8)
+    assert move_y == 0
+
+    # Tiles the box already overlaps don't block
+    _, move_y = level.sweep_rect(wall_x, TILE_SIZE, width, height, 0, 5)
+    assert move_y == 5
+
+
+def test_solid_queries_match_tiles():
+    """Grid-backed solid queries agree with a scan of every Act 1 tile"""
+    rng = random.Random(2)
+    for level_data in LevelLoader.create_default_levels():
+        level = Level(level_data, streaming=False)
+        solid_tiles = [tile for tile in level.tiles if tile["solid"]]
+
+        for _ in range(300):
+            rect = pygame.Rect(
+                rng.randint(-100, level.width + 100),
+                rng.randint(-100, level.height + 100),
+                rng.randint(1, 300),
+                rng.randint(1, 300),
+            )
+            expected = [tile for tile in solid_tiles if rect.colliderect(tile["rect"])]
+            found = level.get_solid_tiles_in_rect(rect)
+            assert sorted(map(id, found)) == sorted(map(id, expected)), rect
+            assert level.solid_in_rect(rect) == bool(expected), rect
+
+
+def coverage(tiles):
+    """Get a mask of the pixels each (solid, type, color) group of tiles covers"""
+    bounds = tiles[0]["rect"].unionall([tile["rect"] for tile in tiles])
+    masks = {}
+    for tile in tiles:
+        key = (tile["solid"], tile["type"], tile["color"])
+        if key not in masks:
+            masks[key] = pygame.Mask(bounds.size)
+        rect = tile["rect"]
+        masks[key].draw(
+            pygame.Mask(rect.size, fill=True), (rect.x - bounds.x, rect.y - bounds.y)
+        )
+    return bounds, masks
+
+
+def test_merged_tiles_cover_same_pixels():
+    """Merging tiles leaves exactly the same pixels solid, per tile kind"""
+    for level_data in LevelLoader.create_default_levels():
+        merged = Level(level_data, merge_tiles=True, streaming=False)
+        unmerged = Level(level_data, merge_tiles=False, streaming=False)
+        assert len(merged.tiles) <= len(unmerged.tiles)
+
+        bounds, merged_masks = coverage(merged.tiles)
+        unmerged_bounds, unmerged_masks = coverage(unmerged.tiles)
+        assert bounds == unmerged_bounds
+        assert merged_masks.keys() == unmerged_masks.keys()
+        for key, mask in merged_masks.items():
+            other = unmerged_masks[key]
+            assert mask.count() == other.count() == mask.overlap_area(other, (0, 0)), key
+
+
+TESTS = [
+    ("Out-of-bounds cells", test_out_of_bounds_cells),
+    ("PARTIAL and FULL cells", test_partial_and_full_cells),
+    ("Sweep stops flush", test_sweep_stops_flush),
+    ("Solid queries match tiles", test_solid_queries_match_tiles),
+    ("Merged tiles cover same pixels", test_merged_tiles_cover_same_pixels),
+]
+
+
+def main():
+    """Run all tests from a temporary folder, like pytest does (conftest.py)"""
+    failed = 0
+    project_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for name, test_func in TESTS:
+                try:
+                    test_func()
+                    print(f"✓ PASS: {name}")
+                except Exception as e:
+                    failed += 1
+                    print(f"✗ FAIL: {name}: {e!r}")
+        finally:
+            os.chdir(project_dir)
+
+    print(f"\nTotal: {len(TESTS) - failed}/{len(TESTS)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,200 @@
+"""
+Integration tests - headless game behaviour the optimizations must keep
+Run from the project folder with pytest, or directly:
+
+    python test_integration.py
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+import benchmark
+from config.settings import CYAN, ORANGE, SCORE_ENEMY_HIT
+from core.game import Game
+from core.replay import Replay
+from entities.projectile import ProjectilePool
+from levels.level_manager import LevelManager
+from utils.enums import GameState
+
+
+def start_game(level_index):
+    """
+    Start a headless run on a level and play its first frame
+    Returns:
+        Game, to be used in a with block so it is closed afterwards
+    """
+    game = Game(headless=True, seed=1)
+    game.start_run(level_index, seed=1)
+    game.step()
+    return game
+
+
+def test_turret_shots_hit_enemies():
+    """Turret shots that miss the player still damage enemies and score"""
+    with start_game(1) as game:
+        # An enemy in open space, so the shot isn't stopped by a tile first
+        enemy = next(
+            enemy for enemy in game.level.enemies
+            if not game.level.solid_in_rect(enemy.get_rect())
+        )
+        rect = enemy.get_rect()
+        score = game.player.score
+        defeated = game.enemies_defeated
+
+        slot = game.projectiles.spawn(
+            rect.centerx, rect.centery, 0, 0, enemy.health, ORANGE, ProjectilePool.ENEMY
+        )
+        game._update_projectiles()
+
+        assert enemy.dead
+        assert enemy not in game.level.enemies
+        assert game.player.score == score + SCORE_ENEMY_HIT
+        assert game.enemies_defeated == defeated + 1
+        assert not game.projectiles.is_alive(slot)
+
+
+def test_boss_portal_is_drawn():
+    """The portal a defeated boss leaves is in the visible set"""
+    with start_game(6) as game:
+        assert game.boss is not None
+        portals = len(game.level.portals)
+
+        # Finish the boss with a player shot, the way a fight ends
+        boss = game.boss
+        boss.health = 1
+        boss.phase = 3  # Already in the last phase, so no invulnerable transition
+        boss.invulnerable = False
+        rect = boss.get_rect()
+        game.projectiles.spawn(rect.centerx, rect.centery, 0, 0, 1, CYAN)
+        game.step()
+        game.visibility.update(game.camera.x, game.camera.y, *game.presenter.world_size)
+
+        assert game.boss_defeated
+        assert len(game.level.portals) == portals + 1
+        portal = game.level.portals[-1]
+        assert portal in game.visibility.get_visible("portals")
+
+
+def press(game, key):
+    """Send one key press to the level map screen"""
+    game._handle_level_map_events(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+
+def test_level_map_replays_level():
+    """The level map starts the picked unlocked level and rewinds it on a replay"""
+    with Game(headless=True, seed=1) as game:
+        game.current_profile = SimpleNamespace(character=0, levels_completed=2)
+        game.state = GameState.LEVEL_MAP
+        game.level_selection = 0
+
+        # Only the two unlocked levels can be picked
+        press(game, pygame.K_DOWN)
+        press(game, pygame.K_DOWN)
+        press(game, pygame.K_UP)
+        press(game, pygame.K_RETURN)
+        assert game.state == GameState.PLAYING
+        assert game.current_level_index == 1
+
+        level = game.level
+        coin = level.coins[0]
+        coin.collected = True
+
+        game.state = GameState.LEVEL_MAP
+        press(game, pygame.K_RETURN)
+        assert game.level is level
+        assert not coin.collected
+
+
+def test_close_stops_prefetch():
+    """Closing a headless game stops the level prefetch worker"""
+    game = start_game(0)
+    assert game.level_manager._executor is not None
+
+    game.close()
+    assert game.level_manager._executor is None
+    game.close()  # A second close does nothing
+
+
+def test_benchmark_all_levels():
+    """The benchmark's default run covers every level"""
+    results = benchmark.run_benchmarks(None, frames=2, warmup=0, seed=1)
+
+    level_count = len(LevelManager(prefetch=False))
+    assert list(results["levels"]) == [str(index) for index in range(level_count)]
+    for result in results["levels"].values():
+        assert result["frames"] == 2
+
+
+def make_results(update_p99):
+    """Build a one-level benchmark result document with the given update p99"""
+    stats = {"p50": 0.0, "p95": 0.0, "p99": update_p99}
+    return {"levels": {"0": {"update_ms": stats, "draw_ms": dict(stats)}}}
+
+
+def test_benchmark_zero_baseline_regresses():
+    """Time on a stat that took none before is flagged, however small"""
+    regressions = benchmark.compare_results(make_results(0.0), make_results(0.01))
+    assert len(regressions) == 2  # update and draw p99
+    assert all("p99" in line for line in regressions)
+
+    assert benchmark.compare_results(make_results(0.0), make_results(0.0)) == []
+    assert benchmark.compare_results(make_results(1.0), make_results(1.01)) == []
+
+
+def test_benchmark_replay_level_checked():
+    """A replay named for one level but recorded on another is refused"""
+    with tempfile.TemporaryDirectory() as replay_dir:
+        Replay(seed=1, level=2, frames=[0]).save(os.path.join(replay_dir, "level_2.replay"))
+        assert list(benchmark.load_replays(replay_dir)) == [2]
+
+        Replay(seed=1, level=2, frames=[0]).save(os.path.join(replay_dir, "level_3.replay"))
+        try:
+            benchmark.load_replays(replay_dir)
+        except ValueError as e:
+            assert "level_3.replay records a run of level 2, not level 3" in str(e)
+        else:
+            raise AssertionError("Mismatched replay was accepted")
+
+
+TESTS = [
+    ("Turret shots hit enemies", test_turret_shots_hit_enemies),
+    ("Boss portal is drawn", test_boss_portal_is_drawn),
+    ("Level map replays level", test_level_map_replays_level),
+    ("Close stops prefetch", test_close_stops_prefetch),
+    ("Benchmark all levels", test_benchmark_all_levels),
+    ("Benchmark zero baseline regresses", test_benchmark_zero_baseline_regresses),
+    ("Benchmark replay level checked", test_benchmark_replay_level_checked),
+]
+
+
+def main():
+    """Run all tests from a temporary folder, like pytest does (conftest.py)"""
+    failed = 0
+    project_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for name, test_func in TESTS:
+                try:
+                    test_func()
+                    print(f"✓ PASS: {name}")
+                except Exception as e:
+                    failed += 1
+                    print(f"✗ FAIL: {name}: {e!r}")
+        finally:
+            os.chdir(project_dir)
+
+    print(f"\nTotal: {len(TESTS) - failed}/{len(TESTS)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,224 @@
+"""
+Level tests - the compiled level cache, level resets and streaming
+Run from the project folder with pytest, or directly:
+
+    python test_levels.py
+"""
+
+import os
+import sys
+import tempfile
+
+import pygame
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config.settings import TILE_SIZE
+from levels.level import Level
+from levels.level_compiler import (CompiledLevels, compile_levels,
+                                   get_source_hash, read_content_hash)
+from levels.level_loader import LevelLoader
+from levels.level_streaming import LevelStreamer
+
+
+def entity_state(entity):
+    """Get the type and every attribute of an entity"""
+    return type(entity).__name__, vars(entity)
+
+
+def level_state(level):
+    """
+    Get everything a level is built into: tiles, entities and the indexes
+    over them. Index entries are compared by position, not identity
+    """
+    return {
+        "tiles": level.tiles,
+        "entities": {
+            group: [entity_state(entity) for entity in getattr(level, group)]
+            for group in LevelStreamer.GROUPS
+        },
+        "tile_index": level.tile_index.cells,
+        "solid_grid": (bytes(level.solid_grid.cells), level.solid_grid.outside_state),
+        "pickup_index": {
+            name: {cell: [order for order, _ in entries] for cell, entries in grid.cells.items()}
+            for name, (_, grid) in level.pickup_index.groups.items()
+        },
+    }
+
+
+def get_current_hash():
+    """Content hash the default level sources have now"""
+    return get_source_hash(LevelLoader.DEFAULT_LEVEL_SOURCES, (TILE_SIZE,))
+
+
+def test_compiled_levels_match_json():
+    """Levels read from a freshly compiled cache match ones built from source"""
+    sources = LevelLoader.create_default_levels()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, "cache", "act1_levels.bin")
+        compiled = LevelLoader.load_default_levels(path)
+
+        assert isinstance(compiled, CompiledLevels)
+        assert read_content_hash(path) == get_current_hash()
+        assert len(compiled) == len(sources)
+        for index, level_data in enumerate(sources):
+            assert level_state(Level(compiled[index], streaming=False)) == level_state(
+                Level(level_data, streaming=False)
+            ), index
+        compiled = None  # Let the mapping go before the folder is removed
+
+
+def test_bad_cache_rebuilt():
+    """A stale, corrupt or truncated cache is rebuilt instead of read"""
+    sources = LevelLoader.create_default_levels()
+    current = compile_levels(sources, get_current_hash())
+    bad_caches = {
+        "stale": compile_levels(sources[:1], b"\0" * 32),
+        "corrupt": b"not a level artifact",
+        "empty": b"",
+        "truncated": current[: len(current) // 2],
+    }
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        path = os.path.join(cache_dir, "act1_levels.bin")
+        for name, data in bad_caches.items():
+            with open(path, "wb") as f:
+                f.write(data)
+
+            levels = LevelLoader.load_default_levels(path)
+            assert isinstance(levels, CompiledLevels), name
+            assert len(levels) == len(sources), name
+            assert levels[len(sources) - 1]["width"] == sources[-1]["width"], name
+            levels = None
+            with open(path, "rb") as f:
+                assert f.read() == current, name
+
+
+def dirty_value(value):
+    """Get a different value for a state field, of another type where possible"""
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float)):
+        return value + 0.5
+    return "dirty"
+
+
+def state_fields(level):
+    """Get every STATE_FIELDS value of a level's entities, with its type"""
+    return {
+        group: [
+            [(field, type(getattr(entity, field)), getattr(entity, field))
+             for field in type(entity).STATE_FIELDS]
+            for entity in getattr(level, group)
+        ]
+        for group in LevelStreamer.GROUPS
+    }
+
+
+def test_reset_matches_fresh_level():
+    """A played level rewound with reset() matches a newly built one"""
+    for index, level_data in enumerate(LevelLoader.create_default_levels()):
+        level = Level(level_data, streaming=False)
+        for group in LevelStreamer.GROUPS:
+            for entity in getattr(level, group):
+                for field in type(entity).STATE_FIELDS:
+                    setattr(entity, field, dirty_value(getattr(entity, field)))
+        # Dead enemies are compacted out into a new list during play
+        level.enemies = level.enemies[::2]
+
+        fresh = state_fields(Level(level_data, streaming=False))
+        assert state_fields(level) != fresh, index
+        level.reset()
+        assert state_fields(level) == fresh, index
+
+
+def stream_all(level):
+    """Load every chunk of a streamed level"""
+    level.stream([pygame.Rect(0, 0, level.width, level.height)])
+
+
+def test_streaming_whole_width_matches_full_load():
+    """Streaming in every chunk builds the level a full load does"""
+    for index, level_data in enumerate(LevelLoader.create_default_levels()):
+        full = level_state(Level(level_data, streaming=False))
+        streamed = Level(level_data, streaming=True)
+        assert streamed.tiles == [], index
+
+        stream_all(streamed)
+        assert level_state(streamed) == full, index
+
+
+def test_streaming_sweep_covers_full_load():
+    """A window swept across the level loads every entity exactly as built"""
+    for index, level_data in enumerate(LevelLoader.create_default_levels()):
+        full = level_state(Level(level_data, streaming=False))["entities"]
+        streamed = Level(level_data, streaming=True)
+        order = streamed.streamer.order
+
+        seen = {group: {} for group in LevelStreamer.GROUPS}
+        for x in range(0, streamed.width, 256):
+            streamed.stream([pygame.Rect(x, 0, 256, streamed.height)])
+            for group in LevelStreamer.GROUPS:
+                for entity in getattr(streamed, group):
+                    seen[group][order[id(entity)]] = entity_state(entity)
+
+        for group in LevelStreamer.GROUPS:
+            assert [seen[group][i] for i in sorted(seen[group])] == full[group], (index, group)
+
+
+def test_streamer_reset_restores_level():
+    """reset() forgets the state saved in unloaded chunks"""
+    for index, level_data in enumerate(LevelLoader.create_default_levels()):
+        full = level_state(Level(level_data, streaming=False))
+        streamed = Level(level_data, streaming=True)
+
+        # Dirty every entity, then unload it all so the state is saved
+        stream_all(streamed)
+        for group in LevelStreamer.GROUPS:
+            for entity in getattr(streamed, group):
+                for field in type(entity).STATE_FIELDS:
+                    setattr(entity, field, dirty_value(getattr(entity, field)))
+        far_away = streamed.width + (streamed.streamer.margin + streamed.streamer.overhang) * 4
+        streamed.stream([pygame.Rect(far_away, 0, 1, 1)])
+        assert not streamed.streamer.loaded, index
+
+        streamed.reset()
+        assert streamed.tiles == [], index
+        stream_all(streamed)
+        assert level_state(streamed) == full, index
+
+
+TESTS = [
+    ("Compiled levels match JSON", test_compiled_levels_match_json),
+    ("Bad cache rebuilt", test_bad_cache_rebuilt),
+    ("Reset matches fresh level", test_reset_matches_fresh_level),
+    ("Streaming whole width matches full load", test_streaming_whole_width_matches_full_load),
+    ("Streaming sweep covers full load", test_streaming_sweep_covers_full_load),
+    ("Streamer reset restores level", test_streamer_reset_restores_level),
+]
+
+
+def main():
+    """Run all tests from a temporary folder, like pytest does (conftest.py)"""
+    failed = 0
+    project_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for name, test_func in TESTS:
+                try:
+                    test_func()
+                    print(f"✓ PASS: {name}")
+                except Exception as e:
+                    failed += 1
+                    print(f"✗ FAIL: {name}: {e!r}")
+        finally:
+            os.chdir(project_dir)
+
+    print(f"\nTotal: {len(TESTS) - failed}/{len(TESTS)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,131 @@
+"""
+Replay tests - binary run-length format and action masks
+Run from the project folder with pytest, or directly:
+
+    python test_replay.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+from core.input import KeyState
+from core.replay import (
+    ACTIONS,
+    REPLAY_VERSION,
+    Replay,
+    ReplayInput,
+    ReplayRecorder,
+    encode_actions,
+)
+
+
+def assert_rejected(data, message):
+    """Check that parsing replay bytes fails with a ValueError mentioning message"""
+    try:
+        Replay.from_bytes(data)
+    except ValueError as e:
+        assert message in str(e), e
+    else:
+        raise AssertionError(f"Replay data accepted, expected '{message}'")
+
+
+def test_round_trip():
+    """Encoding then decoding keeps the header and every frame"""
+    rng = random.Random(8)
+    frames = []
+    while len(frames) < 5000:
+        frames.extend([rng.randrange(1 << len(ACTIONS))] * rng.randint(1, 40))
+    replay = Replay(seed=2**40 + 7, level=5, difficulty="HARD", character=2, frames=frames)
+
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert loaded.frames == frames
+    assert (loaded.seed, loaded.level, loaded.difficulty, loaded.character) == (
+        2**40 + 7, 5, "HARD", 2,
+    )
+
+
+def test_long_runs_split():
+    """Runs longer than a u16 count are split and come back whole"""
+    frames = [3] * 70000 + [0] * 2
+    replay = Replay(seed=1, frames=frames)
+
+    assert replay.get_runs() == [[65535, 3], [70000 - 65535, 3], [2, 0]]
+    assert Replay.from_bytes(replay.to_bytes()).frames == frames
+
+
+def test_bad_header_rejected():
+    """Wrong magic, unknown versions and truncated data are refused"""
+    data = Replay(seed=1, frames=[1, 1, 2]).to_bytes()
+
+    assert_rejected(b"XXXX" + data[4:], "Not a replay file")
+    version = (REPLAY_VERSION + 1).to_bytes(2, "little")
+    assert_rejected(data[:4] + version + data[6:], "Unsupported replay version")
+    assert_rejected(data[:10], "truncated")
+    assert_rejected(data[:-1], "truncated")
+
+
+def test_recorded_input_plays_back():
+    """Playback presses exactly the actions the recorded run saw"""
+    held = [
+        (),
+        (pygame.K_RIGHT,),
+        (pygame.K_RIGHT, pygame.K_SPACE),
+        (pygame.K_LEFT, pygame.K_w, pygame.K_z),  # w is both MOVE_UP and JUMP
+        (pygame.K_x, pygame.K_a),
+        (),
+    ]
+    keys = iter(KeyState(pressed) for pressed in held)
+
+    class Source:
+        def get_pressed(self):
+            return next(keys)
+
+    recorder = ReplayRecorder(Source(), Replay(seed=1))
+    seen = [encode_actions(recorder.get_pressed()) for _ in held]
+    assert recorder.replay.frames == [encode_actions(KeyState(pressed)) for pressed in held]
+
+    playback = ReplayInput(Replay.from_bytes(recorder.replay.to_bytes()))
+    assert [encode_actions(playback.get_pressed()) for _ in held] == seen
+    assert playback.finished
+    assert encode_actions(playback.get_pressed()) == 0
+
+
+TESTS = [
+    ("Round trip", test_round_trip),
+    ("Long runs split", test_long_runs_split),
+    ("Bad header rejected", test_bad_header_rejected),
+    ("Recorded input plays back", test_recorded_input_plays_back),
+]
+
+
+def main():
+    """Run all tests from a temporary folder, like pytest does (conftest.py)"""
+    failed = 0
+    project_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for name, test_func in TESTS:
+                try:
+                    test_func()
+                    print(f"✓ PASS: {name}")
+                except Exception as e:
+                    failed += 1
+                    print(f"✗ FAIL: {name}: {e!r}")
+        finally:
+            os.chdir(project_dir)
+
+    print(f"\nTotal: {len(TESTS) - failed}/{len(TESTS)} passed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
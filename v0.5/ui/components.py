@@ -416,8 +416,7 @@ class Popup:
         
         for word in words:
             test_line = ' '.join(current_line + [word])
-            test_surf = font.render(test_line, True, WHITE)
-            if test_surf.get_width() < self.width - 50:
+            if font.size(test_line)[0] < self.width - 50:
                 current_line.append(word)
             else:
                 if current_line:
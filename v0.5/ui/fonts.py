@@ -0,0 +1,126 @@
+"""
+Shared fonts and a cache of rendered text surfaces
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from config.settings import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """
+    LRU cache of rendered text keyed by (font, text, antialias, color,
+    background). Labels that never change render once; values like the
+    score render again only when the string changes.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        """
+        Args:
+            max_size: Max surfaces kept before the least recently used go
+        """
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, font_key, text, antialias, color, background=None):
+        """
+        Get a rendered text surface, rendering it on a miss.
+        The surface is shared - callers must not draw on it or change its alpha
+        Args:
+            font: pygame.font.Font to render with
+            font_key: Hashable id of the font (e.g. (name, size))
+            text, antialias, color, background: As pygame.font.Font.render
+        Returns:
+            pygame.Surface
+        """
+        key = (
+            font_key,
+            text,
+            antialias,
+            tuple(color),
+            tuple(background) if background is not None else None,
+        )
+        surfaces = self.surfaces
+        surface = surfaces.get(key)
+        if surface is not None:
+            surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        surfaces[key] = surface
+        if len(surfaces) > self.max_size:
+            surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop all surfaces and reset the counters"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self):
+        """Get (hits, misses, cached surface count)"""
+        return self.hits, self.misses, len(self.surfaces)
+
+
+# Shared by every font from get_font
+text_cache = TextCache()
+
+
+class CachedFont:
+    """
+    pygame.font.Font stand-in whose render goes through the text cache.
+    Everything else (size, get_height, ...) is passed to the real font
+    """
+
+    def __init__(self, name, size, cache=text_cache):
+        """
+        Args:
+            name: Font file path, or None for pygame's default font
+            size: Point size
+            cache: TextCache to render through
+        """
+        self.font = pygame.font.Font(name, size)
+        self.key = (name, size)
+        self.cache = cache
+
+    def render(self, text, antialias, color, background=None):
+        """Render text (cached). Same arguments as pygame.font.Font.render"""
+        return self.cache.render(self.font, self.key, text, antialias, color, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+_fonts = {}
+
+
+def get_font(size, name=None):
+    """
+    Get the shared font for a name and size, loading it on first use
+    Args:
+        size: Point size
+        name: Font file path, or None for pygame's default font
+    Returns:
+        CachedFont
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = CachedFont(name, size)
+    return font
+
+
+def clear_fonts():
+    """
+    Forget every shared font and rendered text. Call before pygame.quit(),
+    which leaves loaded fonts unusable, so a later pygame.init() starts fresh
+    """
+    _fonts.clear()
+    text_cache.clear()
@@ -4,9 +4,10 @@ In-game HUD with clean design and level/area info
 
 import pygame
 
-from config.settings import (CYAN, GRAY, GREEN, RED, SCREEN_HEIGHT,
+from config.settings import (BLACK, CYAN, GRAY, GREEN, RED, SCREEN_HEIGHT,
                              SCREEN_WIDTH, UI_BG, UI_BORDER, UI_TEXT,
                              UI_TEXT_DIM, WHITE, YELLOW)
+from ui.fonts import get_font
 
 
 class HUD:
@@ -14,8 +15,8 @@ class HUD:
 
     def __init__(self, font_small):
         """Initialize HUD with cleaner fonts"""
-        self.font = pygame.font.Font(None, 20)  # Stats font
-        self.font_large = pygame.font.Font(None, 24)  # Level name font
+        self.font = get_font(20)  # Stats font
+        self.font_large = get_font(24)  # Level name font
 
     def draw(self, surface, player, current_level, area_name="", level_name=""):
         """
@@ -103,7 +104,7 @@ class HUD:
 
     def draw_message(self, surface, message, duration_frames):
         """Draw temporary message in center of screen"""
-        font_large = pygame.font.Font(None, 48)
+        font_large = get_font(48)
         text = font_large.render(message, True, YELLOW)
 
         x = SCREEN_WIDTH // 2 - text.get_width() // 2
@@ -8,6 +8,8 @@ from config.settings import (
     BLACK,
     CHARACTER_COLORS,
     CYAN,
+    RENDER_SCALES,
+    SCALE_MODES,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     UI_BG,
@@ -19,6 +21,7 @@ from config.settings import (
     YELLOW,
 )
 from ui.components import IconButton, LayoutHelper, Screen
+from ui.fonts import get_font
 from ui.icons import Icon
 
 
@@ -27,10 +30,10 @@ class Menu:
 
     def __init__(self, font_large, font_medium, font_small):
         # Fonts
-        self.font_large = pygame.font.Font(None, 52)
-        self.font_medium = pygame.font.Font(None, 32)
-        self.font_small = pygame.font.Font(None, 22)
-        self.font_tiny = pygame.font.Font(None, 18)
+        self.font_large = get_font(52)
+        self.font_medium = get_font(32)
+        self.font_small = get_font(22)
+        self.font_tiny = get_font(18)
 
         # Button groups for each screen
         self.main_buttons = self._create_main_buttons()
@@ -97,6 +100,8 @@ class Menu:
 
         self.settings_components = {
             'res_dropdown': Dropdown(400, 195, 300, 30, [], 0, "Resolution"),
+            'scale_dropdown': Dropdown(900, 195, 230, 30, [], 0, "Scaling"),
+            'render_scale_dropdown': Dropdown(900, 245, 230, 30, [], 0, "Render Scale"),
             'fullscreen_toggle': Toggle(400, 245, 60, 30, False, "Fullscreen"),
             'music_toggle': Toggle(400, 365, 60, 30, True, "Music"),
             'music_slider': Slider(400, 420, 200, 0, 100, 70, "Music Volume"),
@@ -470,8 +475,8 @@ class Menu:
     # LEVEL MAP
     # ========================================================================
 
-    def draw_level_map_screen(self, surface, current_profile, mouse_pos=None):
-        """Draw level map with all levels"""
+    def draw_level_map_screen(self, surface, current_profile, selection=0, mouse_pos=None):
+        """Draw level map with all levels, marking the selected unlocked one"""
         screen = Screen(
             "LEVEL MAP",
             self.font_large,
@@ -519,13 +524,17 @@ class Menu:
                 icon_color = (150, 150, 150)
                 name_color = UI_TEXT_DIM
 
+            if is_unlocked and i == selection:
+                Icon.draw(surface, Icon.RIGHT_ARROW, 170, y, 20, UI_HIGHLIGHT)
+                name_color = WHITE
+
             Icon.draw(surface, icon_type, 200, y, 20, icon_color)
             name_surf = self.font_small.render(level_name, True, name_color)
             surface.blit(name_surf, (250, y))
 
         if unlocked_count > 0:
             inst = self.font_tiny.render(
-                "Level selection coming in Phase 3", True, UI_TEXT_DIM
+                "UP/DOWN to choose a level, ENTER to play it", True, UI_TEXT_DIM
             )
         else:
             inst = self.font_tiny.render(
@@ -651,6 +660,10 @@ class Menu:
         # Update resolution dropdown options and selection
         components['res_dropdown'].options = game_settings.get_resolution_list()
         components['res_dropdown'].selected_index = game_settings.settings['video']['resolution_index']
+        components['scale_dropdown'].options = game_settings.get_scale_mode_list()
+        components['scale_dropdown'].selected_index = SCALE_MODES.index(game_settings.get_scale_mode())
+        components['render_scale_dropdown'].options = game_settings.get_render_scale_list()
+        components['render_scale_dropdown'].selected_index = RENDER_SCALES.index(game_settings.get_render_scale())
 
         # Update toggles
         components['fullscreen_toggle'].enabled = game_settings.get_fullscreen()
@@ -675,6 +688,14 @@ class Menu:
         components['fullscreen_toggle'].check_hover(mouse_pos)
         components['fullscreen_toggle'].draw(surface, self.font_tiny)
 
+        # Scaling mode (how frames are fitted to the window)
+        scale_label = self.font_small.render("Scaling:", True, UI_TEXT)
+        surface.blit(scale_label, (760, 200))
+
+        # Render scale (resolution the world is drawn at before upscaling)
+        render_scale_label = self.font_small.render("Render Scale:", True, UI_TEXT)
+        surface.blit(render_scale_label, (760, 250))
+
         # AUDIO SETTINGS Section
         audio_title = self.font_medium.render("AUDIO", True, UI_HIGHLIGHT)
         surface.blit(audio_title, (150, 320))
@@ -737,7 +758,12 @@ class Menu:
 
         screen.draw_buttons(surface)
 
-        # DRAW DROPDOWN LAST (so it appears on top)
+        # DRAW DROPDOWNS LAST (so they appear on top), upper ones last so
+        # their open lists cover the ones below
+        components['render_scale_dropdown'].check_hover(mouse_pos)
+        components['render_scale_dropdown'].draw(surface, self.font_tiny)
+        components['scale_dropdown'].check_hover(mouse_pos)
+        components['scale_dropdown'].draw(surface, self.font_tiny)
         components['res_dropdown'].check_hover(mouse_pos)
         components['res_dropdown'].draw(surface, self.font_tiny)
 
@@ -11,10 +11,19 @@ import pygame
 class AudioManager:
     """Manages all game audio (music and sound effects)"""
 
-    def __init__(self, settings):
-        """Initialize audio system"""
+    def __init__(self, settings, enabled=True):
+        """
+        Initialize audio system
+        Args:
+            settings: GameSettings instance
+            enabled: False to never open an audio device (headless runs)
+        """
         self.settings = settings
 
+        if not enabled:
+            self.audio_available = False
+            return
+
         # Initialize pygame mixer
         try:
             pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
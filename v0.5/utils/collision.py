@@ -52,3 +52,225 @@ def is_rect_on_screen(rect, camera_x, camera_y, screen_width, screen_height, mar
         screen_height + margin * 2,
     )
     return rect.colliderect(screen_rect)
+
+
+class SpatialHash:
+    """
+    Uniform grid that buckets items by the cells their rectangles overlap.
+    Used for static level geometry so lookups only touch nearby items.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Args:
+            cell_size: Width/height of one grid cell in pixels
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+        self.count = 0
+
+    def _cell_range(self, rect):
+        """Get inclusive cell bounds (x0, y0, x1, y1) covered by rect"""
+        size = self.cell_size
+        return (
+            int(rect.left // size),
+            int(rect.top // size),
+            int((rect.right - 1) // size),
+            int((rect.bottom - 1) // size),
+        )
+
+    def insert(self, item, rect):
+        """Add item covering rect. Items keep their insertion order in queries"""
+        entry = (self.count, item)
+        self.count += 1
+
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.cells.setdefault((cx, cy), []).append(entry)
+
+    def query(self, rect):
+        """
+        Get all items whose cells overlap rect
+        Returns:
+            List of items in insertion order (callers still do exact tests)
+        """
+        x0, y0, x1, y1 = self._cell_range(rect)
+        cells = self.cells
+
+        # Fast path: a single cell needs no de-duplication
+        if x0 == x1 and y0 == y1:
+            return [item for _, item in cells.get((x0, y0), ())]
+
+        found = {}
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                for index, item in cells.get((cx, cy), ()):
+                    found[index] = item
+
+        return [found[index] for index in sorted(found)]
+
+    def clear(self):
+        """Remove all items"""
+        self.cells.clear()
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+
+class SolidityGrid:
+    """
+    Dense occupancy grid over the level in TILE_SIZE cells.
+    Each cell is EMPTY, PARTIAL (some solid geometry touches it) or FULL
+    (the whole cell is solid), stored one byte per cell.
+    """
+
+    EMPTY = 0
+    PARTIAL = 1
+    FULL = 2
+
+    def __init__(self, width, height, cell_size):
+        """
+        Args:
+            width, height: Level size in pixels
+            cell_size: Cell size in pixels (normally TILE_SIZE)
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, -(-int(width) // cell_size))
+        self.rows = max(1, -(-int(height) // cell_size))
+        self.cells = bytearray(self.cols * self.rows)
+
+        # Geometry outside the grid can't be represented, so cells out of
+        # range report PARTIAL once any exists and callers do exact tests
+        self.outside_state = self.EMPTY
+
+    def mark(self, rect):
+        """Mark the cells covered by a solid rectangle"""
+        size = self.cell_size
+        x0 = rect.left // size
+        y0 = rect.top // size
+        x1 = (rect.right - 1) // size
+        y1 = (rect.bottom - 1) // size
+
+        if x0 < 0 or y0 < 0 or x1 >= self.cols or y1 >= self.rows:
+            self.outside_state = self.PARTIAL
+
+        for cy in range(max(0, y0), min(self.rows - 1, y1) + 1):
+            row = cy * self.cols
+            top = cy * size
+            full_y = rect.top <= top and rect.bottom >= top + size
+            for cx in range(max(0, x0), min(self.cols - 1, x1) + 1):
+                left = cx * size
+                if full_y and rect.left <= left and rect.right >= left + size:
+                    self.cells[row + cx] = self.FULL
+                elif self.cells[row + cx] == self.EMPTY:
+                    self.cells[row + cx] = self.PARTIAL
+
+    def get(self, cx, cy):
+        """Get the state of one cell"""
+        if 0 <= cx < self.cols and 0 <= cy < self.rows:
+            return self.cells[cy * self.cols + cx]
+        return self.outside_state
+
+    def max_state(self, rect):
+        """Get the highest cell state under a rectangle"""
+        size = self.cell_size
+        x0 = int(rect.left // size)
+        y0 = int(rect.top // size)
+        x1 = int((rect.right - 1) // size)
+        y1 = int((rect.bottom - 1) // size)
+        if x1 < x0 or y1 < y0:
+            return self.EMPTY
+
+        state = self.EMPTY
+        if x0 < 0 or y0 < 0 or x1 >= self.cols or y1 >= self.rows:
+            state = self.outside_state
+            x0, y0 = max(0, x0), max(0, y0)
+            x1, y1 = min(self.cols - 1, x1), min(self.rows - 1, y1)
+
+        cells = self.cells
+        cols = self.cols
+        for cy in range(y0, y1 + 1):
+            start = cy * cols
+            if x0 <= x1:
+                state = max(state, max(cells[start + x0 : start + x1 + 1]))
+                if state == self.FULL:
+                    break
+        return state
+
+
+class BroadPhase:
+    """
+    Per-frame broad-phase for moving entities.
+    Entities are registered in named groups (enemies, projectiles, ...)
+    after they move; queries return candidates that share a grid cell,
+    which callers confirm with an exact rect test.
+    """
+
+    def __init__(self, cell_size):
+        """
+        Args:
+            cell_size: Grid cell size in pixels
+        """
+        self.cell_size = cell_size
+        self.groups = {}
+
+    def clear(self):
+        """Forget all groups (call once per frame)"""
+        self.groups.clear()
+
+    def set_group(self, name, items, rect_of=None):
+        """
+        (Re)register a group from entities exposing get_rect()
+        Args:
+            name: Group name
+            items: Iterable of entities
+            rect_of: Optional function giving the rect to index each item by
+        """
+        if name in self.groups:
+            members, grid = self.groups[name]
+            members.clear()
+            grid.clear()
+        else:
+            members, grid = [], SpatialHash(self.cell_size)
+            self.groups[name] = (members, grid)
+
+        for item in items:
+            members.append(item)
+            grid.insert(item, rect_of(item) if rect_of else item.get_rect())
+
+    def add(self, name, item, rect=None):
+        """
+        Register one more entity in a group, after its current members
+        Args:
+            name: Group name
+            item: Entity exposing get_rect()
+            rect: Optional rect to index it by instead of get_rect()
+        """
+        if name not in self.groups:
+            self.set_group(name, [])
+        members, grid = self.groups[name]
+        members.append(item)
+        grid.insert(item, rect if rect is not None else item.get_rect())
+
+    def query(self, name, rect):
+        """Get group members that may overlap rect, in registration order"""
+        if name not in self.groups:
+            return []
+        return self.groups[name][1].query(rect)
+
+    def candidate_pairs(self, name_a, name_b):
+        """
+        Get (a, b) pairs from two groups that share a grid cell
+        Returns:
+            List of (a, b) tuples ordered by a, then by b's registration
+        """
+        if name_a not in self.groups:
+            return []
+
+        pairs = []
+        for a in self.groups[name_a][0]:
+            for b in self.query(name_b, a.get_rect()):
+                pairs.append((a, b))
+        return pairs
@@ -0,0 +1,144 @@
+"""
+Frame profiler - hierarchical per-section timings kept for the last few seconds
+"""
+
+import functools
+import json
+import os
+import time
+from collections import deque
+
+from config.settings import PROFILER_ENABLED, PROFILER_HISTORY_FRAMES
+
+
+class FrameProfiler:
+    """
+    Times named sections of each frame. Sections nest, so a section begun
+    inside "update" is recorded as "update/<name>". A section entered
+    several times in one frame (e.g. several fixed steps) is summed.
+
+    Costs two perf_counter calls and a dict update per section, so it can
+    stay on in release builds.
+    """
+
+    def __init__(self, history_frames=PROFILER_HISTORY_FRAMES, enabled=PROFILER_ENABLED):
+        """
+        Args:
+            history_frames: How many frames of timings to keep
+            enabled: Record timings (sections are no-ops when False)
+        """
+        self.enabled = enabled
+        self.frames = deque(maxlen=history_frames)  # (start, frame_ms, {path: ms})
+        self.current = {}
+        self._frame_start = time.perf_counter()
+        self._paths = []
+        self._starts = []
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        self.current = {}
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Finish the frame and add it to the history"""
+        if not self.enabled:
+            return
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000
+        self.frames.append((self._frame_start, frame_ms, self.current))
+
+    def begin(self, name):
+        """Start a section, nested under the currently open one"""
+        paths = self._paths
+        paths.append(f"{paths[-1]}/{name}" if paths else name)
+        self._starts.append(time.perf_counter())
+
+    def end(self):
+        """End the most recently begun section"""
+        elapsed = (time.perf_counter() - self._starts.pop()) * 1000
+        path = self._paths.pop()
+        current = self.current
+        current[path] = current.get(path, 0.0) + elapsed
+
+    def get_averages(self, frame_count=60):
+        """
+        Get average ms per frame for each section over recent frames
+        Returns:
+            List of (path, avg_ms) sorted by path, so children follow parents
+        """
+        recent = list(self.frames)[-frame_count:]
+        if not recent:
+            return []
+
+        totals = {}
+        for _, _, sections in recent:
+            for path, ms in sections.items():
+                totals[path] = totals.get(path, 0.0) + ms
+
+        return [(path, totals[path] / len(recent)) for path in sorted(totals)]
+
+    def get_frame_times(self, frame_count=None):
+        """Get total ms of recent frames, oldest first"""
+        times = [frame_ms for _, frame_ms, _ in self.frames]
+        return times[-frame_count:] if frame_count else times
+
+    def dump(self, path, seconds):
+        """
+        Write the last N seconds of frames to a JSON file
+        Args:
+            path: Output file path
+            seconds: How much history to include
+        Returns:
+            Number of frames written
+        """
+        if not self.frames:
+            return 0
+
+        newest = self.frames[-1][0]
+        frames = [
+            {
+                "t": round(start - newest, 4),
+                "frame_ms": round(frame_ms, 4),
+                "sections": {name: round(ms, 4) for name, ms in sections.items()},
+            }
+            for start, frame_ms, sections in self.frames
+            if newest - start <= seconds
+        ]
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "seconds": seconds,
+                    "frames": frames,
+                    "averages": dict(self.get_averages(len(frames))),
+                },
+                f,
+                indent=1,
+            )
+        return len(frames)
+
+
+def profiled(name):
+    """
+    Method decorator that times the call as a section of self.profiler
+    Args:
+        name: Section name (nested under whatever section is open)
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if not profiler.enabled:
+                return method(self, *args, **kwargs)
+            profiler.begin(name)
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                profiler.end()
+
+        return wrapper
+
+    return decorator
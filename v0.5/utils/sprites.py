@@ -0,0 +1,72 @@
+"""
+Sprite baking - animation frames rendered once into converted surfaces
+"""
+
+import pygame
+
+from utils.textures import COLORKEY
+
+
+class SpriteCache:
+    """
+    Baked animation frames of game objects. Each look (a coin value, an
+    enemy type at one size, a portal color...) is keyed by the caller and
+    rendered on first use by a frame callback, so draw methods only blit
+    the frame for their current animation phase.
+    """
+
+    # Lists of baked frames keyed by look
+    _frames = {}
+
+    @classmethod
+    def get_frames(cls, key, size, frame_count, draw_frame, transparent=True):
+        """
+        Get all frames of a look, baking them on first use
+        Args:
+            key: Hashable look key (include everything draw_frame depends on)
+            size: (width, height) of every frame
+            frame_count: Number of animation frames
+            draw_frame: Callback draw_frame(surface, index) painting frame index
+            transparent: Colorkey unpainted pixels (False for fully opaque looks)
+        Returns:
+            List of pygame.Surface, one per frame
+        """
+        frames = cls._frames.get(key)
+        if frames is None:
+            frames = [
+                cls._bake(size, draw_frame, index, transparent)
+                for index in range(frame_count)
+            ]
+            cls._frames[key] = frames
+        return frames
+
+    @classmethod
+    def get_sprite(cls, key, size, draw_sprite, transparent=True):
+        """
+        Get a still look, baking it on first use
+        Args:
+            draw_sprite: Callback draw_sprite(surface) painting the look
+            (other args as get_frames)
+        """
+        return cls.get_frames(
+            key, size, 1, lambda surface, index: draw_sprite(surface), transparent
+        )[0]
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all baked frames"""
+        cls._frames.clear()
+
+    @staticmethod
+    def _bake(size, draw_frame, index, transparent):
+        """Render one frame into a surface converted for fast blits"""
+        surface = pygame.Surface(size)
+        if transparent:
+            surface.fill(COLORKEY)
+        draw_frame(surface, index)
+
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        if transparent:
+            surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return surface
@@ -1,11 +1,29 @@
 import math
+import random
 
 import pygame
 
+from config.settings import WHITE
+
+# Fill of transparent pixels in baked (colorkeyed) surfaces
+COLORKEY = (255, 0, 255)
+
 
 class TextureManager:
     """Creates patterns and textures for game objects"""
 
+    # Tile pattern per level theme (anything else is checkered)
+    TILE_PATTERNS = {
+        "SCIFI": "grid",
+        "NATURE": "diagonal",
+        "SPACE": "dotted",
+        "UNDERGROUND": "brick",
+        "UNDERWATER": "striped",
+    }
+
+    # Baked tile textures keyed by (theme, color, pattern, size, colorblind_mode)
+    _tile_cache = {}
+
     @staticmethod
     def draw_striped_rect(
         surface,
@@ -68,8 +86,12 @@ class TextureManager:
                 pygame.draw.circle(surface, dot_color, (x, y), dot_size)
 
     @staticmethod
-    def draw_brick_wall(surface, rect, mortar_color, brick_color):
+    def draw_brick_wall(surface, rect, mortar_color, brick_color, colorblind_mode=True):
         """Draw brick wall pattern"""
+        if not colorblind_mode:
+            pygame.draw.rect(surface, brick_color, rect)
+            return
+
         brick_height = 16
         brick_width = 32
         mortar_width = 2
@@ -140,198 +162,422 @@ class TextureManager:
         for y in range(rect.top, rect.bottom, grid_size):
             pygame.draw.line(surface, grid_color, (rect.left, y), (rect.right, y), 1)
 
+    @staticmethod
+    def draw_tile_pattern(surface, rect, theme, color, colorblind_mode=False):
+        """
+        Draw one level tile cell with its theme's pattern and a border
+        Args:
+            surface: Surface to draw on
+            rect: Cell rectangle
+            theme: Level theme name
+            color: Tile base color
+            colorblind_mode: Draw the pattern (otherwise mostly solid color)
+        """
+        pattern = TextureManager.TILE_PATTERNS.get(theme, "checkered")
+
+        # Different pattern per theme for easy identification
+        if pattern == "grid":
+            TextureManager.draw_grid_rect(
+                surface, rect, color, (200, 200, 200), grid_size=8, colorblind_mode=colorblind_mode
+            )
+        elif pattern == "diagonal":
+            TextureManager.draw_diagonal_lines(
+                surface, rect, color, (150, 200, 150), spacing=6, colorblind_mode=colorblind_mode
+            )
+        elif pattern == "dotted":
+            TextureManager.draw_dotted_rect(
+                surface, rect, color, (150, 150, 200), dot_size=2, spacing=8, colorblind_mode=colorblind_mode
+            )
+        elif pattern == "brick":
+            TextureManager.draw_brick_wall(
+                surface, rect, (80, 60, 40), color, colorblind_mode=colorblind_mode
+            )
+        elif pattern == "striped":
+            # Horizontal waves for underwater
+            TextureManager.draw_striped_rect(
+                surface,
+                rect,
+                color,
+                (100, 150, 200),
+                stripe_width=4,
+                vertical=False,
+                colorblind_mode=colorblind_mode,
+            )
+        else:
+            TextureManager.draw_checkered_rect(
+                surface, rect, color, (120, 120, 120), check_size=8, colorblind_mode=colorblind_mode
+            )
+
+        # Border
+        pygame.draw.rect(surface, WHITE, rect, 1)
+
+    @classmethod
+    def get_tile_texture(cls, theme, color, size, colorblind_mode=False):
+        """
+        Get a tile cell texture, baking it on first use so later frames
+        only blit instead of issuing the pattern's draw calls again
+        Args:
+            theme: Level theme name
+            color: Tile base color
+            size: Cell width/height in pixels
+            colorblind_mode: Whether the pattern is drawn
+        Returns:
+            pygame.Surface of size x size
+        """
+        color = tuple(color)
+        key = (theme, color, cls.TILE_PATTERNS.get(theme, "checkered"), size, colorblind_mode)
+        texture = cls._tile_cache.get(key)
+        if texture is None:
+            texture = pygame.Surface((size, size))
+            cls.draw_tile_pattern(texture, texture.get_rect(), theme, color, colorblind_mode)
+            if pygame.display.get_surface():
+                texture = texture.convert()
+            cls._tile_cache[key] = texture
+        return texture
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all baked textures (e.g. after colorblind mode changes)"""
+        cls._tile_cache.clear()
+
+
+class BackgroundLayer:
+    """
+    One parallax layer baked into a tileable surface. Drawing repeats the
+    surface across the screen at the layer's scroll offset, so a layer
+    costs a few blits however much detail was drawn into it.
+    """
+
+    def __init__(self, surface, get_offset, wrap_y=True, y=0):
+        """
+        Args:
+            surface: Colorkeyed image that repeats every width/height pixels
+            get_offset: Function (camera_x, camera_y, ticks) -> (ox, oy), how
+                far the layer has scrolled left/up
+            wrap_y: Repeat vertically (otherwise drawn once at y)
+            y: Screen y of a layer that doesn't wrap vertically
+        """
+        self.surface = surface
+        self.get_offset = get_offset
+        self.wrap_y = wrap_y
+        self.y = y
+
+    def draw(self, target, camera_x, camera_y, ticks, screen_width, screen_height):
+        """Blit the layer at its scroll offset, wrapping at its edges"""
+        offset_x, offset_y = self.get_offset(camera_x, camera_y, ticks)
+        width, height = self.surface.get_size()
+
+        xs = range(-(int(offset_x) % width), screen_width, width)
+        if self.wrap_y:
+            ys = range(-(int(offset_y) % height), screen_height, height)
+        else:
+            ys = (self.y,)
+
+        target.blits(
+            [(self.surface, (x, y)) for y in ys for x in xs], doreturn=False
+        )
+
+
+class RowWaveLayer:
+    """
+    Rows of a baked strip, each shifted sideways by a sine of its screen
+    y and time (underwater caustics). One blit per row
+    """
+
+    def __init__(self, strip, anchor, spacing, get_offset):
+        """
+        Args:
+            strip: Colorkeyed image of one row, first item centered at anchor
+            anchor: (x, y) in the strip of the first item's center
+            spacing: Distance between rows and between items in a row
+            get_offset: Function (camera_x, camera_y, ticks) -> (ox, oy)
+        """
+        self.strip = strip
+        self.anchor = anchor
+        self.spacing = spacing
+        self.get_offset = get_offset
+
+    def draw(self, target, camera_x, camera_y, ticks, screen_width, screen_height):
+        """Blit one strip per row"""
+        offset_x, offset_y = self.get_offset(camera_x, camera_y, ticks)
+        spacing = self.spacing
+        anchor_x, anchor_y = self.anchor
+
+        blits = []
+        for y in range(-spacing, screen_height + spacing, spacing):
+            row_y = y - int(offset_y) % spacing
+            wave_x = int(math.sin((row_y + ticks / 500) / 20) * 30)
+            left = -spacing - int(offset_x) % spacing + wave_x
+            blits.append((self.strip, (left - anchor_x, row_y - anchor_y)))
+        target.blits(blits, doreturn=False)
+
 
 class BackgroundManager:
-    """Manages themed backgrounds with parallax scrolling"""
+    """
+    Manages themed backgrounds with parallax scrolling. Each theme's
+    layers are baked once per resolution, then composited every frame
+    """
+
+    # Base fill per theme (anything else gets the SCIFI color and no layers)
+    BASE_COLORS = {
+        "SCIFI": (20, 20, 40),
+        "NATURE": (40, 60, 40),
+        "SPACE": (10, 10, 20),
+        "UNDERGROUND": (30, 20, 15),
+        "UNDERWATER": (15, 30, 50),
+    }
+
+    # Baked layers keyed by (theme, screen_width, screen_height)
+    _layer_cache = {}
+
+    @classmethod
+    def draw_background(cls, surface, theme, camera_x, camera_y, screen_width, screen_height):
+        """
+        Draw a themed parallax background
+        Args:
+            surface: Surface to draw on
+            theme: Level theme name
+            camera_x, camera_y: Camera offset
+            screen_width, screen_height: Size of the area to fill
+        """
+        surface.fill(cls.BASE_COLORS.get(theme, cls.BASE_COLORS["SCIFI"]))
+
+        ticks = pygame.time.get_ticks()
+        for layer in cls.get_layers(theme, screen_width, screen_height):
+            layer.draw(surface, camera_x, camera_y, ticks, screen_width, screen_height)
+
+    @classmethod
+    def get_layers(cls, theme, screen_width, screen_height):
+        """Get a theme's layers for a resolution, baking them on first use"""
+        key = (theme, screen_width, screen_height)
+        layers = cls._layer_cache.get(key)
+        if layers is None:
+            bake = {
+                "SCIFI": cls._bake_scifi_layers,
+                "NATURE": cls._bake_nature_layers,
+                "SPACE": cls._bake_space_layers,
+                "UNDERGROUND": cls._bake_underground_layers,
+                "UNDERWATER": cls._bake_underwater_layers,
+            }.get(theme)
+            layers = bake(screen_width, screen_height) if bake else []
+            cls._layer_cache[key] = layers
+        return layers
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all baked layers"""
+        cls._layer_cache.clear()
 
     @staticmethod
-    def draw_scifi_background(surface, camera_x, camera_y, screen_width, screen_height):
-        """Sci-fi tech background with grid and circuit lines"""
-        # Base color
-        surface.fill((20, 20, 40))
+    def _new_layer_surface(width, height):
+        """Create a transparent (colorkeyed) surface to bake a layer into"""
+        surface = pygame.Surface((width, height))
+        surface.fill(COLORKEY)
+        surface.set_colorkey(COLORKEY)
+        return surface
+
+    @staticmethod
+    def _finish_layer_surface(surface):
+        """Convert a baked surface for fast blits"""
+        if pygame.display.get_surface():
+            surface = surface.convert()
+        surface.set_colorkey(COLORKEY, pygame.RLEACCEL)
+        return surface
+
+    @staticmethod
+    def _tiled_size(period, screen_size):
+        """Smallest multiple of period that covers the screen"""
+        return period * max(1, -(-screen_size // period))
 
+    @staticmethod
+    def _wrapped(x, y, width, height):
+        """Positions to draw a shape at so it wraps across a tile's edges"""
+        return [
+            (x + dx * width, y + dy * height) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+        ]
+
+    @classmethod
+    def _bake_scattered_dots(cls, width, height, seed, count, color, sizes=None, width_arg=0, keep=None):
+        """
+        Bake randomly scattered circles into a screen-sized tile
+        Args:
+            width, height: Tile size (positions wrap at it)
+            seed: Seed for the dot positions
+            count: Number of dots
+            color: Dot color
+            sizes: Radii picked at random per dot (None: radius 2, no pick)
+            width_arg: Circle line width (0 = filled)
+            keep: Optional function (x, y) -> bool deciding which dots to draw
+        """
+        surface = cls._new_layer_surface(width, height)
+        rng = random.Random(seed)
+        for _ in range(count):
+            x = rng.randint(0, width)
+            y = rng.randint(0, height)
+            radius = rng.choice(sizes) if sizes else 2
+            if keep and not keep(x, y):
+                continue
+            for pos in cls._wrapped(x % width, y % height, width, height):
+                pygame.draw.circle(surface, color, pos, radius, width_arg)
+        return cls._finish_layer_surface(surface)
+
+    @classmethod
+    def _bake_scifi_layers(cls, screen_width, screen_height):
+        """Sci-fi tech background with grid and circuit lines"""
         # Layer 1: Large grid (far background, slow parallax)
-        grid_offset_x = (camera_x // 4) % 64
-        grid_offset_y = (camera_y // 4) % 64
-
-        for x in range(-64, screen_width + 64, 64):
-            for y in range(-64, screen_height + 64, 64):
-                adj_x = x - grid_offset_x
-                adj_y = y - grid_offset_y
-                # Vertical line
-                pygame.draw.line(
-                    surface, (40, 40, 80), (adj_x, 0), (adj_x, screen_height), 1
-                )
-                # Horizontal line
-                pygame.draw.line(
-                    surface, (40, 40, 80), (0, adj_y), (screen_width, adj_y), 1
-                )
+        width = cls._tiled_size(64, screen_width)
+        height = cls._tiled_size(64, screen_height)
+        grid = cls._new_layer_surface(width, height)
+        for x in range(0, width, 64):
+            pygame.draw.line(grid, (40, 40, 80), (x, 0), (x, height), 1)
+        for y in range(0, height, 64):
+            pygame.draw.line(grid, (40, 40, 80), (0, y), (width, y), 1)
 
         # Layer 2: Circuit board nodes (medium parallax)
-        node_offset_x = (camera_x // 2) % 128
-        node_offset_y = (camera_y // 2) % 128
-
-        for x in range(-128, screen_width + 128, 128):
-            for y in range(-128, screen_height + 128, 128):
-                adj_x = x - node_offset_x
-                adj_y = y - node_offset_y
+        width = cls._tiled_size(128, screen_width)
+        height = cls._tiled_size(128, screen_height)
+        nodes = cls._new_layer_surface(width, height)
+        for x in range(0, width + 1, 128):
+            for y in range(0, height + 1, 128):
                 # Small tech circles
-                pygame.draw.circle(surface, (60, 60, 120), (adj_x, adj_y), 4, 1)
-                pygame.draw.circle(surface, (40, 40, 80), (adj_x, adj_y), 8, 1)
-
-    @staticmethod
-    def draw_nature_background(
-        surface, camera_x, camera_y, screen_width, screen_height
-    ):
+                pygame.draw.circle(nodes, (60, 60, 120), (x, y), 4, 1)
+                pygame.draw.circle(nodes, (40, 40, 80), (x, y), 8, 1)
+
+        return [
+            BackgroundLayer(
+                cls._finish_layer_surface(grid),
+                lambda cx, cy, t: (cx // 4, cy // 4),
+            ),
+            BackgroundLayer(
+                cls._finish_layer_surface(nodes),
+                lambda cx, cy, t: (cx // 2, cy // 2),
+            ),
+        ]
+
+    @classmethod
+    def _bake_nature_layers(cls, screen_width, screen_height):
         """Nature background with tree silhouettes and leaves"""
-        # Base color
-        surface.fill((40, 60, 40))
-
-        # Layer 1: Mountain silhouettes (very slow parallax)
-        mountain_offset = (camera_x // 8) % screen_width
+        # Layer 1: Mountain silhouettes (very slow parallax), along the bottom
+        mountains = cls._new_layer_surface(screen_width, 120)
         for i in range(3):
-            x_offset = -mountain_offset + (i * screen_width // 3)
-            # Triangle mountains
-            points = [
-                (x_offset, screen_height),
-                (x_offset + 150, screen_height - 120),
-                (x_offset + 300, screen_height),
-            ]
-            pygame.draw.polygon(surface, (30, 50, 30), points)
+            x = i * screen_width // 3
+            for shift in (-screen_width, 0):
+                # Triangle mountains
+                points = [(x + shift, 120), (x + shift + 150, 0), (x + shift + 300, 120)]
+                pygame.draw.polygon(mountains, (30, 50, 30), points)
 
         # Layer 2: Diagonal texture (medium parallax)
-        line_offset_x = (camera_x // 3) % 32
-        for x in range(-100, screen_width + 100, 32):
-            adj_x = x - line_offset_x
+        width = cls._tiled_size(32, screen_width)
+        lines = cls._new_layer_surface(width, screen_height)
+        for x in range(-screen_height - 32, width + 32, 32):
             pygame.draw.line(
-                surface,
-                (50, 70, 50),
-                (adj_x, 0),
-                (adj_x + screen_height, screen_height),
-                1,
+                lines, (50, 70, 50), (x, 0), (x + screen_height, screen_height), 1
             )
 
         # Layer 3: Leaf dots (fast parallax)
-        leaf_offset_x = (camera_x // 2) % 80
-        leaf_offset_y = (camera_y // 2) % 80
-
-        import random
-
-        random.seed(42)  # Consistent pattern
-        for _ in range(50):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            adj_x = (x - leaf_offset_x) % screen_width
-            adj_y = (y - leaf_offset_y) % screen_height
-            # Small leaf dots
-            pygame.draw.circle(surface, (60, 80, 60), (adj_x, adj_y), 2)
-
-    @staticmethod
-    def draw_space_background(surface, camera_x, camera_y, screen_width, screen_height):
+        leaves = cls._bake_scattered_dots(
+            screen_width, screen_height, seed=42, count=50, color=(60, 80, 60)
+        )
+
+        return [
+            BackgroundLayer(
+                cls._finish_layer_surface(mountains),
+                lambda cx, cy, t: (cx // 8, 0),
+                wrap_y=False,
+                y=screen_height - 120,
+            ),
+            BackgroundLayer(
+                cls._finish_layer_surface(lines),
+                lambda cx, cy, t: (cx // 3, 0),
+                wrap_y=False,
+            ),
+            BackgroundLayer(leaves, lambda cx, cy, t: (cx // 2, cy // 2)),
+        ]
+
+    @classmethod
+    def _bake_space_layers(cls, screen_width, screen_height):
         """Space background with stars and nebula effect"""
-        # Base color
-        surface.fill((10, 10, 20))
-
         # Layer 1: Nebula clouds (very slow parallax)
-        cloud_offset_x = (camera_x // 10) % 200
-        cloud_offset_y = (camera_y // 10) % 200
-
+        nebula = cls._new_layer_surface(screen_width, screen_height)
         for i in range(5):
-            x = (i * 250 - cloud_offset_x) % screen_width
-            y = (i * 150 - cloud_offset_y) % screen_height
-            # Draw nebula blob
-            pygame.draw.circle(surface, (30, 20, 50), (x, y), 80)
-            pygame.draw.circle(surface, (20, 15, 35), (x + 20, y + 20), 60)
+            x = (i * 250) % screen_width
+            y = (i * 150) % screen_height
+            for wx, wy in cls._wrapped(x, y, screen_width, screen_height):
+                # Draw nebula blob
+                pygame.draw.circle(nebula, (30, 20, 50), (wx, wy), 80)
+                pygame.draw.circle(nebula, (20, 15, 35), (wx + 20, wy + 20), 60)
 
         # Layer 2: Medium stars (medium parallax)
-        star_offset_x = (camera_x // 3) % screen_width
-        star_offset_y = (camera_y // 3) % screen_height
-
-        import random
-
-        random.seed(123)
-        for _ in range(100):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            adj_x = (x - star_offset_x) % screen_width
-            adj_y = (y - star_offset_y) % screen_height
-            size = random.choice([1, 2, 3])
-            pygame.draw.circle(surface, (200, 200, 255), (adj_x, adj_y), size)
-
-        # Layer 3: Close stars (fast parallax)
-        close_star_offset_x = (camera_x // 2) % screen_width
-        close_star_offset_y = (camera_y // 2) % screen_height
-
-        random.seed(456)
-        for _ in range(50):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            adj_x = (x - close_star_offset_x) % screen_width
-            adj_y = (y - close_star_offset_y) % screen_height
-            # Twinkling effect based on position
-            if ((adj_x + adj_y) // 50) % 2 == 0:
-                pygame.draw.circle(surface, WHITE, (adj_x, adj_y), 2)
-
-    @staticmethod
-    def draw_underground_background(
-        surface, camera_x, camera_y, screen_width, screen_height
-    ):
+        stars = cls._bake_scattered_dots(
+            screen_width, screen_height, seed=123, count=100,
+            color=(200, 200, 255), sizes=[1, 2, 3],
+        )
+
+        # Layer 3: Close stars (fast parallax), every other diagonal band lit
+        close_stars = cls._bake_scattered_dots(
+            screen_width, screen_height, seed=456, count=50, color=WHITE,
+            keep=lambda x, y: ((x + y) // 50) % 2 == 0,
+        )
+
+        return [
+            BackgroundLayer(
+                cls._finish_layer_surface(nebula),
+                lambda cx, cy, t: (cx // 10, cy // 10),
+            ),
+            BackgroundLayer(stars, lambda cx, cy, t: (cx // 3, cy // 3)),
+            BackgroundLayer(close_stars, lambda cx, cy, t: (cx // 2, cy // 2)),
+        ]
+
+    @classmethod
+    def _bake_underground_layers(cls, screen_width, screen_height):
         """Underground cave background with rock texture"""
-        # Base color
-        surface.fill((30, 20, 15))
-
-        # Layer 1: Rock strata lines (slow parallax)
-        strata_offset = (camera_y // 5) % 40
-
-        for y in range(-40, screen_height + 40, 40):
-            adj_y = y - strata_offset
+        # Layer 1: Rock strata lines (slow parallax). The wave repeats every
+        # 2*pi*50 pixels, so the tile is a whole number of waves wide
+        wavelength = 2 * math.pi * 50
+        width = round(wavelength * max(1, math.ceil(screen_width / wavelength)))
+        height = cls._tiled_size(40, screen_height)
+        strata = cls._new_layer_surface(width, height)
+        for y in range(-40, height + 40, 40):
             # Wavy horizontal lines
-            points = []
-            for x in range(0, screen_width + 20, 20):
-                import math
-
-                wave = math.sin((x + camera_x // 3) / 50) * 10
-                points.append((x, adj_y + wave))
-            if len(points) > 1:
-                pygame.draw.lines(surface, (50, 35, 25), False, points, 2)
+            points = [
+                (x, y + math.sin(x / 50) * 10) for x in range(-20, width + 40, 20)
+            ]
+            pygame.draw.lines(strata, (50, 35, 25), False, points, 2)
 
         # Layer 2: Rock dots (medium parallax)
-        rock_offset_x = (camera_x // 3) % 60
-        rock_offset_y = (camera_y // 3) % 60
-
-        import random
-
-        random.seed(789)
-        for _ in range(80):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            adj_x = (x - rock_offset_x) % screen_width
-            adj_y = (y - rock_offset_y) % screen_height
-            size = random.choice([2, 3, 4])
-            pygame.draw.circle(surface, (60, 45, 35), (adj_x, adj_y), size)
-
-        # Layer 3: Stalactite shadows (fast parallax)
-        stalactite_offset = (camera_x // 2) % 150
-
-        for x in range(-150, screen_width + 150, 150):
-            adj_x = x - stalactite_offset
+        rocks = cls._bake_scattered_dots(
+            screen_width, screen_height, seed=789, count=80,
+            color=(60, 45, 35), sizes=[2, 3, 4],
+        )
+
+        # Layer 3: Stalactite shadows (fast parallax), along the top
+        width = cls._tiled_size(150, screen_width)
+        stalactites = cls._new_layer_surface(width, 60)
+        for x in range(0, width + 1, 150):
             # Triangle pointing down
-            points = [(adj_x, 0), (adj_x - 20, 60), (adj_x + 20, 60)]
-            pygame.draw.polygon(surface, (25, 18, 13), points)
-
-    @staticmethod
-    def draw_underwater_background(
-        surface, camera_x, camera_y, screen_width, screen_height
-    ):
+            points = [(x, 0), (x - 20, 60), (x + 20, 60)]
+            pygame.draw.polygon(stalactites, (25, 18, 13), points)
+
+        return [
+            BackgroundLayer(
+                cls._finish_layer_surface(strata),
+                lambda cx, cy, t: (cx // 3, cy // 5),
+            ),
+            BackgroundLayer(rocks, lambda cx, cy, t: (cx // 3, cy // 3)),
+            BackgroundLayer(
+                cls._finish_layer_surface(stalactites),
+                lambda cx, cy, t: (cx // 2, 0),
+                wrap_y=False,
+            ),
+        ]
+
+    @classmethod
+    def _bake_underwater_layers(cls, screen_width, screen_height):
         """Underwater background with caustic light patterns"""
-        # Base color
-        surface.fill((15, 30, 50))
-
         # Layer 1: Light rays from surface (very slow parallax)
-        ray_offset = (camera_x // 8) % 200
-
-        for i in range(5):
-            x = i * 250 - ray_offset
+        width = cls._tiled_size(250, screen_width)
+        rays = cls._new_layer_surface(width, screen_height)
+        for x in range(-250, width + 1, 250):
             # Light ray
             points = [
                 (x, 0),
@@ -339,37 +585,31 @@ class BackgroundManager:
                 (x + 50, screen_height),
                 (x + 20, 0),
             ]
-            pygame.draw.polygon(surface, (25, 45, 70), points)
-
-        # Layer 2: Caustic patterns (medium parallax)
-        import math
-
-        caustic_offset_x = (camera_x // 3) % 100
-        caustic_offset_y = ((camera_y // 3) + pygame.time.get_ticks() // 50) % 100
-
-        for x in range(-100, screen_width + 100, 100):
-            for y in range(-100, screen_height + 100, 100):
-                adj_x = x - caustic_offset_x
-                adj_y = y - caustic_offset_y
-                # Wavy caustic lines
-                wave_x = math.sin((adj_y + pygame.time.get_ticks() / 500) / 20) * 30
-                pygame.draw.circle(
-                    surface, (30, 50, 80), (adj_x + int(wave_x), adj_y), 25, 1
-                )
-
-        # Layer 3: Bubbles (fast parallax)
-        bubble_offset_x = (camera_x // 2) % screen_width
-        bubble_offset_y = (
-            (camera_y // 2) - pygame.time.get_ticks() // 20
-        ) % screen_height
-
-        import random
-
-        random.seed(101112)
-        for _ in range(30):
-            x = random.randint(0, screen_width)
-            y = random.randint(0, screen_height)
-            adj_x = (x - bubble_offset_x) % screen_width
-            adj_y = (y + bubble_offset_y) % screen_height  # Bubbles rise
-            size = random.choice([3, 4, 5])
-            pygame.draw.circle(surface, (50, 80, 120), (adj_x, adj_y), size, 1)
+            pygame.draw.polygon(rays, (25, 45, 70), points)
+
+        # Layer 2: Caustic patterns (medium parallax), one strip per row
+        count = len(range(-100, screen_width + 100, 100))
+        caustics = cls._new_layer_surface((count - 1) * 100 + 52, 52)
+        for i in range(count):
+            pygame.draw.circle(caustics, (30, 50, 80), (26 + i * 100, 26), 25, 1)
+
+        # Layer 3: Bubbles (fast parallax) drifting up over time
+        bubbles = cls._bake_scattered_dots(
+            screen_width, screen_height, seed=101112, count=30,
+            color=(50, 80, 120), sizes=[3, 4, 5], width_arg=1,
+        )
+
+        return [
+            BackgroundLayer(
+                cls._finish_layer_surface(rays),
+                lambda cx, cy, t: (cx // 8, 0),
+                wrap_y=False,
+            ),
+            RowWaveLayer(
+                cls._finish_layer_surface(caustics),
+                (26, 26),
+                100,
+                lambda cx, cy, t: (cx // 3, cy // 3 + t // 50),
+            ),
+            BackgroundLayer(bubbles, lambda cx, cy, t: (cx // 2, t // 20 - cy // 2)),
+        ]